@@ -0,0 +1,128 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+from logger import get_logger
+
+logger = get_logger("browser_pool")
+
+class BrowserPool:
+    """미리 띄워 둔 브라우저를 앱이 켜져 있는 동안 유지하고 실행마다 새 컨텍스트를 내주는 관리자
+
+    Playwright 동기 API 객체는 만든 스레드에서만 쓸 수 있으므로 전용 스레드 하나가
+    드라이버/브라우저를 소유하고, 작업(job)을 큐로 받아 그 스레드에서 실행한다.
+    작업이 끝나면 다음 실행용 컨텍스트를 미리 만들어 둔다.
+    """
+
+    def __init__(self, launch_mode='headed'):
+        self.launch_mode = launch_mode
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._playwright = None
+        self._browser = None
+        self._browser_mode = None
+        self._spare = None
+
+    def start(self, launch_mode=None):
+        """관리 스레드 시작 후 브라우저 미리 실행"""
+        if launch_mode:
+            self.launch_mode = launch_mode
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="BrowserPool", daemon=True)
+            self._thread.start()
+        self._jobs.put(('warm', self.launch_mode, None, None))
+
+    def submit(self, job, launch_mode=None):
+        """job(playwright, browser, context, page)을 관리 스레드에서 실행, Future 반환"""
+        if self._thread is None or not self._thread.is_alive():
+            self.start(launch_mode)
+        future = Future()
+        self._jobs.put(('job', launch_mode or self.launch_mode, job, future))
+        return future
+
+    def shutdown(self, timeout=3):
+        self._jobs.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                break
+            kind, launch_mode, job, future = item
+            if kind == 'warm':
+                try:
+                    self._prepare_spare(launch_mode)
+                except Exception as e:
+                    logger.warning("브라우저 미리 실행 실패: %s", e)
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                context, page = self._take_context(launch_mode)
+                try:
+                    result = job(self._playwright, self._browser, context, page)
+                finally:
+                    try:
+                        context.close()
+                    except Exception:
+                        pass
+                future.set_result(result)
+            except BaseException as e:
+                future.set_exception(e)
+            # 다음 실행을 위해 새 컨텍스트 준비
+            if self._jobs.empty():
+                try:
+                    self._prepare_spare(launch_mode)
+                except Exception:
+                    pass
+        self._close_browser()
+
+    def _ensure_browser(self, launch_mode):
+        # playwright 로딩은 관리 스레드에서 (UI 스레드를 막지 않도록)
+        from srt_automation import launch_browser
+
+        if self._browser is not None and self._browser_mode == launch_mode and self._browser.is_connected():
+            return
+        self._close_browser()
+        self._playwright, self._browser = launch_browser(launch_mode)
+        self._browser_mode = launch_mode
+
+    def _prepare_spare(self, launch_mode):
+        from srt_automation import new_browser_page
+
+        self._ensure_browser(launch_mode)
+        if self._spare is None:
+            self._spare = new_browser_page(self._browser, launch_mode)
+
+    def _take_context(self, launch_mode):
+        from srt_automation import new_browser_page
+
+        self._ensure_browser(launch_mode)
+        spare, self._spare = self._spare, None
+        if spare is not None:
+            context, page = spare
+            if not page.is_closed():
+                return context, page
+            try:
+                context.close()
+            except Exception:
+                pass
+        return new_browser_page(self._browser, launch_mode)
+
+    def _close_browser(self):
+        self._spare = None
+        try:
+            if self._browser:
+                self._browser.close()
+        except Exception:
+            pass
+        try:
+            if self._playwright:
+                self._playwright.stop()
+        except Exception:
+            pass
+        self._browser = None
+        self._playwright = None
+        self._browser_mode = None
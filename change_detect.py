@@ -0,0 +1,85 @@
+import time
+from typing import NamedTuple, Optional
+
+from logger import get_logger
+
+logger = get_logger("change_detect")
+
+# 이벤트 종류
+# available: 좌석이 예약 가능해짐 / sold_out: 예약 가능하던 좌석이 다시 매진 / appeared: 새 열차가 목록에 나타남
+EVENT_KINDS = ('available', 'sold_out', 'appeared')
+
+SEAT_KEYS = ('general', 'special')
+
+class AvailabilityEvent(NamedTuple):
+    kind: str                   # EVENT_KINDS 중 하나
+    number: str                 # 열차번호
+    seat: Optional[str]         # general / special (appeared는 None)
+    dep_time: Optional[str]     # 출발 시각 HH:MM
+    arr_time: Optional[str]     # 도착 시각 HH:MM
+    at: float                   # 감지 시각 (time.time())
+
+    def describe(self):
+        seat = {'general': '일반실', 'special': '특실'}.get(self.seat, '')
+        if self.kind == 'available':
+            return f"🔔 {self.number} 열차 {seat} 예약 가능 ({self.dep_time} 출발)"
+        if self.kind == 'sold_out':
+            return f"{self.number} 열차 {seat} 다시 매진 ({self.dep_time} 출발)"
+        return f"새 열차 표시: {self.number} ({self.dep_time} 출발)"
+
+def fingerprint(rows):
+    """조회 결과 전체의 지문 (행 순서, 시각, 좌석 상태가 같으면 같은 값)"""
+    return hash(tuple(rows))
+
+class ChangeDetector:
+    """조회마다 결과 테이블을 이전 결과와 비교해 바뀐 점을 이벤트로 알림
+
+    지문이 같으면 행별 비교 없이 바로 '변화 없음'을 돌려준다.
+    처음 받은 결과는 기준으로만 저장하고 이벤트를 만들지 않는다.
+    listeners에 등록한 함수는 이벤트(AvailabilityEvent)를 하나씩 받는다.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.fingerprint = None
+        self.trains = None
+        self.listeners = []
+
+    def update(self, rows):
+        """(바뀌었는지, 이벤트 목록) - 지문이 같으면 (False, [])"""
+        current = fingerprint(rows)
+        if current == self.fingerprint:
+            return False, []
+        self.fingerprint = current
+
+        trains = {row.number: row for row in rows if row.number}
+        previous, self.trains = self.trains, trains
+        if previous is None:
+            return True, []
+
+        now = self.clock()
+        events = []
+        for number, row in trains.items():
+            before = previous.get(number)
+            if before is None:
+                events.append(AvailabilityEvent('appeared', number, None, row.dep_time, row.arr_time, now))
+            for seat in SEAT_KEYS:
+                state = row.seat_state(seat)
+                old_state = before.seat_state(seat) if before is not None else None
+                if state == 'available' and old_state != 'available':
+                    events.append(AvailabilityEvent('available', number, seat, row.dep_time, row.arr_time, now))
+                elif old_state == 'available' and state != 'available':
+                    events.append(AvailabilityEvent('sold_out', number, seat, row.dep_time, row.arr_time, now))
+
+        for event in events:
+            for listener in self.listeners:
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.warning("변경 이벤트 처리 실패: %s", e)
+        return True, events
+
+    def reset(self):
+        """기준 결과를 버림 (조회 폼을 다시 채웠을 때)"""
+        self.fingerprint = None
+        self.trains = None
@@ -0,0 +1,194 @@
+"""SRT Hunter 명령줄 실행 (PyQt 없이 화면 없는 서버에서 실행)
+
+작업 파일(JSON) 예:
+    {
+        "login": {"id": "1234567890"},
+        "personal": {"phone": "01012345678", "birth": "990101"},
+        "train": {
+            "departure": "수서",
+            "arrival": "부산",
+            "date": "2026-10-20",
+            "target_time": "14",
+            "time_tolerance": "60",
+            "seat_types": ["general"]
+        },
+        "settings": {
+            "launch_mode": "headless",
+            "engine": "http",
+            "selection_preference": "closest",
+            "seat_priority": "special",
+            "excluded_trains": "331, 305",
+            "polling_plan": "07:00-07:20 fast, 01:00-06:00 pause, * 3",
+            "start_at": "07:00:00"
+        }
+    }
+
+비밀번호는 작업 파일의 login.password 대신 SRT_HUNTER_PASSWORD 환경변수로 줄 수 있다.
+settings는 config.json 값 위에 덮어쓴다 (launch_mode 기본값은 headless).
+seat_types에 둘 다 넣으면 seat_priority 순서로 좌석을 고른다.
+selection_preference: closest(가까운 출발) / shortest(짧은 소요 시간) / seat(좌석 우선순위)
+polling_plan: 시간대별 조회 속도 (fast = refresh_interval, pause = 멈춤, 숫자 = 최소 간격 초, * = 나머지 시간)
+start_at: 예매 시작 시각 (이 컴퓨터의 시간대 기준). 07:00:00처럼 시각만 쓰면 다음에 오는 그 시각,
+    2026-10-19 07:00:00처럼 날짜를 함께 쓸 수도 있다. start_lead초(기본 90) 전에 로그인과 폼 입력을 마치고
+    서버 시각(HTTP Date 헤더로 측정)에 맞춰 첫 조회를 보낸다. 방금(10분 안) 지난 시각이면 바로 시작.
+
+사용 예:
+    python cli.py job.json
+    python main.py --cli job.json --log-level DEBUG
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+from datetime import datetime
+
+from config import load_config
+from logger import get_logger, setup_logging
+from polling import PollingPlan
+from clock_sync import parse_start_time
+
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+# 종료 코드
+EXIT_RESERVED = 0
+EXIT_FAILED = 1
+EXIT_BAD_JOB = 2
+
+logger = get_logger("cli")
+
+def format_date(value):
+    """'2026-10-20' / '20261020' / '2026/10/20(화)' -> 조회 화면의 '2026/10/20(화)'"""
+    if '(' in value:
+        return value
+    for pattern in ("%Y-%m-%d", "%Y%m%d", "%Y/%m/%d"):
+        try:
+            date = datetime.strptime(value, pattern)
+        except ValueError:
+            continue
+        return f"{date.strftime('%Y/%m/%d')}({WEEKDAYS[date.weekday()]})"
+    raise ValueError(f"날짜 형식을 알 수 없습니다: {value}")
+
+def load_job(path):
+    """작업 파일을 읽어 start_reservation 인자(login_info, train_info, personal_info, settings)로 변환"""
+    with open(path, "r", encoding="utf-8") as f:
+        job = json.load(f)
+
+    login = job.get('login', {})
+    personal = job.get('personal', {})
+    train = job['train']
+
+    login_info = {
+        'id': login['id'],
+        'password': login.get('password') or os.environ.get('SRT_HUNTER_PASSWORD', ""),
+        'phone': personal.get('phone', ""),
+        'birth': personal.get('birth', "")
+    }
+    if not login_info['password']:
+        raise ValueError("비밀번호가 없습니다 (login.password 또는 SRT_HUNTER_PASSWORD)")
+
+    personal_info = {
+        'phone': personal.get('phone', ""),
+        'birth': personal.get('birth', "")
+    }
+
+    config = load_config()
+    seat_types = train.get('seat_types', ['general'])
+    train_info = {
+        'departure': train['departure'],
+        'arrival': train['arrival'],
+        'date': format_date(train['date']),
+        'target_time': str(train['target_time']).split(':')[0].zfill(2),
+        'time_tolerance': str(train.get('time_tolerance', config['time_tolerance'])),
+        'seat_types': {
+            'special': 'special' in seat_types,
+            'general': 'general' in seat_types
+        },
+        'passenger_count': 1,
+        'passenger_names': []
+    }
+
+    settings = dict(config)
+    settings['launch_mode'] = 'headless'
+    settings.update(job.get('settings', {}))
+    # 잘못된 조회 계획은 브라우저를 띄우기 전에 알림
+    PollingPlan.parse(settings.get('polling_plan'))
+    parse_start_time(settings.get('start_at'))
+    return login_info, train_info, personal_info, settings
+
+def run(args):
+    try:
+        login_info, train_info, personal_info, settings = load_job(args.job)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"작업 파일 오류: {e}", file=sys.stderr)
+        return EXIT_BAD_JOB
+
+    if args.mode:
+        settings['launch_mode'] = args.mode
+    if args.log_level:
+        settings['log_level'] = args.log_level
+    if args.metrics_port is not None:
+        settings['metrics_port'] = str(args.metrics_port)
+    setup_logging(settings.get('log_level'))
+
+    # Ctrl+C / SIGTERM은 검색 루프가 사이클 사이에 보고 멈추도록 전달
+    stop_event = threading.Event()
+    settings['stop_event'] = stop_event
+
+    def request_stop(signum, frame):
+        logger.info("중단 요청을 받았습니다.")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, request_stop)
+
+    metrics_server = None
+    metrics_port = int(settings.get('metrics_port') or 0)
+    if metrics_port:
+        from metrics import Metrics, MetricsServer
+
+        settings['metrics'] = Metrics()
+        metrics_server = MetricsServer(settings['metrics'], metrics_port).start()
+        logger.info("메트릭: http://127.0.0.1:%d/metrics", metrics_server.port)
+
+    from srt_automation import setup_driver, start_reservation
+
+    playwright = browser = None
+    try:
+        if settings.get('metrics'):
+            settings['metrics'].set_state('starting')
+        playwright, browser, context, page = setup_driver(settings['launch_mode'])
+        success = start_reservation(playwright, browser, context, page,
+                                    login_info, train_info, personal_info, settings)
+        if settings.get('metrics'):
+            settings['metrics'].set_state(
+                'stopped' if stop_event.is_set() else 'reserved' if success else 'failed')
+        return EXIT_RESERVED if success else EXIT_FAILED
+    except Exception as e:
+        logger.error("실행 중 오류: %s", e)
+        return EXIT_FAILED
+    finally:
+        try:
+            if browser:
+                browser.close()
+            if playwright:
+                playwright.stop()
+        except Exception:
+            pass
+        if metrics_server:
+            metrics_server.stop()
+
+def main(argv=None):
+    from srt_automation import LAUNCH_MODES
+
+    parser = argparse.ArgumentParser(prog="srt-hunter", description="SRT Hunter 명령줄 실행 (화면 없는 서버용)")
+    parser.add_argument("job", help="작업 파일 (JSON)")
+    parser.add_argument("--mode", choices=list(LAUNCH_MODES), help="브라우저 실행 모드 (기본: headless)")
+    parser.add_argument("--log-level", choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    parser.add_argument("--metrics-port", type=int, help="메트릭 엔드포인트 포트 (0 = 끄기)")
+    return run(parser.parse_args(argv))
+
+if __name__ == "__main__":
+    sys.exit(main())
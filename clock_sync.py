@@ -0,0 +1,151 @@
+import math
+import time
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple
+
+from logger import get_logger
+
+logger = get_logger("clock_sync")
+
+# 시각 측정에 쓰는 요청 횟수 (첫 요청 + 초 경계 맞추기)
+DEFAULT_SAMPLES = 8
+
+# 오차 범위가 이 값(초)과 최소 왕복 시간의 합 아래로 줄면 측정을 멈춤
+TARGET_PRECISION = 0.002
+
+# 시작 시각 직전 이 시간(초)은 sleep 대신 바쁜 대기 (Windows sleep 단위가 약 15.6ms)
+SPIN_SECONDS = 0.02
+
+# 시각만 준 예매 시작 시각이 이 시간(초) 안에 지났으면 바로 시작, 더 지났으면 다음 날로 봄
+START_GRACE = 600
+
+# 예매 시작 몇 초 전에 로그인/조회 폼 입력을 시작할지 (config.json의 start_lead)
+DEFAULT_START_LEAD = 90
+
+class ClockOffset(NamedTuple):
+    offset: float       # 서버 시각 - 내 시각 (초)
+    error: float        # 오차 범위 (±초)
+    samples: int        # 사용한 요청 수
+    rtt: float          # 최소 왕복 시간 (초)
+
+    def describe(self):
+        return f"{self.offset * 1000:+.0f}ms (±{self.error * 1000:.0f}ms, 왕복 {self.rtt * 1000:.0f}ms, {self.samples}회)"
+
+def parse_http_date(value):
+    """HTTP Date 헤더 -> epoch 초 (1초 단위)"""
+    return parsedate_to_datetime(value).timestamp()
+
+def parse_start_time(value, now=None):
+    """예매 시작 시각 -> epoch 초 (빈 값이면 None)
+
+    '2026-10-19 07:00:00'처럼 날짜를 주면 그 시각, '07:00' / '07:00:00' / '07:00:00.250'처럼
+    시각만 주면 다음에 오는 그 시각 (전날 밤에 입력한 07:00은 다음 날 07:00).
+    시각만 준 경우 START_GRACE초 안에 지났으면 오늘 시각을 그대로 돌려주므로 호출한 쪽에서 바로 시작한다.
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    now = now or datetime.now()
+    for pattern in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
+        try:
+            return datetime.strptime(value, pattern).timestamp()
+        except ValueError:
+            continue
+    for pattern in ("%H:%M:%S.%f", "%H:%M:%S", "%H:%M"):
+        try:
+            parsed = datetime.strptime(value, pattern)
+        except ValueError:
+            continue
+        start = now.replace(hour=parsed.hour, minute=parsed.minute, second=parsed.second,
+                            microsecond=parsed.microsecond)
+        if (now - start).total_seconds() > START_GRACE:
+            start += timedelta(days=1)
+        return start.timestamp()
+    raise ValueError(f"예매 시작 시각 형식 오류: {value} (예: 07:00:00 또는 2026-10-19 07:00:00)")
+
+class ClockSync:
+    """HTTP Date 헤더로 서버 시각과 내 시각의 차이를 추정
+
+    Date 헤더는 1초 단위라 한 번의 응답으로는 ±0.5초 이상 알 수 없다.
+    서버가 시각을 읽은 순간은 요청을 보낸 뒤 응답을 받기 전 어딘가이고 그 값은
+    [Date, Date + 1) 안이므로, 응답마다 차이가 들어갈 수 있는 구간 [low, high]를 좁힌다.
+    두 번째 요청부터는 현재 추정으로 서버의 초가 바뀌는 순간에 맞춰 보내서
+    한 번에 구간을 절반 가까이 줄이고, 왕복 시간 수준이 되면 멈춘다.
+    fetch_date는 요청 한 번을 보내고 Date 헤더 문자열을 돌려주는 함수.
+    """
+
+    def __init__(self, fetch_date, samples=DEFAULT_SAMPLES, clock=time.time,
+                 timer=time.perf_counter, sleep=time.sleep):
+        self.fetch_date = fetch_date
+        self.samples = samples
+        self.clock = clock
+        self.timer = timer
+        self.sleep = sleep
+        self.low = -math.inf
+        self.high = math.inf
+        self.rtt = math.inf
+        self.count = 0
+        self.resets = 0
+        self.result = None
+
+    def probe(self):
+        """요청 한 번으로 구간을 좁힘"""
+        sent = self.clock()
+        value = self.fetch_date()
+        received = self.clock()
+        if not value:
+            raise ValueError("응답에 Date 헤더가 없습니다.")
+        server = parse_http_date(value)
+        self.count += 1
+        self.rtt = min(self.rtt, received - sent)
+        low = max(self.low, server - received)
+        high = min(self.high, server + 1 - sent)
+        if low > high:
+            # 서버가 여러 대이거나 서버 시각이 흔들린 경우: 이번 응답 기준으로 다시 시작
+            self.resets += 1
+            low, high = server - received, server + 1 - sent
+        self.low, self.high = low, high
+
+    def _sleep_until(self, local_time):
+        delay = local_time - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+
+    def estimate(self):
+        """여러 번 요청해 ClockOffset을 구함"""
+        self.probe()
+        while self.count < self.samples and self.high - self.low > self.rtt + TARGET_PRECISION:
+            middle = (self.low + self.high) / 2
+            # 추정대로라면 서버의 다음 초 경계가 되는 내 시각, 그 순간에 서버가 시각을 읽도록 왕복 절반 앞서 보냄
+            boundary = math.ceil(self.clock() + middle + self.rtt) - middle
+            self._sleep_until(boundary - self.rtt / 2)
+            self.probe()
+        if self.resets:
+            logger.warning("서버 시각 응답이 %d번 어긋났습니다 (서버가 여러 대일 수 있음)", self.resets)
+        self.result = ClockOffset((self.low + self.high) / 2, (self.high - self.low) / 2, self.count, self.rtt)
+        return self.result
+
+    def server_time(self):
+        """현재 서버 시각 추정 (epoch 초)"""
+        return self.clock() + (self.result.offset if self.result else 0.0)
+
+    def wait_until(self, target, stop_event=None):
+        """서버 시각 target(epoch 초)까지 대기, 그동안 중단 요청이 오면 False
+
+        벽시계는 대기 중에 NTP로 바뀔 수 있어 perf_counter 기준 마감 시각으로 바꿔서 기다리고,
+        마지막 SPIN_SECONDS는 sleep 오차를 피하려고 바쁜 대기로 맞춘다.
+        """
+        deadline = self.timer() + (target - self.server_time())
+        while True:
+            remaining = deadline - self.timer() - SPIN_SECONDS
+            if remaining <= 0:
+                break
+            if stop_event is not None:
+                if stop_event.wait(min(remaining, 1.0)):
+                    return False
+            else:
+                self.sleep(remaining)
+        while self.timer() < deadline:
+            pass
+        return stop_event is None or not stop_event.is_set()
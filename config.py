@@ -0,0 +1,43 @@
+import json
+import os
+
+from logger import get_logger
+
+logger = get_logger("config")
+
+# 설정 파일 (login_info.txt와 같은 위치에 저장)
+CONFIG_FILE = "config.json"
+
+DEFAULT_CONFIG = {
+    'time_tolerance': "30",
+    'refresh_interval': "0.05",
+    'max_poll_rate': "4",
+    'polling_plan': "",
+    'start_at': "",
+    'start_lead': "90",
+    'block_profile': "standard",
+    'launch_mode': "headed",
+    'engine': "dom",
+    'selection_preference': "closest",
+    'seat_priority': "general",
+    'excluded_trains': "",
+    'trace_file': "traces.jsonl",
+    'history_file': "history.sqlite3",
+    'metrics_port': "0",
+    'log_level': "INFO"
+}
+
+def load_config(path=CONFIG_FILE):
+    """설정 파일을 읽어 기본값과 합쳐서 반환 (파일이 없거나 깨졌으면 기본값)"""
+    config = dict(DEFAULT_CONFIG)
+    try:
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                config.update(json.load(f))
+    except Exception as e:
+        logger.warning("설정 파일을 읽지 못했습니다: %s", e)
+    return config
+
+def save_config(config, path=CONFIG_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
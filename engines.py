@@ -0,0 +1,280 @@
+from urllib.parse import urlencode
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from locators import resolve
+from polling import MaintenanceError, is_maintenance_page
+from schedule_parser import GENERAL_COLUMN, SPECIAL_COLUMN, parse_schedule_html, parse_snapshot
+
+# 단계별 최대 대기 시간 (ms)
+# 고정 sleep 대신 각 단계가 기다리는 신호(응답, 요소 상태, 팝업 이벤트)의 상한
+STEP_TIMEOUTS = {
+    'login_form': 10000,
+    'search_form': 10000,
+    'search_button': 10000,
+    'search_results': 10000,
+    'clock_sync': 5000,
+    'confirm_page': 30000,
+    'payment_button': 5000,
+    'payment_method': 5000,
+    'payment_popup': 10000,
+    'kakao_input': 5000,
+    'payment_complete': 600000
+}
+
+# 조회 결과 테이블 전체를 한 번의 page.evaluate로 읽어오는 스크립트
+# 행마다 locator/text_content를 호출하면 셀 수만큼 IPC 왕복이 발생하므로
+# 필요한 값만 평범한 객체로 묶어 한 번에 돌려받는다.
+SNAPSHOT_SCRIPT = """
+() => {
+    const cellState = (td) => {
+        if (!td) return 'none';
+        const text = td.textContent;
+        if (text.includes('매진')) return 'sold_out';
+        for (const a of td.querySelectorAll('a')) {
+            const t = a.textContent.trim();
+            if (t.includes('예약') && t.includes('하기') && !t.includes('좌석')) return 'available';
+        }
+        return 'none';
+    };
+    const timeOf = (td) => {
+        if (!td) return null;
+        const m = td.textContent.match(/(\\d{2}:\\d{2})/);
+        return m ? m[1] : null;
+    };
+    const rows = Array.from(document.querySelectorAll('tbody tr'));
+    return rows.map((tr, index) => {
+        const cols = tr.querySelectorAll('td');
+        return {
+            index: index,
+            cols: cols.length,
+            type: cols.length > 1 ? cols[1].textContent.trim().split('\\n')[0].trim() : '',
+            number: cols.length > 2 ? cols[2].textContent.trim() : '',
+            dep_time: timeOf(cols[3]),
+            arr_time: timeOf(cols[4]),
+            special: cellState(cols[5]),
+            general: cellState(cols[6])
+        };
+    });
+}
+"""
+
+# 조회 요청 주소 (조회하기 클릭 후 이 응답을 기다림)
+SCHEDULE_LIST_PATH = "selectScheduleList.do"
+
+# 세션이 끊기면 돌려보내지는 로그인 화면 주소
+LOGIN_FORM_PATH = "selectLoginForm"
+
+class SessionExpiredError(Exception):
+    """조회 요청이 로그인 화면으로 돌려보내짐 (다시 로그인해야 함)"""
+
+def is_login_redirect(response):
+    """응답이 로그인 화면이거나 로그인 화면으로 보내는 리다이렉트인지"""
+    return LOGIN_FORM_PATH in response.url or LOGIN_FORM_PATH in (response.headers.get('location') or "")
+
+# 현재 테이블에 세대 번호를 찍은 뒤 조회하기 버튼을 클릭
+# 응답 이후에도 같은 번호가 찍힌 tbody만 있으면 아직 이전 결과라는 뜻
+CLICK_SEARCH_SCRIPT = """
+([element, generation]) => {
+    document.querySelectorAll('tbody').forEach((t) => { t.dataset.srtGeneration = String(generation); });
+    element.click();
+}
+"""
+
+# 세대 번호가 없는(새로 그려진) 결과 테이블이 있는지 확인
+FRESH_TABLE_SCRIPT = """
+(generation) => {
+    if (document.readyState === 'loading') return false;
+    const tables = Array.from(document.querySelectorAll('tbody'));
+    return tables.some((t) => t.dataset.srtGeneration !== String(generation));
+}
+"""
+
+# 좌석 유형별 예약 버튼이 있는 열 (td 인덱스)
+SEAT_COLUMNS = {
+    '특실': SPECIAL_COLUMN,
+    '일반실': GENERAL_COLUMN
+}
+
+def snapshot_schedule_table(page):
+    """조회 결과 테이블을 한 번의 왕복으로 읽어 TrainRecord 목록으로 반환"""
+    return parse_snapshot(page.evaluate(SNAPSHOT_SCRIPT))
+
+def run_search(page, search_button, generation, timeout, on_click=None):
+    """조회하기 클릭 후 selectScheduleList.do 응답과 새 결과 테이블이 준비될 때까지 대기
+
+    on_click은 클릭을 보낸 직후, 응답을 기다리기 전에 호출된다.
+    """
+    with page.expect_response(lambda response: SCHEDULE_LIST_PATH in response.url, timeout=timeout) as response_info:
+        page.evaluate(CLICK_SEARCH_SCRIPT, [search_button.element_handle(), generation])
+        if on_click:
+            on_click()
+    response = response_info.value
+    if is_login_redirect(response):
+        raise SessionExpiredError("세션이 만료되었습니다.")
+    if not response.ok:
+        if is_maintenance_page(None, response.status):
+            raise MaintenanceError(f"조회 응답 오류: HTTP {response.status}")
+        raise Exception(f"조회 응답 오류: HTTP {response.status}")
+    # 응답을 받은 뒤 이전 세대가 아닌 테이블이 DOM에 반영될 때까지 대기
+    try:
+        page.wait_for_function(FRESH_TABLE_SCRIPT, arg=generation, timeout=timeout)
+    except PlaywrightTimeoutError:
+        # 결과 테이블 대신 로그인 화면이나 점검 안내 페이지가 뜬 경우 구분
+        if LOGIN_FORM_PATH in page.url:
+            raise SessionExpiredError("세션이 만료되었습니다.")
+        if is_maintenance_page(page.content()):
+            raise MaintenanceError("사이트 점검 안내 페이지가 표시되었습니다.")
+        raise
+    return response
+
+def resolve_reserve_button(page, row_index, seat_type):
+    """선택된 행의 예약하기 버튼 locator를 필요할 때만 생성"""
+    col = page.locator("tbody tr").nth(row_index).locator("td").nth(SEAT_COLUMNS[seat_type])
+    # "예약하기" 또는 "예약 하기" 텍스트를 가진 버튼만 선택 (좌석선택 버튼은 무시)
+    return col.locator("a", has_text="예약").filter(has_not_text="좌석").first
+
+class SearchEngine:
+    """조회 엔진 공통 인터페이스
+
+    search()는 조회 결과를 schedule_parser.TrainRecord 목록으로 돌려주고,
+    reserve_button()은 SelectionPolicy가 고른 열차의 예약하기 버튼 locator를 돌려준다
+    (그사이 매진됐으면 None).
+    """
+    name = None
+    label = None
+
+    def __init__(self, page, settings, mark=None):
+        self.page = page
+        self.settings = settings
+        self.mark = mark or (lambda phase: None)
+        self.log = settings['logger'].info if settings.get('logger') else (lambda *args: None)
+
+    def search(self):
+        raise NotImplementedError
+
+    def reserve_button(self, train):
+        raise NotImplementedError
+
+    def prepare(self):
+        """첫 조회 전에 미리 해 둘 수 있는 준비 (예매 시작 시각에 맞춰 조회할 때 대기 전에 호출)"""
+
+    def reset(self):
+        """조회 화면을 다시 열고 폼을 채운 뒤 호출 (미리 읽어 둔 화면 상태를 버림)"""
+
+class DomSearchEngine(SearchEngine):
+    """조회하기 버튼을 눌러 결과 페이지를 그린 뒤 테이블을 읽는 기본 엔진"""
+    name = 'dom'
+    label = "화면 조회"
+
+    def __init__(self, page, settings, mark=None):
+        super().__init__(page, settings, mark)
+        # 조회 세대 번호 (이전 조회 결과를 다시 읽지 않기 위해 사용)
+        self.generation = 0
+
+    def prepare(self):
+        # 조회하기 버튼 선택자를 미리 찾아 둠 (첫 조회에서 선택자 확인 생략)
+        resolve(self.page, 'search_button', timeout=STEP_TIMEOUTS['search_button'])
+
+    def search(self):
+        search_button = resolve(self.page, 'search_button', timeout=STEP_TIMEOUTS['search_button'])
+
+        def clicked():
+            self.mark('search_click')
+            self.log("조회하기 버튼 클릭 완료")
+
+        # JavaScript로 클릭 실행 후 조회 응답과 새 결과 테이블 대기
+        self.generation += 1
+        run_search(self.page, search_button, self.generation, STEP_TIMEOUTS['search_results'], clicked)
+        self.mark('results_ready')
+
+        return snapshot_schedule_table(self.page)
+
+    def reserve_button(self, train):
+        return resolve_reserve_button(self.page, train['row_index'], train['seat_type'])
+
+# 조회 폼의 전송 주소와 입력값 (중복 이름 유지를 위해 [이름, 값] 목록)
+READ_FORM_SCRIPT = """
+(element) => {
+    const form = element.form;
+    return {
+        action: form.action,
+        fields: Array.from(new FormData(form).entries()).map(([k, v]) => [k, String(v)])
+    };
+}
+"""
+
+class HttpSearchEngine(SearchEngine):
+    """브라우저 세션 쿠키로 조회 폼을 직접 POST하고 응답 HTML만 파싱하는 엔진
+
+    화면을 매번 다시 그리지 않으므로 조회 1회 비용이 HTTP 요청 1번과 작은 파싱으로 줄어든다.
+    예약 가능한 열차를 찾으면 화면에서 한 번 조회해 같은 열차의 예약하기 버튼을 넘겨준다.
+    """
+    name = 'http'
+    label = "직접 조회 (HTTP)"
+
+    def __init__(self, page, settings, mark=None):
+        super().__init__(page, settings, mark)
+        self.action = None
+        self.body = None
+        self.dom = DomSearchEngine(page, settings)
+
+    def prepare(self):
+        """화면에 입력된 조회 폼을 그대로 읽어 요청 본문으로 사용"""
+        search_button = resolve(self.page, 'search_button', timeout=STEP_TIMEOUTS['search_button'])
+        form = search_button.evaluate(READ_FORM_SCRIPT)
+        self.action = form['action']
+        self.body = urlencode(form['fields'])
+
+    def reset(self):
+        # 다시 연 조회 폼에서 요청 본문을 새로 읽음
+        self.action = None
+        self.body = None
+
+    def search(self):
+        if self.action is None:
+            self.prepare()
+
+        self.mark('search_click')
+        # context.request는 브라우저 컨텍스트와 쿠키를 공유함
+        response = self.page.context.request.post(
+            self.action,
+            data=self.body,
+            headers={
+                'Content-Type': 'application/x-www-form-urlencoded',
+                'Referer': self.page.url
+            },
+            timeout=STEP_TIMEOUTS['search_results']
+        )
+        if is_login_redirect(response):
+            raise SessionExpiredError("세션이 만료되었습니다.")
+        if not response.ok:
+            if is_maintenance_page(response.text(), response.status):
+                raise MaintenanceError(f"조회 응답 오류: HTTP {response.status}")
+            raise Exception(f"조회 응답 오류: HTTP {response.status}")
+
+        html = response.text()
+        rows = parse_schedule_html(html)
+        if not rows and is_maintenance_page(html):
+            raise MaintenanceError("사이트 점검 안내 페이지가 표시되었습니다.")
+        self.mark('results_ready')
+        return rows
+
+    def reserve_button(self, train):
+        # 화면에서 조회해 같은 열차/좌석이 여전히 예약 가능한지 확인
+        for row in self.dom.search():
+            if row.number == train['number']:
+                seat_key = 'special' if train['seat_type'] == '특실' else 'general'
+                if row.seat_state(seat_key) != 'available':
+                    return None
+                return resolve_reserve_button(self.page, row.index, train['seat_type'])
+        return None
+
+ENGINES = {
+    DomSearchEngine.name: DomSearchEngine,
+    HttpSearchEngine.name: HttpSearchEngine
+}
+
+def create_engine(page, settings, mark=None):
+    engine_class = ENGINES.get(settings.get('engine', 'dom'), DomSearchEngine)
+    return engine_class(page, settings, mark)
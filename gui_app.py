@@ -1,35 +1,61 @@
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QLabel, QLineEdit, QComboBox, QPushButton, QGroupBox, 
-                           QGridLayout, QTextEdit, QProgressBar, QMessageBox, QHBoxLayout, 
+                           QGridLayout, QProgressBar, QMessageBox, QHBoxLayout, 
                            QRadioButton, QButtonGroup, QTabWidget, QSpacerItem, QSizePolicy)
 from PyQt6.QtCore import QThread, pyqtSignal, Qt, QDate, QTimer
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
-import qdarkstyle
+from PyQt6.QtGui import QFont, QIcon
 import sys
+import threading
 from version import VERSION, AUTHOR, GITHUB_URL
+from config import load_config, save_config
+from polling import PollingPlan
+from clock_sync import parse_start_time
+from browser_pool import BrowserPool
+from log_view import LogView
+from styles import apply_stylesheet, set_style_state
 import os
 
 class SRTReservationWorker(QThread):
     progress_signal = pyqtSignal(str)
     finished_signal = pyqtSignal(bool)
     
-    def __init__(self, login_info, train_info, personal_info, settings):
+    def __init__(self, login_info, train_info, personal_info, settings, browser_pool=None):
         super().__init__()
         self.login_info = login_info
         self.train_info = train_info
         self.personal_info = personal_info
         self.settings = settings
+        self.browser_pool = browser_pool
+        self.future = None
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
         self.is_running = True
         self._stop_requested = False
+        # 검색 루프가 사이클마다 확인하는 중단 신호
+        self.stop_event = threading.Event()
+        self.settings['stop_event'] = self.stop_event
+        # 메트릭 엔드포인트에 보여줄 작업 상태
+        self.metrics = settings.get('metrics')
+        if self.metrics:
+            self.finished_signal.connect(
+                lambda success: self.metrics.set_state('reserved' if success else 'failed'))
     
     def stop(self):
         """안전하게 작업 중단"""
         self._stop_requested = True
         self.is_running = False
+        self.stop_event.set()
+        if self.metrics:
+            self.metrics.set_state('stopped')
+        
+        # 공용 브라우저는 다른 스레드에서 닫을 수 없으므로 작업이 중단 신호를 보고 스스로 끝내고
+        # 관리 스레드가 컨텍스트를 닫음 (아직 시작 전인 작업은 취소)
+        if self.browser_pool:
+            if self.future is not None:
+                self.future.cancel()
+            return
         
         # 브라우저와 playwright를 즉시 종료
         try:
@@ -43,41 +69,79 @@ class SRTReservationWorker(QThread):
                 self.playwright.stop()
         except:
             pass
+    
+    def _report_missing_browser(self, e):
+        if "Executable doesn't exist" in str(e) or "Playwright" in str(e):
+            self.progress_signal.emit("⚠️ 브라우저가 설치되지 않았습니다.")
+            self.progress_signal.emit("터미널에서 다음 명령을 실행해주세요:")
+            self.progress_signal.emit("playwright install chromium")
+            self.finished_signal.emit(False)
+            return True
+        return False
+    
+    def _reserve(self, playwright, browser, context, page):
+        from srt_automation import start_reservation
+        
+        return start_reservation(
+            playwright,
+            browser,
+            context,
+            page,
+            self.login_info,
+            self.train_info,
+            self.personal_info,
+            self.settings,
+            self.progress_signal
+        )
         
     def run(self):
+        if self.metrics:
+            self.metrics.set_state('starting')
+        if self.browser_pool:
+            self._run_with_pool()
+        else:
+            self._run_standalone()
+    
+    def _run_with_pool(self):
+        """앱이 미리 띄워 둔 브라우저에서 새 컨텍스트를 받아 실행"""
+        try:
+            if self._stop_requested:
+                return
+            
+            self.future = self.browser_pool.submit(self._reserve, self.settings.get('launch_mode', 'headed'))
+            try:
+                success = self.future.result()
+            except Exception as e:
+                if not self._stop_requested and self._report_missing_browser(e):
+                    return
+                raise
+            
+            if not self._stop_requested:
+                self.finished_signal.emit(success)
+        except Exception as e:
+            if not self._stop_requested:
+                self.progress_signal.emit(f"❌ 오류 발생: {str(e)}")
+                self.finished_signal.emit(False)
+    
+    def _run_standalone(self):
         try:
             if self._stop_requested:
                 return
                 
-            from srt_automation import setup_driver, start_reservation
+            from srt_automation import setup_driver
             
             try:
-                self.playwright, self.browser, self.context, self.page = setup_driver()
+                self.playwright, self.browser, self.context, self.page = setup_driver(
+                    self.settings.get('launch_mode', 'headed'))
             except Exception as e:
-                if "Executable doesn't exist" in str(e) or "Playwright" in str(e):
-                    self.progress_signal.emit("⚠️ 브라우저가 설치되지 않았습니다.")
-                    self.progress_signal.emit("터미널에서 다음 명령을 실행해주세요:")
-                    self.progress_signal.emit("playwright install chromium")
-                    self.finished_signal.emit(False)
+                if self._report_missing_browser(e):
                     return
-                else:
-                    raise
+                raise
             
             if self._stop_requested:
                 return
                 
-            # start_reservation_with_worker 대신 기존 함수 사용
-            success = start_reservation(
-                self.playwright,
-                self.browser,
-                self.context,
-                self.page,
-                self.login_info,
-                self.train_info,
-                self.personal_info,
-                self.settings,
-                self.progress_signal
-            )
+            success = self._reserve(self.playwright, self.browser, self.context, self.page)
             
             if not self._stop_requested:
                 self.finished_signal.emit(success)
@@ -115,9 +179,8 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1100, 750)
         self.setMinimumSize(1000, 700)
         
-        # 다크 스타일 적용
-        app = QApplication.instance()
-        app.setStyleSheet(qdarkstyle.load_stylesheet_pyqt6())
+        # 다크 스타일 + 앱 스타일을 위젯 생성 전에 한 번만 적용 (styles.py)
+        apply_stylesheet(QApplication.instance())
         
         # 메인 위젯
         main_widget = QWidget()
@@ -134,20 +197,10 @@ class MainWindow(QMainWindow):
         header_layout.setContentsMargins(0, 0, 0, 10)
         
         title_label = QLabel("🚄 SRT 자동 예매 시스템")
-        title_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #4CAF50;
-        """)
+        title_label.setObjectName("titleLabel")
         
         status_label = QLabel("⚫ 대기")
         status_label.setObjectName("statusLabel")
-        status_label.setStyleSheet("""
-            font-size: 14px;
-            padding: 5px 10px;
-            background-color: #2b2b2b;
-            border-radius: 10px;
-        """)
         self.status_label = status_label
         
         header_layout.addWidget(title_label)
@@ -157,21 +210,6 @@ class MainWindow(QMainWindow):
         
         # 탭 위젯 추가
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #3c3c3c;
-                background-color: #2b2b2b;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                padding: 6px 16px;
-                margin-right: 3px;
-            }
-            QTabBar::tab:selected {
-                background-color: #3c3c3c;
-                border-bottom: 2px solid #4CAF50;
-            }
-        """)
         
         # 예매 탭
         reservation_tab = QWidget()
@@ -187,56 +225,17 @@ class MainWindow(QMainWindow):
         
         # 진행 상태 섹션
         status_group = QGroupBox("진행 상태")
-        status_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         status_layout = QVBoxLayout()
         
         # 프로그레스 바
         self.progress_bar = QProgressBar()
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                text-align: center;
-                height: 22px;
-                background-color: #1e1e1e;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #3d8b40, stop: 1 #4CAF50);
-                border-radius: 3px;
-            }
-        """)
         self.progress_bar.hide()
         status_layout.addWidget(self.progress_bar)
         
-        # 로그 텍스트
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        # 로그 텍스트 (최근 2000줄만 유지, 100ms마다 모아서 표시)
+        self.log_text = LogView(max_lines=2000, flush_interval=100)
         self.log_text.setMaximumHeight(150)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                padding: 8px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 11px;
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-            }
-        """)
+        self.log_text.setObjectName("logView")
         self.log_text.setPlaceholderText("예매 진행 상황이 여기에 표시됩니다...")
         status_layout.addWidget(self.log_text)
         
@@ -249,55 +248,13 @@ class MainWindow(QMainWindow):
         
         # 시작 버튼
         self.start_button = QPushButton("예매 시작")
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #4CAF50, stop: 1 #45a049);
-                color: white;
-                border: none;
-                padding: 10px 25px;
-                font-size: 15px;
-                font-weight: bold;
-                border-radius: 5px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #45a049, stop: 1 #3d8b40);
-            }
-            QPushButton:pressed {
-                background: #3d8b40;
-            }
-            QPushButton:disabled {
-                background: #555555;
-                color: #999999;
-            }
-        """)
+        self.start_button.setObjectName("startButton")
         self.start_button.clicked.connect(self.start_reservation)
         self.start_button.setCursor(Qt.CursorShape.PointingHandCursor)
         
         # 중단 버튼
         self.reset_button = QPushButton("중단")
-        self.reset_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #f44336, stop: 1 #da190b);
-                color: white;
-                border: none;
-                padding: 10px 25px;
-                font-size: 15px;
-                font-weight: bold;
-                border-radius: 5px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #da190b, stop: 1 #c41e08);
-            }
-            QPushButton:pressed {
-                background: #c41e08;
-            }
-        """)
+        self.reset_button.setObjectName("stopButton")
         self.reset_button.clicked.connect(self.reset_program)
         self.reset_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.reset_button.setEnabled(False)
@@ -311,12 +268,33 @@ class MainWindow(QMainWindow):
         # 버전 정보
         version_label = QLabel(f"v{VERSION} | Developed by {AUTHOR}")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version_label.setStyleSheet("color: #666666; font-size: 11px;")
+        version_label.setObjectName("versionLabel")
         main_layout.addWidget(version_label)
         
         # 초기 설정
         self.update_time_options()
         self.load_login_info()
+        self.load_settings()
+        
+        # 예매 시작 시 바로 검색할 수 있도록 브라우저를 미리 띄워 둠
+        self.browser_pool = BrowserPool(self.launch_mode_select.currentData())
+        QTimer.singleShot(0, self.browser_pool.start)
+        # 중단 후 공용 브라우저 작업이 끝나기를 기다리는 중인지
+        self.stopping = False
+        
+        # 로컬 메트릭 엔드포인트 (config.json의 metrics_port가 0이 아니면 http://127.0.0.1:포트/metrics)
+        # 꺼져 있으면 metrics(http.server)를 불러오지 않아 시작이 빨라짐
+        self.metrics = None
+        self.metrics_server = None
+        try:
+            metrics_port = int(load_config()['metrics_port'] or 0)
+            if metrics_port:
+                from metrics import Metrics, MetricsServer
+                
+                self.metrics = Metrics()
+                self.metrics_server = MetricsServer(self.metrics, metrics_port).start()
+        except Exception as e:
+            self.log_text.append(f"메트릭 서버 시작 실패: {str(e)}")
         
     def setup_reservation_tab(self, parent):
         layout = QVBoxLayout()
@@ -328,20 +306,6 @@ class MainWindow(QMainWindow):
         
         # 로그인 정보
         login_group = QGroupBox("로그인 정보")
-        login_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         login_layout = QGridLayout()
         login_layout.setSpacing(8)
         
@@ -352,20 +316,6 @@ class MainWindow(QMainWindow):
         self.id_input.setPlaceholderText("SRT 회원번호")
         self.pw_input.setPlaceholderText("비밀번호")
         
-        # 스타일 적용
-        input_style = """
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4CAF50;
-            }
-        """
-        self.id_input.setStyleSheet(input_style)
-        self.pw_input.setStyleSheet(input_style)
         
         login_layout.addWidget(QLabel("회원번호:"), 0, 0)
         login_layout.addWidget(self.id_input, 0, 1)
@@ -376,20 +326,6 @@ class MainWindow(QMainWindow):
         
         # 개인정보
         personal_group = QGroupBox("결제 정보")
-        personal_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         personal_layout = QGridLayout()
         personal_layout.setSpacing(8)
         
@@ -398,9 +334,6 @@ class MainWindow(QMainWindow):
         self.phone_input.setPlaceholderText("01012345678")
         self.birth_input.setPlaceholderText("990101 (6자리)")
         
-        self.phone_input.setStyleSheet(input_style)
-        self.birth_input.setStyleSheet(input_style)
-        
         personal_layout.addWidget(QLabel("전화번호:"), 0, 0)
         personal_layout.addWidget(self.phone_input, 0, 1)
         personal_layout.addWidget(QLabel("생년월일:"), 1, 0)
@@ -414,20 +347,6 @@ class MainWindow(QMainWindow):
         
         # 예매 정보
         reservation_group = QGroupBox("예매 정보")
-        reservation_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         reservation_layout = QGridLayout()
         reservation_layout.setSpacing(8)
         
@@ -447,23 +366,6 @@ class MainWindow(QMainWindow):
         self.dep_stn.setCurrentText("수서")
         self.arr_stn.setCurrentText("부산")
         
-        combo_style = """
-            QComboBox {
-                padding: 8px;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QComboBox:focus {
-                border: 1px solid #4CAF50;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-        """
-        self.dep_stn.setStyleSheet(combo_style)
-        self.arr_stn.setStyleSheet(combo_style)
-        
         # 날짜 선택
         current_date = QDate.currentDate()
         dates = []
@@ -474,24 +376,25 @@ class MainWindow(QMainWindow):
             dates.append(formatted_date)
         self.date_select = QComboBox()
         self.date_select.addItems(dates)
-        self.date_select.setStyleSheet(combo_style)
         self.date_select.setMaxVisibleItems(10)  # 드롭다운 최대 항목 수 제한
         
         # 시간 선택
         self.time_select = QComboBox()
-        self.time_select.setStyleSheet(combo_style)
         
         # 좌석 유형
         seat_layout = QHBoxLayout()
         self.seat_type_group = QButtonGroup(self)
         self.special_seat = QRadioButton("특실")
         self.general_seat = QRadioButton("일반실")
+        self.any_seat = QRadioButton("전체")
         self.seat_type_group.addButton(self.special_seat)
         self.seat_type_group.addButton(self.general_seat)
+        self.seat_type_group.addButton(self.any_seat)
         self.general_seat.setChecked(True)
         
         seat_layout.addWidget(self.special_seat)
         seat_layout.addWidget(self.general_seat)
+        seat_layout.addWidget(self.any_seat)
         seat_layout.addStretch()
         
         # 레이아웃 구성
@@ -524,20 +427,6 @@ class MainWindow(QMainWindow):
         
         # 검색 설정
         search_group = QGroupBox("검색 설정")
-        search_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         search_layout = QGridLayout()
         search_layout.setSpacing(8)
         
@@ -549,67 +438,126 @@ class MainWindow(QMainWindow):
         self.refresh_interval_input.setPlaceholderText("0.05")
         self.refresh_interval_input.setText("0.05")
         
-        input_style = """
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4CAF50;
-            }
-        """
-        self.time_tolerance_input.setStyleSheet(input_style)
-        self.refresh_interval_input.setStyleSheet(input_style)
+        self.max_poll_rate_input = QLineEdit()
+        self.max_poll_rate_input.setPlaceholderText("4")
+        self.max_poll_rate_input.setText("4")
         
         search_layout.addWidget(QLabel("허용 시간 범위:"), 0, 0)
         search_layout.addWidget(self.time_tolerance_input, 0, 1)
         time_help = QLabel("분 (예: 60 = 선택 시간부터 60분 이내)")
-        time_help.setStyleSheet("color: #888888; font-size: 11px; font-weight: normal;")
+        time_help.setProperty("role", "help")
         search_layout.addWidget(time_help, 0, 2)
         
         search_layout.addWidget(QLabel("새로고침 간격:"), 1, 0)
         search_layout.addWidget(self.refresh_interval_input, 1, 1)
-        refresh_help = QLabel("초 (권장: 0.1초 이상)")
-        refresh_help.setStyleSheet("color: #888888; font-size: 11px; font-weight: normal;")
+        refresh_help = QLabel("초 (최소 간격, 서버 응답이 느리거나 오류가 나면 자동으로 늘어남)")
+        refresh_help.setProperty("role", "help")
         search_layout.addWidget(refresh_help, 1, 2)
         
+        search_layout.addWidget(QLabel("최대 조회 속도:"), 2, 0)
+        search_layout.addWidget(self.max_poll_rate_input, 2, 1)
+        rate_help = QLabel("초당 횟수 (0 = 제한 없음)")
+        rate_help.setProperty("role", "help")
+        search_layout.addWidget(rate_help, 2, 2)
+        
+        # 조회 중 리소스 차단
+        self.block_profile_select = QComboBox()
+        for label, value in (("표준 (이미지/폰트/추적 차단)", "standard"),
+                             ("강력 (스타일시트까지 차단)", "aggressive"),
+                             ("끄기", "off")):
+            self.block_profile_select.addItem(label, value)
+        search_layout.addWidget(QLabel("리소스 차단:"), 3, 0)
+        search_layout.addWidget(self.block_profile_select, 3, 1)
+        block_help = QLabel("조회 중에만 적용, 결제창은 차단 없음")
+        block_help.setProperty("role", "help")
+        search_layout.addWidget(block_help, 3, 2)
+        
+        # 브라우저 실행 모드
+        self.launch_mode_select = QComboBox()
+        for label, value in (("화면 표시", "headed"),
+                             ("헤드리스", "headless"),
+                             ("헤드리스 (신규 모드)", "headless-new"),
+                             ("최소 창 (저사양)", "minimal")):
+            self.launch_mode_select.addItem(label, value)
+        search_layout.addWidget(QLabel("브라우저 모드:"), 4, 0)
+        search_layout.addWidget(self.launch_mode_select, 4, 1)
+        launch_help = QLabel("헤드리스는 결제 자동 입력 실패 시에만 창 표시")
+        launch_help.setProperty("role", "help")
+        search_layout.addWidget(launch_help, 4, 2)
+        
+        # 조회 엔진
+        self.engine_select = QComboBox()
+        for label, value in (("화면 조회 (기본)", "dom"),
+                             ("직접 조회 (HTTP)", "http")):
+            self.engine_select.addItem(label, value)
+        search_layout.addWidget(QLabel("조회 엔진:"), 5, 0)
+        search_layout.addWidget(self.engine_select, 5, 1)
+        engine_help = QLabel("직접 조회는 화면을 다시 그리지 않고 찾았을 때만 화면으로 전환")
+        engine_help.setProperty("role", "help")
+        search_layout.addWidget(engine_help, 5, 2)
+        
+        # 후보 선택 기준 (조회 결과 전체에서 가장 좋은 열차 하나를 고름)
+        self.selection_select = QComboBox()
+        for label, value in (("가까운 출발 시각", "closest"),
+                             ("짧은 소요 시간", "shortest"),
+                             ("좌석 우선순위", "seat")):
+            self.selection_select.addItem(label, value)
+        search_layout.addWidget(QLabel("선택 기준:"), 6, 0)
+        search_layout.addWidget(self.selection_select, 6, 1)
+        selection_help = QLabel("허용 시간 안의 예약 가능한 열차 중 무엇을 먼저 고를지")
+        selection_help.setProperty("role", "help")
+        search_layout.addWidget(selection_help, 6, 2)
+        
+        self.seat_priority_select = QComboBox()
+        for label, value in (("일반실 먼저", "general"),
+                             ("특실 먼저", "special")):
+            self.seat_priority_select.addItem(label, value)
+        search_layout.addWidget(QLabel("좌석 우선순위:"), 7, 0)
+        search_layout.addWidget(self.seat_priority_select, 7, 1)
+        seat_priority_help = QLabel("좌석을 '전체'로 선택했을 때 적용")
+        seat_priority_help.setProperty("role", "help")
+        search_layout.addWidget(seat_priority_help, 7, 2)
+        
+        self.excluded_trains_input = QLineEdit()
+        self.excluded_trains_input.setPlaceholderText("예: 331, 305")
+        search_layout.addWidget(QLabel("제외 열차:"), 8, 0)
+        search_layout.addWidget(self.excluded_trains_input, 8, 1)
+        excluded_help = QLabel("예약하지 않을 열차번호 (쉼표로 구분)")
+        excluded_help.setProperty("role", "help")
+        search_layout.addWidget(excluded_help, 8, 2)
+        
+        # 시간대별 조회 계획 (비우면 항상 새로고침 간격대로)
+        self.polling_plan_input = QLineEdit()
+        self.polling_plan_input.setPlaceholderText("예: 07:00-07:20 fast, 01:00-06:00 pause, * 3")
+        search_layout.addWidget(QLabel("조회 계획:"), 9, 0)
+        search_layout.addWidget(self.polling_plan_input, 9, 1)
+        plan_help = QLabel("시간대별 fast(기본 간격) / pause(멈춤) / 초, * = 나머지 시간")
+        plan_help.setProperty("role", "help")
+        search_layout.addWidget(plan_help, 9, 2)
+        
+        # 예매 시작 시각 (미리 로그인해 두고 서버 시각에 맞춰 첫 조회)
+        self.start_at_input = QLineEdit()
+        self.start_at_input.setPlaceholderText("예: 07:00:00")
+        search_layout.addWidget(QLabel("예매 시작 시각:"), 10, 0)
+        search_layout.addWidget(self.start_at_input, 10, 1)
+        start_help = QLabel("비우면 바로 시작, 시각만 쓰면 다음에 오는 그 시각 (미리 로그인 후 서버 시각에 맞춰 조회)")
+        start_help.setProperty("role", "help")
+        search_layout.addWidget(start_help, 10, 2)
+        
         search_group.setLayout(search_layout)
         layout.addWidget(search_group)
         
         # 자동화 정보
         info_group = QGroupBox("자동화 정보")
-        info_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         info_layout = QVBoxLayout()
         
         info_text = QLabel("""
         • 엔진: Playwright (고성능 웹 자동화)
         • 브라우저: Chromium
-        • 모드: 헤드리스 OFF (화면 표시)
+        • 모드: 검색 설정의 브라우저 모드 (config.json에 저장)
         • 결제: 카카오페이 자동 연동
         """)
-        info_text.setStyleSheet("""
-            font-size: 12px;
-            font-weight: normal;
-            color: #e0e0e0;
-            padding: 10px;
-            background-color: #1e1e1e;
-            border-radius: 3px;
-        """)
+        info_text.setObjectName("infoText")
         info_layout.addWidget(info_text)
         
         info_group.setLayout(info_layout)
@@ -617,38 +565,13 @@ class MainWindow(QMainWindow):
         
         # 저장된 정보
         saved_group = QGroupBox("저장된 정보")
-        saved_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         saved_layout = QHBoxLayout()
         
         self.save_button = QPushButton("로그인 정보 저장")
         self.load_button = QPushButton("로그인 정보 불러오기")
-        
-        button_style = """
-            QPushButton {
-                padding: 10px 20px;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #3c3c3c;
-            }
-        """
-        self.save_button.setStyleSheet(button_style)
-        self.load_button.setStyleSheet(button_style)
+
+        self.save_button.setProperty("role", "secondary")
+        self.load_button.setProperty("role", "secondary")
         
         self.save_button.clicked.connect(self.save_login_info)
         self.load_button.clicked.connect(self.load_login_info)
@@ -724,6 +647,45 @@ class MainWindow(QMainWindow):
         except:
             pass
     
+    def load_settings(self):
+        """config.json의 검색 설정을 화면에 반영"""
+        config = load_config()
+        self.time_tolerance_input.setText(config['time_tolerance'])
+        self.refresh_interval_input.setText(config['refresh_interval'])
+        self.max_poll_rate_input.setText(config['max_poll_rate'])
+        self.excluded_trains_input.setText(config['excluded_trains'])
+        self.polling_plan_input.setText(config['polling_plan'])
+        self.start_at_input.setText(config['start_at'])
+        for select, value in ((self.block_profile_select, config['block_profile']),
+                              (self.launch_mode_select, config['launch_mode']),
+                              (self.engine_select, config['engine']),
+                              (self.selection_select, config['selection_preference']),
+                              (self.seat_priority_select, config['seat_priority'])):
+            index = select.findData(value)
+            if index >= 0:
+                select.setCurrentIndex(index)
+    
+    def save_settings(self):
+        """현재 검색 설정을 config.json에 저장"""
+        config = load_config()
+        config.update({
+            'time_tolerance': self.time_tolerance_input.text() or "30",
+            'refresh_interval': self.refresh_interval_input.text() or "0.05",
+            'max_poll_rate': self.max_poll_rate_input.text() or "4",
+            'block_profile': self.block_profile_select.currentData(),
+            'launch_mode': self.launch_mode_select.currentData(),
+            'engine': self.engine_select.currentData(),
+            'selection_preference': self.selection_select.currentData(),
+            'seat_priority': self.seat_priority_select.currentData(),
+            'excluded_trains': self.excluded_trains_input.text(),
+            'polling_plan': self.polling_plan_input.text(),
+            'start_at': self.start_at_input.text()
+        })
+        try:
+            save_config(config)
+        except Exception as e:
+            self.log_text.append(f"설정 저장 실패: {str(e)}")
+    
     def validate_inputs(self):
         if not self.id_input.text() or not self.phone_input.text() or not self.birth_input.text():
             QMessageBox.warning(self, "입력 오류", "모든 필수 정보를 입력해주세요.")
@@ -733,9 +695,21 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "입력 오류", "출발역과 도착역이 동일합니다.")
             return False
         
+        try:
+            PollingPlan.parse(self.polling_plan_input.text())
+            parse_start_time(self.start_at_input.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return False
+        
         return True
     
     def start_reservation(self):
+        # 중단한 이전 작업이 공용 브라우저에서 아직 정리 중이면 새 작업이 그 뒤에 밀려 기다리게 됨
+        if hasattr(self, 'worker') and self.worker.isRunning():
+            QMessageBox.information(self, "실행 중", "이전 작업을 정리하는 중입니다. 잠시 후 다시 시도해주세요.")
+            return
+        
         if not self.validate_inputs():
             return
         
@@ -758,43 +732,58 @@ class MainWindow(QMainWindow):
             'target_time': self.time_select.currentText().split(':')[0].zfill(2),  # 2자리로 패딩
             'time_tolerance': self.time_tolerance_input.text() or "30",  # 레거시와 동일하게 30
             'seat_types': {
-                'special': self.special_seat.isChecked(),
-                'general': self.general_seat.isChecked()
+                'special': self.special_seat.isChecked() or self.any_seat.isChecked(),
+                'general': self.general_seat.isChecked() or self.any_seat.isChecked()
             },
             'passenger_count': 1,  # 1인 예매 고정
             'passenger_names': []  # 빈 리스트
         }
         
+        config = load_config()
         settings = {
-            'refresh_interval': self.refresh_interval_input.text() or "0.05"  # 레거시와 동일하게 0.05
+            'refresh_interval': self.refresh_interval_input.text() or "0.05",  # 레거시와 동일하게 0.05
+            'max_poll_rate': self.max_poll_rate_input.text() or "4",
+            'block_profile': self.block_profile_select.currentData(),
+            'launch_mode': self.launch_mode_select.currentData(),
+            'engine': self.engine_select.currentData(),
+            'selection_preference': self.selection_select.currentData(),
+            'seat_priority': self.seat_priority_select.currentData(),
+            'excluded_trains': self.excluded_trains_input.text(),
+            'polling_plan': self.polling_plan_input.text(),
+            'start_at': self.start_at_input.text(),
+            'start_lead': config['start_lead'],
+            'trace_file': config['trace_file'],
+            'history_file': config['history_file'],
+            'log_level': config['log_level'],
+            'metrics': self.metrics
         }
+        self.save_settings()
         
         self.progress_bar.setRange(0, 0)
         self.progress_bar.show()
         
-        self.worker = SRTReservationWorker(login_info, train_info, personal_info, settings)
+        self.worker = SRTReservationWorker(login_info, train_info, personal_info, settings, self.browser_pool)
         self.worker.progress_signal.connect(self.update_log)
         self.worker.finished_signal.connect(self.reservation_finished)
+        # 스레드 간 신호라 _do_reset이 끝난 뒤에 전달되므로 stopping 설정과 엇갈리지 않음
+        self.worker.finished.connect(self.worker_finished)
+        self.stopping = False
         self.worker.start()
         
         self.start_button.setEnabled(False)
         self.reset_button.setEnabled(True)
-        self.status_label.setText("🟢 실행중")
-        self.status_label.setStyleSheet("""
-            font-size: 14px;
-            padding: 5px 10px;
-            background-color: #2b4c2b;
-            border-radius: 10px;
-            color: #4CAF50;
-        """)
+        self.set_status("🟢 실행중", "running")
         self.log_text.clear()
         self.log_text.append("🚀 예매를 시작합니다...")
     
+    def set_status(self, text, state):
+        """상태 표시 변경 (색은 styles.py의 #statusLabel[state=...]에서 정함)"""
+        self.status_label.setText(text)
+        set_style_state(self.status_label, state)
+    
     def update_log(self, message):
+        # 실제 표시와 자동 스크롤은 LogView가 타이머로 모아서 처리
         self.log_text.append(message)
-        # 자동 스크롤
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
     
     def reservation_finished(self, success):
         self.progress_bar.hide()
@@ -802,24 +791,10 @@ class MainWindow(QMainWindow):
         self.reset_button.setEnabled(False)
         
         if success:
-            self.status_label.setText("✅ 완료")
-            self.status_label.setStyleSheet("""
-                font-size: 14px;
-                padding: 5px 10px;
-                background-color: #2b4c2b;
-                border-radius: 10px;
-                color: #4CAF50;
-            """)
+            self.set_status("✅ 완료", "done")
             QMessageBox.information(self, "예매 완료", "🎉 예매가 성공적으로 완료되었습니다!")
         else:
-            self.status_label.setText("❌ 실패")
-            self.status_label.setStyleSheet("""
-                font-size: 14px;
-                padding: 5px 10px;
-                background-color: #4c2b2b;
-                border-radius: 10px;
-                color: #f44336;
-            """)
+            self.set_status("❌ 실패", "failed")
             QMessageBox.warning(self, "예매 실패", "❌ 예매에 실패했습니다.")
     
     def reset_program(self):
@@ -839,22 +814,39 @@ class MainWindow(QMainWindow):
                 
                 # 워커가 종료될 때까지 최대 0.5초 대기
                 if not self.worker.wait(500):
+                    if self.worker.browser_pool:
+                        # 공용 브라우저 작업은 강제 종료해도 관리 스레드에서 계속 돌므로
+                        # 대기 중인 단계가 중단 신호를 보고 끝날 때까지 기다림
+                        self.stopping = True
+                        self.set_status("⏳ 중단 중", "stopped")
+                        self.log_text.append("⏳ 진행 중인 단계를 정리하는 중입니다...")
+                        return
                     # 강제 종료
                     self.worker.terminate()
                     self.worker.wait(100)
         except Exception as e:
             self.log_text.append(f"중단 중 오류: {str(e)}")
-        finally:
-            # UI 상태 업데이트
-            self.progress_bar.hide()
-            self.start_button.setEnabled(True)
-            self.reset_button.setEnabled(False)
-            self.status_label.setText("⚫ 중단됨")
-            self.status_label.setStyleSheet("""
-                font-size: 14px;
-                padding: 5px 10px;
-                background-color: #3c3c3c;
-                border-radius: 10px;
-                color: #999999;
-            """)
-            self.log_text.append("⏹️ 프로그램이 중단되었습니다.")
\ No newline at end of file
+        self._finish_reset()
+    
+    def worker_finished(self):
+        """워커 스레드 종료 (중단 정리를 기다리던 중이면 화면 상태 갱신)"""
+        if self.stopping:
+            self.stopping = False
+            self._finish_reset()
+    
+    def _finish_reset(self):
+        # UI 상태 업데이트
+        self.progress_bar.hide()
+        self.start_button.setEnabled(True)
+        self.reset_button.setEnabled(False)
+        self.set_status("⚫ 중단됨", "stopped")
+        self.log_text.append("⏹️ 프로그램이 중단되었습니다.")
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 작업 중단 후 공용 브라우저 정리"""
+        if hasattr(self, 'worker') and self.worker.isRunning():
+            self.worker.stop()
+        self.browser_pool.shutdown()
+        if self.metrics_server:
+            self.metrics_server.stop()
+        super().closeEvent(event)
@@ -0,0 +1,228 @@
+import os
+import queue
+import sqlite3
+import statistics
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import closing
+from datetime import datetime
+
+from logger import get_logger
+
+logger = get_logger("history")
+
+# 좌석 변경 이벤트 기록 파일 (config.json의 history_file, 빈 문자열이면 기록 안 함)
+HISTORY_FILE = "history.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    started REAL NOT NULL,
+    ended REAL,
+    departure TEXT NOT NULL,
+    arrival TEXT NOT NULL,
+    travel_date TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    run TEXT NOT NULL,
+    at REAL NOT NULL,
+    departure TEXT NOT NULL,
+    arrival TEXT NOT NULL,
+    travel_date TEXT NOT NULL,
+    train TEXT NOT NULL,
+    seat TEXT,
+    kind TEXT NOT NULL,
+    dep_time TEXT,
+    arr_time TEXT
+);
+CREATE INDEX IF NOT EXISTS events_key ON events (departure, arrival, travel_date, train, seat, at);
+"""
+
+def route_key(train_info):
+    """(출발역, 도착역, 'YYYYMMDD') - 날짜는 '2026/10/20(화)' 형식에서 변환"""
+    travel_date = train_info['date'].split('(')[0].replace('/', '').replace('-', '')
+    return train_info['departure'], train_info['arrival'], travel_date
+
+class HistoryRun:
+    """조회 한 번(search_and_reserve)의 기록 (record를 ChangeDetector.listeners에 등록)"""
+
+    def __init__(self, store, train_info):
+        self.store = store
+        self.id = uuid.uuid4().hex[:12]
+        self.route = route_key(train_info)
+        store._put('run_start', (self.id, time.time()) + self.route)
+
+    def record(self, event):
+        self.store._put('event', (self.id, event.at) + self.route + (
+            event.number, event.seat, event.kind, event.dep_time, event.arr_time))
+
+    def close(self):
+        self.store._put('run_end', (time.time(), self.id))
+
+class HistoryStore:
+    """좌석 변경 이벤트를 SQLite에 저장
+
+    조회 루프는 큐에 넣기만 하고 실제 쓰기(커밋)는 별도 스레드에서 모아서 한다.
+    예약 가능 이벤트가 난 바로 그 사이클에 디스크 쓰기를 기다리지 않기 위해서다.
+    """
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings['history_file']이 빈 문자열이면 None"""
+        path = settings.get('history_file', HISTORY_FILE)
+        return cls(path) if path else None
+
+    def open_run(self, train_info):
+        return HistoryRun(self, train_info)
+
+    def close(self, timeout=5):
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _put(self, kind, values):
+        self._queue.put((kind, values))
+
+    def _run(self):
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            logger.warning("기록 파일을 열지 못했습니다: %s", e)
+            # 큐는 계속 비워서 조회 쪽이 막히지 않게 함
+            while self._queue.get() is not None:
+                pass
+            return
+
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            # 쌓여 있는 항목을 모아서 한 번에 커밋
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with connection:
+                    for item in batch:
+                        if item is None:
+                            stopping = True
+                            continue
+                        self._write(connection, *item)
+            except sqlite3.Error as e:
+                logger.warning("기록 저장 실패: %s", e)
+        connection.close()
+
+    @staticmethod
+    def _write(connection, kind, values):
+        if kind == 'event':
+            connection.execute(
+                "INSERT INTO events (run, at, departure, arrival, travel_date, train, seat, kind, dep_time, arr_time)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+        elif kind == 'run_start':
+            connection.execute(
+                "INSERT INTO runs (id, started, departure, arrival, travel_date) VALUES (?, ?, ?, ?, ?)", values)
+        elif kind == 'run_end':
+            connection.execute("UPDATE runs SET ended = ? WHERE id = ?", values)
+
+# ---- 조회 도우미 ----
+
+def _connect(path):
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    return connection
+
+def _filters(departure, arrival, since, column):
+    clauses, params = [], []
+    if departure:
+        clauses.append("departure = ?")
+        params.append(departure)
+    if arrival:
+        clauses.append("arrival = ?")
+        params.append(arrival)
+    if since:
+        clauses.append(f"{column} >= ?")
+        params.append(since)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+def load_events(path=HISTORY_FILE, departure=None, arrival=None, since=None):
+    """이벤트 목록 (시간순, dict)"""
+    where, params = _filters(departure, arrival, since, "at")
+    with closing(_connect(path)) as connection:
+        rows = connection.execute(f"SELECT * FROM events{where} ORDER BY at", params).fetchall()
+    return [dict(row) for row in rows]
+
+def release_windows(events):
+    """예약 가능해진 이벤트마다 다시 매진될 때까지 걸린 초 ([(이벤트, 초 또는 None)])
+
+    같은 조회(run) 안에서 같은 열차/좌석의 다음 sold_out 이벤트와 짝을 짓는다.
+    조회가 끝날 때까지 매진되지 않았으면 None.
+    """
+    opened = {}
+    windows = []
+    for event in events:
+        key = (event['run'], event['travel_date'], event['train'], event['seat'])
+        if event['kind'] == 'available':
+            opened[key] = len(windows)
+            windows.append((event, None))
+        elif event['kind'] == 'sold_out' and key in opened:
+            index = opened.pop(key)
+            windows[index] = (windows[index][0], event['at'] - windows[index][0]['at'])
+    return windows
+
+def polled_minutes_by_hour(path=HISTORY_FILE, departure=None, arrival=None, since=None):
+    """시(0~23)별로 실제 조회하고 있던 시간(분) - 조회하지 않은 시간대의 0건과 구분하기 위해 사용"""
+    where, params = _filters(departure, arrival, since, "started")
+    minutes = defaultdict(float)
+    with closing(_connect(path)) as connection:
+        runs = connection.execute(f"SELECT started, ended FROM runs{where}", params).fetchall()
+    for started, ended in runs:
+        if ended is None:
+            continue
+        current = started
+        while current < ended:
+            moment = datetime.fromtimestamp(current)
+            next_hour = moment.replace(minute=0, second=0, microsecond=0).timestamp() + 3600
+            segment_end = min(ended, next_hour)
+            minutes[moment.hour] += (segment_end - current) / 60
+            current = segment_end
+    return minutes
+
+def hourly_summary(path=HISTORY_FILE, departure=None, arrival=None, since=None):
+    """시간대(감지 시각의 시)별 취소표 풀림 요약
+
+    releases: 예약 가능 이벤트 수, polled_minutes: 그 시간대에 조회한 시간,
+    per_hour: 조회 1시간당 풀린 횟수, median_open: 다시 매진되기까지 걸린 초의 중앙값
+    """
+    windows = release_windows(load_events(path, departure, arrival, since))
+    polled = polled_minutes_by_hour(path, departure, arrival, since)
+    releases = defaultdict(int)
+    durations = defaultdict(list)
+    for event, seconds in windows:
+        hour = datetime.fromtimestamp(event['at']).hour
+        releases[hour] += 1
+        if seconds is not None:
+            durations[hour].append(seconds)
+
+    summary = []
+    for hour in range(24):
+        minutes = polled.get(hour, 0.0)
+        summary.append({
+            'hour': hour,
+            'releases': releases[hour],
+            'polled_minutes': minutes,
+            'per_hour': releases[hour] / (minutes / 60) if minutes else None,
+            'median_open': statistics.median(durations[hour]) if durations[hour] else None
+        })
+    return summary
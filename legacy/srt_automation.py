@@ -9,6 +9,7 @@ from selenium.webdriver.support.ui import Select
 import time
 import os
 from version import VERSION
+from schedule_parser import GENERAL_COLUMN, SPECIAL_COLUMN, parse_schedule_html
 
 def setup_driver():
     service = Service(ChromeDriverManager().install())
@@ -18,47 +19,6 @@ def setup_driver():
     wait = WebDriverWait(driver, 10)
     return driver, wait
 
-def parse_train_info(row):
-    try:
-        cols = row.find_elements(By.TAG_NAME, "td")
-        train_type = cols[1].text.split('\n')[0]  # 열차종류
-        train_number = cols[2].text.strip()  # 열차번호
-        # 출발역/도착역에서 시간 추출
-        dep_info = cols[3].text.strip().split('\n')
-        dep_time = dep_info[1] if len(dep_info) > 1 else dep_info[0]
-        arr_info = cols[4].text.strip().split('\n')
-        arr_time = arr_info[1] if len(arr_info) > 1 else arr_info[0]
-        
-        # 특실 예약 버튼 찾기 (열 5)
-        special_button = None
-        special_text = cols[5].text
-        # "예약하기" 또는 "예약 하기" 둘 다 체크
-        if "예약" in special_text and "하기" in special_text and "매진" not in special_text:
-            special_buttons = cols[5].find_elements(By.CSS_SELECTOR, "a.btn_burgundy_dark")
-            if special_buttons:
-                special_button = special_buttons[0]
-        
-        # 일반실 예약 버튼 찾기 (열 6)
-        general_button = None
-        general_text = cols[6].text
-        # "예약하기" 또는 "예약 하기" 둘 다 체크
-        if "예약" in general_text and "하기" in general_text and "매진" not in general_text:
-            general_buttons = cols[6].find_elements(By.CSS_SELECTOR, "a.btn_burgundy_dark")
-            if general_buttons:
-                general_button = general_buttons[0]
-        
-        return {
-            'type': train_type,
-            'number': train_number,
-            'dep_time': dep_time,
-            'arr_time': arr_time,
-            'special_button': special_button,
-            'general_button': general_button
-        }
-    except Exception as e:
-        print(f"열차 정보 파싱 중 오류: {str(e)}")
-        return None
-
 def time_diff_minutes(time1, time2):
     h1, m1 = map(int, time1.split(':'))
     h2, m2 = map(int, time2.split(':'))
@@ -66,40 +26,60 @@ def time_diff_minutes(time1, time2):
 
 def find_available_train(driver, wait, target_time, time_tolerance, seat_types, passenger_count=1):
     try:
-        # 조회 결과 테이블 찾기
-        table = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody")))
-        rows = table.find_elements(By.TAG_NAME, "tr")
+        # 조회 결과 테이블 대기 후 page_source를 한 번에 파싱 (셀마다 WebDriver 호출하지 않음)
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody")))
+        records = parse_schedule_html(driver.page_source)
+        rows = None
         
         available_trains = []
         target_time_str = f"{target_time}:00"
         
-        for row in rows:
-            train_info = parse_train_info(row)
-            if not train_info:
+        for record in records:
+            if record.cols < 7:
                 continue
                 
             # SRT만 선택
-            if train_info['type'] != 'SRT':
+            if record.train_type != 'SRT' or not record.dep_time:
                 continue
                 
             # 허용 시간 범위 내에 있는지 확인
-            time_difference = time_diff_minutes(target_time_str, train_info['dep_time'])
+            time_difference = time_diff_minutes(target_time_str, record.dep_time)
             if time_difference > time_tolerance:
                 continue
                 
             # 선택된 좌석 유형에 따라 예약 가능 여부 확인
-            available_buttons = []
+            available_seats = []
             
-            if seat_types.get('special', False) and train_info['special_button']:
-                available_buttons.append(('특실', train_info['special_button']))
+            if seat_types.get('special', False) and record.special == 'available':
+                available_seats.append(('특실', SPECIAL_COLUMN))
                 
-            if seat_types.get('general', False) and train_info['general_button']:
-                available_buttons.append(('일반실', train_info['general_button']))
+            if seat_types.get('general', False) and record.general == 'available':
+                available_seats.append(('일반실', GENERAL_COLUMN))
+            
+            if not available_seats:
+                continue
+            
+            # 조건에 맞는 행만 버튼 요소를 찾음
+            if rows is None:
+                rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
+            if record.index >= len(rows):
+                continue
+            cols = rows[record.index].find_elements(By.TAG_NAME, "td")
+            available_buttons = []
+            for seat_type, column in available_seats:
+                buttons = cols[column].find_elements(By.CSS_SELECTOR, "a.btn_burgundy_dark")
+                if buttons:
+                    available_buttons.append((seat_type, buttons[0]))
             
             if available_buttons:
-                train_info['time_diff'] = time_difference
-                train_info['available_buttons'] = available_buttons
-                available_trains.append(train_info)
+                available_trains.append({
+                    'type': record.train_type,
+                    'number': record.number,
+                    'dep_time': record.dep_time,
+                    'arr_time': record.arr_time,
+                    'time_diff': time_difference,
+                    'available_buttons': available_buttons
+                })
         
         
         # 다인 예매 정보 표시
@@ -0,0 +1,173 @@
+import threading
+
+from logger import get_logger
+
+logger = get_logger("locators")
+
+# 이름 -> 우선순위 순 선택자 (id / CSS / 텍스트 / 절대 XPath)
+# 화면 구조가 조금 바뀌어도 남은 선택자 중 하나로 바로 찾도록 여러 방식을 함께 둔다.
+# 절대 XPath는 마지막 수단으로만 사용.
+LOCATORS = {
+    # 로그인
+    'login_id': (
+        "#srchDvNm01",
+        "input[name='srchDvNm01']",
+    ),
+    'login_password': (
+        "#hmpgPwdCphd01",
+        "input[name='hmpgPwdCphd01']",
+    ),
+    'login_submit': (
+        "#login-form input.loginSubmit[type='submit']",
+        "input.submit.btn_pastel2.loginSubmit[type='submit']",
+        "input[type='submit'][value='확인']",
+    ),
+
+    # 조회
+    'departure_input': (
+        "input[name='dptRsStnCdNm']",
+        "input[title='출발역']",
+        "xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[1]/div/div/div[1]/input",
+    ),
+    'arrival_input': (
+        "input[name='arvRsStnCdNm']",
+        "input[title='도착역']",
+        "xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[1]/div/div/div[2]/input",
+    ),
+    'date_select': (
+        "select[name='dptDt']",
+        "select[title='출발일']",
+    ),
+    'time_select': (
+        "select[name='dptTm']",
+        "select[title='출발시간']",
+    ),
+    'search_button': (
+        "input.inquery_btn",
+        "input[type='submit'][value='조회하기']",
+        "xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[2]/input",
+    ),
+
+    # 예약 확인 / 결제
+    'payment_button': (
+        "a.btn_burgundy_dark:has-text('결제하기')",
+        "a:text-is('결제하기')",
+        "xpath=/html/body/div/div[4]/div/div[2]/form/fieldset/div[11]/a[1]",
+    ),
+    'easy_payment_tab': (
+        "#chTab2",
+        "a:text-is('간편결제')",
+    ),
+    'kakao_pay': (
+        "#kakaoPay",
+        "input[name='stlTpCd'][id*='kakao' i]",
+    ),
+    'smartphone_ticket': (
+        "a:text-is('스마트폰 발권')",
+        "xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[11]/div[2]/ul/li[2]/a",
+    ),
+    'final_payment_button': (
+        "input[type='button'][value='결제 및 발권']",
+        "xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[11]/div[11]/input[2]",
+    ),
+
+    # 카카오페이 결제창
+    'kakao_talk_tab': (
+        "button:text-is('카톡결제')",
+        ":is(a, span, [role='tab']):text-is('카톡결제')",
+        "xpath=/html/body/div/main/div/div[1]/div[4]/span",
+    ),
+    'kakao_phone': (
+        "input[name='userPhone']",
+        "input[type='tel'][placeholder*='휴대폰']",
+        "xpath=/html/body/div[1]/main/div/div[2]/div/div[2]/form/div[1]/div/div/span/input",
+    ),
+    'kakao_birth': (
+        "input[name='userBirth']",
+        "input[type='tel'][placeholder*='생년월일']",
+        "xpath=/html/body/div[1]/main/div/div[2]/div/div[2]/form/div[2]/div/div/span/input",
+    ),
+    'kakao_request': (
+        "form button[type='submit']:has-text('결제요청')",
+        "button:has-text('결제요청')",
+        "xpath=/html/body/div[1]/main/div/div[2]/div/div[2]/form/button",
+    ),
+}
+
+# 어느 선택자로 찾았는지 확인할 수 있는 대기 상태 (hidden/detached는 묶음 locator를 그대로 반환)
+MATCH_STATES = ("visible", "attached")
+
+class LocatorRegistry:
+    """이름 붙은 locator를 여러 선택자로 동시에 찾고, 실제로 찾은 선택자를 기억함
+
+    모든 선택자를 Locator.or_로 묶어 한 번에 기다리므로 첫 선택자가 깨져도
+    나머지 중 하나가 나타나는 즉시 진행한다 (깨진 선택자 때문에 시간 초과까지 기다리지 않음).
+    찾은 선택자는 프로세스 안에서 공유되어 다음부터는 그 선택자를 먼저 확인한다.
+    """
+
+    def __init__(self, locators=None):
+        self.locators = dict(LOCATORS if locators is None else locators)
+        self.winners = {}
+        self._lock = threading.Lock()
+
+    def strategies(self, name):
+        """시도 순서: 마지막으로 찾은 선택자 -> 등록 순서"""
+        selectors = self.locators[name]
+        winner = self.winners.get(name)
+        if winner is None or winner == selectors[0]:
+            return selectors
+        return (winner,) + tuple(s for s in selectors if s != winner)
+
+    def race(self, page, name):
+        """등록된 선택자 중 어느 하나에라도 맞는 첫 요소 (대기 없이 locator만 만듦)"""
+        selectors = self.strategies(name)
+        locator = page.locator(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(page.locator(selector))
+        return locator.first
+
+    def resolve(self, page, name, state="visible", timeout=None):
+        """선택자들을 동시에 기다린 뒤 찾은 선택자의 locator를 반환 (없으면 시간 초과 예외)
+
+        기억한 선택자로 이미 찾을 수 있으면 동시 대기와 확인 없이 바로 반환한다 (조회 버튼처럼 매번 찾는 요소).
+        """
+        winner = self.winners.get(name)
+        if winner is not None and state in MATCH_STATES:
+            locator = page.locator(winner).first
+            if _matches(locator, state):
+                return locator
+        race = self.race(page, name)
+        race.wait_for(state=state, timeout=timeout)
+        if state not in MATCH_STATES:
+            return race
+        winner = self._identify(page, name, state)
+        if winner is None:
+            # 기다리는 사이 요소가 다시 그려진 경우 등: 묶음 locator를 그대로 사용
+            return race
+        return page.locator(winner).first
+
+    def _identify(self, page, name, state):
+        """어느 선택자로 찾았는지 확인 (state가 visible이면 보이는 요소만 인정)"""
+        for selector in self.strategies(name):
+            if _matches(page.locator(selector).first, state):
+                break
+        else:
+            return None
+        with self._lock:
+            previous = self.winners.get(name)
+            self.winners[name] = selector
+        if selector != previous and selector != self.locators[name][0]:
+            logger.warning("선택자 대체: %s -> %s", name, selector)
+        return selector
+
+def _matches(locator, state):
+    """locator가 기다린 상태를 이미 만족하는지 (대기 없이 한 번만 확인)"""
+    if state == "visible":
+        return locator.is_visible()
+    return locator.count() > 0
+
+# 기본 레지스트리 (자동화 코드 전체에서 공유)
+registry = LocatorRegistry()
+
+def resolve(page, name, state="visible", timeout=None):
+    return registry.resolve(page, name, state, timeout)
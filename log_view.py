@@ -0,0 +1,112 @@
+from datetime import datetime
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QPlainTextEdit
+
+# 사이클마다 반복되는 메시지 ("열차 없음"으로 끝나면 카운터 한 줄로 합침)
+CYCLE_MESSAGES = ("새로운 검색 시도...", "조회하기 버튼 클릭 완료", "조회 완료")
+NO_TRAIN_MESSAGE = "예약 가능한 열차가 없습니다"
+
+# 카운터 줄 자리 표시
+_COUNTER = object()
+
+class LogView(QPlainTextEdit):
+    """줄 수 상한이 있고 타이머로 모아서 그리는 진행 로그
+
+    - setMaximumBlockCount로 오래된 줄은 자동으로 버림
+    - append()는 버퍼에만 넣고 flush_interval(ms)마다 한 번에 그림
+    - "검색 시도 -> 조회 완료 -> 열차 없음" 사이클은 마지막 줄의 카운터만 갱신
+    """
+
+    def __init__(self, parent=None, max_lines=2000, flush_interval=100):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+        self._pending = []
+        self._held = []
+        self._count = 0
+        self._last_no_train = None
+        self._counter_in_doc = False
+        self._counter_dirty = False
+        self._replace_last = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, message):
+        key = message.strip()
+        if key.startswith(NO_TRAIN_MESSAGE):
+            # 이번 사이클의 시도/조회 완료 줄은 카운터로 대신함
+            self._held.clear()
+            self._count += 1
+            self._last_no_train = datetime.now()
+            if self._counter_in_doc:
+                self._counter_dirty = True
+            elif _COUNTER not in self._pending:
+                self._pending.append(_COUNTER)
+        elif key in CYCLE_MESSAGES:
+            self._held.append(message)
+        else:
+            self._finish_counter()
+            self._pending.extend(self._held)
+            self._held.clear()
+            self._pending.append(message)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def clear(self):
+        self._pending.clear()
+        self._held.clear()
+        self._count = 0
+        self._counter_in_doc = False
+        self._counter_dirty = False
+        self._replace_last = None
+        super().clear()
+
+    def flush(self):
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+
+        if self._replace_last is not None:
+            self._set_last_line(self._replace_last)
+            self._replace_last = None
+        elif self._counter_in_doc and self._counter_dirty:
+            self._set_last_line(self._counter_text())
+            self._counter_dirty = False
+
+        for item in self._pending:
+            if item is _COUNTER:
+                self.appendPlainText(self._counter_text())
+                self._counter_in_doc = True
+                self._counter_dirty = False
+            else:
+                self.appendPlainText(item)
+        self._pending.clear()
+
+        # 사용자가 위로 스크롤해 둔 경우에는 위치 유지
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _finish_counter(self):
+        """카운터 줄을 현재 값으로 고정하고 다음 "열차 없음"부터 새 카운터 시작"""
+        if not self._count:
+            return
+        text = self._counter_text()
+        if self._pending and self._pending[-1] is _COUNTER:
+            self._pending[-1] = text
+        elif self._counter_in_doc and self._counter_dirty:
+            self._replace_last = text
+        self._count = 0
+        self._counter_in_doc = False
+        self._counter_dirty = False
+
+    def _counter_text(self):
+        return f"⏳ 예약 가능한 열차 없음 × {self._count} (마지막 조회 {self._last_no_train:%H:%M:%S})"
+
+    def _set_last_line(self, text):
+        cursor = QTextCursor(self.document().lastBlock())
+        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(text)
@@ -0,0 +1,108 @@
+import atexit
+import itertools
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+LOGGER_NAME = "srt_hunter"
+DEFAULT_LEVEL = "INFO"
+
+_listener = None
+_lock = threading.Lock()
+_run_ids = itertools.count(1)
+
+def get_logger(name=None):
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+class _DeferredQueueHandler(QueueHandler):
+    """레코드를 그대로 큐에 넣고 메시지 조립(% 포맷팅)은 리스너 스레드에서 하도록 미룸"""
+
+    def prepare(self, record):
+        return record
+
+class _SinkChange:
+    """큐 순서대로 출력 대상을 추가/제거하기 위한 표시 (앞서 쌓인 로그를 먼저 내보냄)"""
+
+    def __init__(self, handler, add):
+        self.handler = handler
+        self.add = add
+
+class _Listener(QueueListener):
+    def handle(self, record):
+        if isinstance(record, _SinkChange):
+            if record.add:
+                self.handlers = self.handlers + (record.handler,)
+            else:
+                self.handlers = tuple(h for h in self.handlers if h is not record.handler)
+            return
+        super().handle(record)
+
+class SignalHandler(logging.Handler):
+    """로그 메시지를 Qt 시그널(progress_signal)로 보냄 (리스너 스레드에서 호출됨)"""
+
+    def __init__(self, signal, level=logging.INFO):
+        super().__init__(level)
+        self.signal = signal
+        self.setFormatter(logging.Formatter("%(message)s"))
+
+    def emit(self, record):
+        try:
+            self.signal.emit(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+def setup_logging(level=None):
+    """srt_hunter 로거를 큐 하나로 모으고 별도 스레드에서 콘솔 등으로 내보냄 (여러 번 불러도 한 번만 설정)
+
+    level: "DEBUG" / "INFO" / ... (없으면 SRT_HUNTER_LOG_LEVEL 환경변수, 기본 INFO)
+    호출한 스레드에서는 레벨 확인과 큐에 넣기만 하므로 조회 루프를 막지 않는다.
+    """
+    global _listener
+    root = get_logger()
+    level = (level or os.environ.get('SRT_HUNTER_LOG_LEVEL') or DEFAULT_LEVEL).upper()
+    root.setLevel(getattr(logging, level, logging.INFO))
+    with _lock:
+        if _listener is not None:
+            return _listener
+        records = queue.SimpleQueue()
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter("%(message)s"))
+        _listener = _Listener(records, console, respect_handler_level=True)
+        _listener.start()
+        # 종료 시 큐에 남은 로그까지 내보냄
+        atexit.register(_listener.stop)
+        root.addHandler(_DeferredQueueHandler(records))
+        root.propagate = False
+        return _listener
+
+def add_sink(handler):
+    _listener.queue.put(_SinkChange(handler, True))
+
+def remove_sink(handler):
+    _listener.queue.put(_SinkChange(handler, False))
+
+def open_run_logger(settings, progress_signal=None):
+    """실행 하나의 로거를 settings['logger']에 준비 (이미 있으면 그대로 사용)
+
+    progress_signal이 있으면 이 실행의 메시지만 GUI로 보낸다. 직접 만든 경우 True 반환.
+    """
+    if settings.get('logger') is not None:
+        return False
+    setup_logging(settings.get('log_level'))
+    run_logger = get_logger(f"run{next(_run_ids)}")
+    settings['logger'] = run_logger
+    if progress_signal is not None:
+        handler = SignalHandler(progress_signal)
+        handler.addFilter(logging.Filter(run_logger.name))
+        add_sink(handler)
+        settings['log_sink'] = handler
+    return True
+
+def close_run_logger(settings):
+    settings.pop('logger', None)
+    handler = settings.pop('log_sink', None)
+    if handler is not None:
+        remove_sink(handler)
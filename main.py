@@ -1,9 +1,15 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from gui_app import MainWindow
 from version import VERSION
 
 def main():
+    # --cli 작업파일: PyQt를 불러오지 않고 명령줄로 실행
+    if len(sys.argv) > 1 and sys.argv[1] == "--cli":
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[2:]))
+
+    from PyQt6.QtWidgets import QApplication
+    from gui_app import MainWindow
+
     app = QApplication(sys.argv)
     app.setApplicationName("SRT Hunter")
     app.setOrganizationName("Lambda")
@@ -12,4 +18,4 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
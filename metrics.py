@@ -0,0 +1,233 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 브라우저 메모리 측정용 (없으면 리눅스에서는 /proc에서 읽음)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+SEARCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SCAN_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+# 분당 조회 수 계산에 쓰는 구간 (초)
+POLL_WINDOW = 60
+
+WORKER_STATES = ('idle', 'starting', 'searching', 'reserving', 'payment', 'reserved', 'failed', 'stopped')
+
+# 구간 종료 시 바뀌는 작업 상태 (tracing 구간 이름 기준)
+SPAN_STATES = {
+    'fill_form': 'searching',
+    'reserve': 'reserving',
+    'payment_popup': 'payment'
+}
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def lines(self, name):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield f'{name}_bucket{{le="{bound}"}} {total}'
+        total += self.counts[-1]
+        yield f'{name}_bucket{{le="+Inf"}} {total}'
+        yield f'{name}_sum {self.sum:.6f}'
+        yield f'{name}_count {total}'
+
+class Metrics:
+    """실행 중인 헌터의 조회 횟수/지연 시간/오류/상태를 모아 Prometheus 텍스트로 내보냄
+
+    tracing.Tracer의 listeners에 observe_span을 등록하면 구간 기록에서 값을 채운다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.polls = 0
+        self.recent_polls = deque()
+        self.cycles = {}
+        self.errors = {}
+        self.search_latency = Histogram(SEARCH_BUCKETS)
+        self.scan_time = Histogram(SCAN_BUCKETS)
+        self.state = 'idle'
+        self.state_since = time.time()
+
+    def set_state(self, state):
+        with self.lock:
+            if state != self.state:
+                self.state = state
+                self.state_since = time.time()
+
+    def observe_span(self, record):
+        name = record['span']
+        outcome = record['outcome']
+        seconds = record['ms'] / 1000
+        with self.lock:
+            if name == 'search':
+                self.polls += 1
+                now = time.monotonic()
+                self.recent_polls.append(now)
+                self._prune_polls(now)
+                if outcome == 'ok':
+                    self.search_latency.observe(seconds)
+            elif name == 'scan':
+                self.scan_time.observe(seconds)
+            elif name == 'cycle':
+                self.cycles[outcome] = self.cycles.get(outcome, 0) + 1
+                if outcome == 'error':
+                    error = record.get('error', 'Exception')
+                    self.errors[error] = self.errors.get(error, 0) + 1
+        if name == 'cycle' and outcome != 'reserved':
+            self.set_state('searching')
+        elif name in SPAN_STATES and outcome == 'ok':
+            self.set_state(SPAN_STATES[name])
+
+    def _prune_polls(self, now):
+        cutoff = now - POLL_WINDOW
+        while self.recent_polls and self.recent_polls[0] < cutoff:
+            self.recent_polls.popleft()
+
+    def polls_per_minute(self):
+        with self.lock:
+            self._prune_polls(time.monotonic())
+            return len(self.recent_polls)
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4)"""
+        per_minute = self.polls_per_minute()
+        rss = browser_rss_bytes()
+        with self.lock:
+            lines = [
+                "# HELP srt_hunter_polls_total Schedule searches sent.",
+                "# TYPE srt_hunter_polls_total counter",
+                f"srt_hunter_polls_total {self.polls}",
+                "# HELP srt_hunter_polls_per_minute Schedule searches in the last 60 seconds.",
+                "# TYPE srt_hunter_polls_per_minute gauge",
+                f"srt_hunter_polls_per_minute {per_minute}",
+                "# HELP srt_hunter_search_latency_seconds Time from search request to parsed results.",
+                "# TYPE srt_hunter_search_latency_seconds histogram",
+                *self.search_latency.lines("srt_hunter_search_latency_seconds"),
+                "# HELP srt_hunter_scan_seconds Time spent selecting a train from the results.",
+                "# TYPE srt_hunter_scan_seconds histogram",
+                *self.scan_time.lines("srt_hunter_scan_seconds"),
+                "# HELP srt_hunter_cycles_total Search cycles by outcome.",
+                "# TYPE srt_hunter_cycles_total counter",
+                *(f'srt_hunter_cycles_total{{outcome="{outcome}"}} {count}'
+                  for outcome, count in sorted(self.cycles.items())),
+                "# HELP srt_hunter_errors_total Failed search cycles by exception type.",
+                "# TYPE srt_hunter_errors_total counter",
+                *(f'srt_hunter_errors_total{{type="{error}"}} {count}'
+                  for error, count in sorted(self.errors.items())),
+                "# HELP srt_hunter_worker_state Current reservation worker state (1 = active).",
+                "# TYPE srt_hunter_worker_state gauge",
+                *(f'srt_hunter_worker_state{{state="{state}"}} {int(state == self.state)}'
+                  for state in WORKER_STATES),
+                "# HELP srt_hunter_worker_state_since_seconds Unix time the current state started.",
+                "# TYPE srt_hunter_worker_state_since_seconds gauge",
+                f"srt_hunter_worker_state_since_seconds {self.state_since:.3f}"
+            ]
+        if rss is not None:
+            lines += [
+                "# HELP srt_hunter_browser_rss_bytes Resident memory of browser processes started by this app.",
+                "# TYPE srt_hunter_browser_rss_bytes gauge",
+                f"srt_hunter_browser_rss_bytes {rss}"
+            ]
+        return "\n".join(lines) + "\n"
+
+def browser_rss_bytes():
+    """이 프로세스가 띄운 하위 프로세스(Playwright 드라이버/Chromium)의 RSS 합계 (측정할 수 없으면 None)"""
+    if psutil is None:
+        return _proc_rss_bytes()
+    total = 0
+    try:
+        children = psutil.Process(os.getpid()).children(recursive=True)
+    except psutil.Error:
+        return None
+    for child in children:
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            continue
+    return total
+
+def _proc_status(pid):
+    """/proc/<pid>/status -> {필드: 값} (읽을 수 없으면 None)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            return dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return None
+
+def _proc_rss_bytes():
+    """psutil이 없을 때 /proc에서 하위 프로세스 RSS 합계를 구함 (리눅스가 아니면 None)"""
+    try:
+        pids = [int(name) for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return None
+    children = {}
+    rss = {}
+    for pid in pids:
+        status = _proc_status(pid)
+        if status is None or 'PPid' not in status:
+            continue
+        children.setdefault(int(status['PPid']), []).append(pid)
+        # 커널 스레드 등은 VmRSS가 없음, 값은 kB 단위
+        rss[pid] = int(status.get('VmRSS', '0 kB').split()[0]) * 1024
+    total = 0
+    pending = list(children.get(os.getpid(), []))
+    while pending:
+        pid = pending.pop()
+        total += rss.get(pid, 0)
+        pending.extend(children.get(pid, []))
+    return total
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.server.metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class MetricsServer:
+    """Metrics를 http://host:port/metrics 로 노출하는 로컬 서버 (기본: localhost만)"""
+
+    def __init__(self, metrics, port, host="127.0.0.1"):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.metrics = self.metrics
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="MetricsServer", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
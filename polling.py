@@ -0,0 +1,233 @@
+import random
+import re
+import time
+from collections import deque
+from datetime import datetime
+
+# 점검/과부하 안내 페이지에 나오는 문구
+MAINTENANCE_PATTERN = re.compile(r'시스템\s*점검|서비스\s*점검|점검\s*중|접속\s*대기|접속자가\s*많아')
+
+class MaintenanceError(Exception):
+    """조회 응답이 점검/과부하 안내 페이지일 때"""
+
+def is_maintenance_page(html, status=None):
+    if status == 503:
+        return True
+    return bool(html) and MAINTENANCE_PATTERN.search(html) is not None
+
+# 조회 계획 모드: fast = 기본 간격, pause = 조회 멈춤, 숫자 = 최소 간격(초)
+FAST = 'fast'
+PAUSE = 'pause'
+
+PLAN_ENTRY_PATTERN = re.compile(r'^(?:(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})|\*)\s+(\S+)$')
+PLAN_SEPARATOR = re.compile(r'[,;\n]')
+
+DAY_MINUTES = 24 * 60
+
+class PollingPlan:
+    """시간대별 조회 속도 계획
+
+    예: "07:00-07:20 fast, 01:00-06:00 pause, * 3"
+        07:00~07:20은 기본 간격(refresh_interval), 01:00~06:00은 조회 멈춤,
+        그 밖의 시간은 최소 3초 간격. 자정을 넘는 구간(23:00-01:00)도 가능하고,
+        구간이 겹치면 앞에 쓴 것을 따른다. '*'가 없으면 나머지 시간은 fast.
+    """
+
+    def __init__(self, windows=(), default=FAST):
+        self.windows = list(windows)    # [(시작 분, 끝 분, 모드, 원문)]
+        self.default = default
+        self.boundaries = sorted({minute for start, end, _, _ in self.windows for minute in (start, end)})
+
+    @staticmethod
+    def parse_mode(value):
+        value = value.lower()
+        if value in (FAST, PAUSE):
+            return value
+        try:
+            seconds = float(value)
+        except ValueError:
+            raise ValueError(f"조회 계획의 모드를 알 수 없습니다: {value} (fast / pause / 초)")
+        if seconds < 0:
+            raise ValueError(f"조회 계획의 간격은 0 이상이어야 합니다: {value}")
+        return seconds
+
+    @classmethod
+    def parse(cls, text):
+        """설정 문자열 -> PollingPlan (빈 문자열이면 None)"""
+        windows = []
+        default = FAST
+        for entry in PLAN_SEPARATOR.split(text or ""):
+            entry = entry.strip()
+            if not entry:
+                continue
+            match = PLAN_ENTRY_PATTERN.match(entry)
+            if not match:
+                raise ValueError(f"조회 계획 형식 오류: '{entry}' (예: 07:00-07:20 fast)")
+            start_hour, start_min, end_hour, end_min, mode = match.groups()
+            mode = cls.parse_mode(mode)
+            if start_hour is None:
+                default = mode
+                continue
+            start = int(start_hour) * 60 + int(start_min)
+            end = int(end_hour) * 60 + int(end_min)
+            if start >= DAY_MINUTES or end > DAY_MINUTES or int(start_min) > 59 or int(end_min) > 59:
+                raise ValueError(f"조회 계획의 시각이 잘못되었습니다: '{entry}'")
+            if start == end % DAY_MINUTES:
+                raise ValueError(f"조회 계획의 시작과 끝이 같습니다: '{entry}'")
+            windows.append((start, end % DAY_MINUTES, mode, entry))
+        if not windows:
+            if default == PAUSE:
+                raise ValueError("조회 계획이 하루 종일 pause입니다.")
+            if default == FAST:
+                return None
+        return cls(windows, default)
+
+    @staticmethod
+    def _contains(start, end, minute):
+        if start <= end:
+            return start <= minute < end
+        # 자정을 넘는 구간
+        return minute >= start or minute < end
+
+    def current(self, now):
+        """(모드, 설명, 다음 구간 경계까지 남은 초 또는 None)"""
+        minute_of_day = now.hour * 60 + now.minute + (now.second + now.microsecond / 1e6) / 60
+        for start, end, mode, label in self.windows:
+            if self._contains(start, end, minute_of_day):
+                break
+        else:
+            mode, label = self.default, f"* {self.default}"
+        if not self.boundaries:
+            return mode, label, None
+        later = [b for b in self.boundaries if b > minute_of_day]
+        boundary = later[0] if later else self.boundaries[0] + DAY_MINUTES
+        return mode, label, (boundary - minute_of_day) * 60
+
+class PollScheduler:
+    """조회 사이클 사이의 대기 시간 결정
+
+    - 기본 간격(refresh_interval)을 최소값으로, 서버 응답 시간이 길어지면 그 비율만큼 늘림
+    - 최근 사이클의 오류 비율만큼 간격을 늘리고, 연속 실패는 지수적으로 물러남
+      (점검 페이지는 더 긴 간격부터 시작)
+    - 사이클 시작 간격이 1 / max_rate초보다 짧아지지 않게 제한
+    - 여러 대가 같은 박자로 몰리지 않도록 최대 jitter 비율만큼 간격을 늘리는 흔들림 추가
+      (최소 간격 아래로는 줄이지 않음)
+    - 조회 계획(PollingPlan)이 있으면 시간대에 따라 간격을 늘리거나 조회를 멈춤
+    """
+
+    def __init__(self, base_interval=0.05, max_rate=4.0, max_interval=60.0, latency_factor=0.5,
+                 jitter=0.2, error_backoff=1.0, maintenance_backoff=15.0, window=20,
+                 plan=None, clock=time.monotonic, sleep=time.sleep, now=datetime.now):
+        self.base_interval = max(0.0, base_interval)
+        self.min_spacing = 1.0 / max_rate if max_rate and max_rate > 0 else 0.0
+        self.max_interval = max_interval
+        self.latency_factor = latency_factor
+        self.jitter = jitter
+        self.error_backoff = error_backoff
+        self.maintenance_backoff = maintenance_backoff
+        self.outcomes = deque(maxlen=window)
+        self.latency = None
+        self.failures = 0
+        self.plan = plan
+        self.clock = clock
+        self.sleep = sleep
+        self.now = now
+        # 조회 계획 구간이 바뀔 때 호출 (설명 문자열, 모드)
+        self.on_plan_change = None
+        self.plan_label = None
+        # 마지막 wait()가 조회 멈춤 구간을 지나왔는지 (그사이 로그인 세션이 끊겼을 수 있음)
+        self.resumed = False
+        self._delay = 0.0
+        self._last_start = None
+        self._last_end = None
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(
+            base_interval=float(settings.get('refresh_interval', 0.05)),
+            max_rate=float(settings.get('max_poll_rate') or 0),
+            plan=PollingPlan.parse(settings.get('polling_plan'))
+        )
+
+    def error_rate(self):
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def record_success(self, latency):
+        """조회 성공 (latency: 조회 요청부터 결과 준비까지 걸린 초)"""
+        # 응답 시간 지수 이동 평균
+        self.latency = latency if self.latency is None else 0.7 * self.latency + 0.3 * latency
+        self.outcomes.append(True)
+        self.failures = 0
+        delay = max(self.base_interval, self.latency_factor * self.latency)
+        return self._plan(delay * (1 + 4 * self.error_rate()))
+
+    def record_error(self, maintenance=False):
+        """조회 실패, 연속 실패 횟수에 따라 지수적으로 대기 (다음 대기 시간 반환)"""
+        self.outcomes.append(False)
+        self.failures += 1
+        start = self.maintenance_backoff if maintenance else max(self.base_interval, self.error_backoff)
+        return self._plan(start * 2 ** (self.failures - 1))
+
+    def _plan(self, delay):
+        if self.jitter:
+            # 위쪽으로만 흔들어서 refresh_interval보다 짧아지지 않게 함
+            delay *= random.uniform(1, 1 + self.jitter)
+        self._delay = min(delay, self.max_interval)
+        self._last_end = self.clock()
+        return self._delay
+
+    def remaining(self, interval=None):
+        """다음 사이클을 시작하기 전까지 더 기다려야 하는 시간 (초, interval: 조회 계획의 최소 간격)"""
+        if self._last_start is None:
+            return 0.0
+        now = self.clock()
+        waits = [self.min_spacing - (now - self._last_start)]
+        if interval:
+            waits.append(interval - (now - self._last_start))
+        if self._last_end is not None:
+            waits.append(self._delay - (now - self._last_end))
+        return max(0.0, *waits)
+
+    def _plan_now(self):
+        """(모드, 다음 구간 경계까지 남은 초) - 계획이 없으면 (FAST, None)"""
+        if self.plan is None:
+            return FAST, None
+        mode, label, until_change = self.plan.current(self.now())
+        if label != self.plan_label:
+            self.plan_label = label
+            if self.on_plan_change:
+                self.on_plan_change(label, mode)
+        # 경계 시각을 살짝 넘겨서 다음 구간으로 판단되게 함
+        return mode, until_change + 0.01 if until_change is not None else None
+
+    def _sleep(self, delay, stop_event):
+        """delay초 대기, 중단 요청이 오면 True"""
+        if stop_event is not None:
+            return stop_event.wait(delay) if delay > 0 else stop_event.is_set()
+        if delay > 0:
+            self.sleep(delay)
+        return False
+
+    def wait(self, stop_event=None):
+        """다음 사이클까지 대기, 그동안 중단 요청이 오면 False
+
+        조회 계획의 구간이 대기 중에 바뀌면 경계 시각에 깨어나 새 구간 기준으로 다시 계산한다.
+        """
+        self.resumed = False
+        while True:
+            mode, until_change = self._plan_now()
+            if mode == PAUSE:
+                self.resumed = True
+            delay = until_change if mode == PAUSE else self.remaining(None if mode == FAST else mode)
+            clipped = until_change is not None and delay > until_change
+            if clipped:
+                delay = until_change
+            if self._sleep(delay, stop_event):
+                return False
+            if mode != PAUSE and not clipped:
+                break
+        self._last_start = self.clock()
+        self._last_end = None
+        return True
@@ -0,0 +1,210 @@
+import re
+from html import unescape
+from html.parser import HTMLParser
+from typing import NamedTuple, Optional
+
+# lxml이 설치되어 있으면 lxml로, 없으면 미리 컴파일한 정규식으로 파싱
+# (정규식은 조회 결과처럼 tr/td가 모두 닫혀 있는 표에만 맞으므로 깨진 마크업은 'stdlib' 사용)
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+TIME_PATTERN = re.compile(r'(\d{2}:\d{2})')
+TBODY_START = re.compile(r'<tbody\b', re.IGNORECASE)
+TBODY_END = re.compile(r'</tbody\s*>', re.IGNORECASE)
+TBODY_PATTERN = re.compile(r'<tbody\b[^>]*>(.*?)</tbody\s*>', re.IGNORECASE | re.DOTALL)
+ROW_PATTERN = re.compile(r'<tr\b[^>]*>(.*?)</tr\s*>', re.IGNORECASE | re.DOTALL)
+CELL_PATTERN = re.compile(r'<td\b[^>]*>(.*?)</td\s*>', re.IGNORECASE | re.DOTALL)
+LINK_PATTERN = re.compile(r'<a\b[^>]*>(.*?)</a\s*>', re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]*>')
+
+# 좌석 유형별 예약 버튼이 있는 열 (td 인덱스)
+SPECIAL_COLUMN = 5
+GENERAL_COLUMN = 6
+
+class TrainRecord(NamedTuple):
+    index: int                  # 조회 결과 내 행 번호 (tbody tr 기준, td 없는 행도 번호는 셈)
+    cols: int                   # td 개수
+    train_type: str             # 열차종류 (SRT 등)
+    number: str                 # 열차번호
+    dep_time: Optional[str]     # 출발 시각 HH:MM
+    arr_time: Optional[str]     # 도착 시각 HH:MM
+    special: str                # 특실 상태 available / sold_out / none
+    general: str                # 일반실 상태 available / sold_out / none
+    dep_minutes: Optional[int]  # 출발 시각 (자정 기준 분)
+    arr_minutes: Optional[int]  # 도착 시각 (자정 기준 분)
+
+    def seat_state(self, seat_key):
+        return self.special if seat_key == 'special' else self.general
+
+def to_minutes(value):
+    if not value:
+        return None
+    hour, minute = value.split(':')
+    return int(hour) * 60 + int(minute)
+
+def cell_state(text, links):
+    """셀 전체 텍스트와 링크 텍스트로 예약 가능 여부 판단"""
+    if '매진' in text:
+        return 'sold_out'
+    for link in links:
+        link = link.strip()
+        if '예약' in link and '하기' in link and '좌석' not in link:
+            return 'available'
+    return 'none'
+
+def time_of(text):
+    if text is None:
+        return None
+    match = TIME_PATTERN.search(text)
+    return match.group(1) if match else None
+
+def make_record(index, texts, links):
+    """td별 텍스트/링크 텍스트 목록으로 TrainRecord 생성"""
+    count = len(texts)
+    dep_time = time_of(texts[3]) if count > 3 else None
+    arr_time = time_of(texts[4]) if count > 4 else None
+    return TrainRecord(
+        index=index,
+        cols=count,
+        train_type=texts[1].strip().split('\n')[0].strip() if count > 1 else '',
+        number=texts[2].strip() if count > 2 else '',
+        dep_time=dep_time,
+        arr_time=arr_time,
+        special=cell_state(texts[SPECIAL_COLUMN], links[SPECIAL_COLUMN]) if count > SPECIAL_COLUMN else 'none',
+        general=cell_state(texts[GENERAL_COLUMN], links[GENERAL_COLUMN]) if count > GENERAL_COLUMN else 'none',
+        dep_minutes=to_minutes(dep_time),
+        arr_minutes=to_minutes(arr_time)
+    )
+
+def parse_snapshot(rows):
+    """SNAPSHOT_SCRIPT가 돌려준 dict 목록을 TrainRecord 목록으로 변환 (td 없는 행은 제외)"""
+    return [
+        TrainRecord(
+            index=row['index'],
+            cols=row['cols'],
+            train_type=row['type'],
+            number=row['number'],
+            dep_time=row['dep_time'],
+            arr_time=row['arr_time'],
+            special=row['special'],
+            general=row['general'],
+            dep_minutes=to_minutes(row['dep_time']),
+            arr_minutes=to_minutes(row['arr_time'])
+        )
+        for row in rows
+        if row['cols']
+    ]
+
+def _table_fragment(html):
+    """첫 tbody부터 마지막 tbody까지만 잘라서 파싱량을 줄임"""
+    start = TBODY_START.search(html)
+    if not start:
+        return None
+    end = None
+    for end in TBODY_END.finditer(html, start.start()):
+        pass
+    stop = end.end() if end else len(html)
+    return "<table>" + html[start.start():stop] + "</table>"
+
+def _parse_lxml(fragment):
+    doc = lxml_html.fromstring(fragment)
+    records = []
+    rows = [tr for tr in doc.iter('tr') if tr.getparent() is not None and tr.getparent().tag == 'tbody']
+    for index, tr in enumerate(rows):
+        tds = [td for td in tr if td.tag == 'td']
+        if not tds:
+            continue
+        texts = [td.text_content() for td in tds]
+        links = [[a.text_content() for a in td.iter('a')] for td in tds]
+        records.append(make_record(index, texts, links))
+    return records
+
+def _strip_tags(markup):
+    return unescape(TAG_PATTERN.sub('', markup))
+
+def _parse_regex(fragment):
+    # 표가 여러 개면 tbody 사이에 다른 표의 thead 행이 있으므로 tbody 안의 행만 셈
+    records = []
+    index = 0
+    for body in TBODY_PATTERN.finditer(fragment):
+        for row in ROW_PATTERN.finditer(body.group(1)):
+            cells = CELL_PATTERN.findall(row.group(1))
+            if cells:
+                texts = [_strip_tags(cell) for cell in cells]
+                links = [[_strip_tags(link) for link in LINK_PATTERN.findall(cell)] for cell in cells]
+                records.append(make_record(index, texts, links))
+            index += 1
+    return records
+
+class _TableParser(HTMLParser):
+    """tbody 안의 tr/td 텍스트와 링크 텍스트만 모으는 표준 라이브러리 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.records = []
+        self.index = 0
+        self.tbody_depth = 0
+        self.texts = None
+        self.links = None
+        self.text = None
+        self.cell_links = None
+        self.link = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tbody':
+            self.tbody_depth += 1
+        elif not self.tbody_depth:
+            return
+        elif tag == 'tr':
+            self.texts, self.links = [], []
+        elif tag == 'td' and self.texts is not None:
+            self.text, self.cell_links = [], []
+        elif tag == 'a' and self.text is not None:
+            self.link = []
+
+    def handle_endtag(self, tag):
+        if tag == 'tbody':
+            self.tbody_depth = max(0, self.tbody_depth - 1)
+        elif not self.tbody_depth:
+            return
+        elif tag == 'a' and self.link is not None:
+            self.cell_links.append("".join(self.link))
+            self.link = None
+        elif tag == 'td' and self.text is not None:
+            self.texts.append("".join(self.text))
+            self.links.append(self.cell_links)
+            self.text = None
+        elif tag == 'tr' and self.texts is not None:
+            if self.texts:
+                self.records.append(make_record(self.index, self.texts, self.links))
+            self.index += 1
+            self.texts = None
+
+    def handle_data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+            if self.link is not None:
+                self.link.append(data)
+
+def _parse_stdlib(fragment):
+    parser = _TableParser()
+    parser.feed(fragment)
+    parser.close()
+    return parser.records
+
+def parse_schedule_html(html, backend=None):
+    """조회 결과 HTML을 TrainRecord 목록으로 변환 (backend: 'lxml' / 'regex' / 'stdlib' / None=자동)"""
+    fragment = _table_fragment(html)
+    if fragment is None:
+        return []
+    if backend is None:
+        backend = 'lxml' if lxml_html is not None else 'regex'
+    return BACKENDS[backend](fragment)
+
+BACKENDS = {
+    'lxml': _parse_lxml,
+    'regex': _parse_regex,
+    'stdlib': _parse_stdlib
+}
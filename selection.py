@@ -0,0 +1,149 @@
+import logging
+from typing import NamedTuple
+
+from logger import get_logger
+
+logger = get_logger("selection")
+
+# 좌석 키 -> 화면 표기
+SEAT_NAMES = {
+    'general': '일반실',
+    'special': '특실'
+}
+
+# 후보 정렬 기준 (앞 항목일수록 우선)
+# closest: 목표 시각에 가까운 출발 / shortest: 짧은 소요 시간 / seat: 좌석 우선순위
+PREFERENCES = {
+    'closest': ('time_diff', 'seat_rank', 'travel'),
+    'shortest': ('travel', 'time_diff', 'seat_rank'),
+    'seat': ('seat_rank', 'time_diff', 'travel')
+}
+
+DEFAULT_PREFERENCE = 'closest'
+DEFAULT_SEAT_PRIORITY = ('general', 'special')
+
+# 도착 시각을 모를 때의 소요 시간 (정렬에서 맨 뒤로)
+UNKNOWN_TRAVEL = 24 * 60
+
+class Candidate(NamedTuple):
+    row: object                 # schedule_parser.TrainRecord
+    seat_key: str               # general / special
+    dep_time: str               # 비교에 쓴 출발 시각 HH:MM
+    time_diff: int              # 목표 시각부터 출발까지 (분)
+    travel: int                 # 소요 시간 (분)
+    seat_rank: int              # 좌석 우선순위 (0이 가장 우선)
+
+    def as_train(self, candidates=1):
+        """예약 단계에서 쓰는 열차 정보 dict"""
+        return {
+            'dep_time': self.dep_time,
+            'time_diff': self.time_diff,
+            'travel_minutes': self.travel,
+            'row_index': self.row.index,
+            'seat_type': SEAT_NAMES[self.seat_key],
+            'number': self.row.number,
+            'candidates': candidates
+        }
+
+def parse_excluded(value):
+    """'331, 0305 381' -> {'331', '305', '381'} (앞자리 0은 무시)"""
+    if not value:
+        return frozenset()
+    if isinstance(value, str):
+        value = value.replace(',', ' ').split()
+    return frozenset(str(number).strip().lstrip('0') for number in value if str(number).strip())
+
+def parse_seat_priority(value):
+    """'special' 또는 'special,general' -> ('special', 'general')"""
+    if not value:
+        return DEFAULT_SEAT_PRIORITY
+    if isinstance(value, str):
+        value = value.replace(',', ' ').split()
+    order = [key for key in value if key in SEAT_NAMES]
+    order += [key for key in DEFAULT_SEAT_PRIORITY if key not in order]
+    return tuple(order)
+
+class SelectionPolicy:
+    """조회 결과 전체를 한 번 훑어 가장 좋은 (열차, 좌석) 후보 하나를 고름
+
+    허용 시간(target_time ~ target_time + time_tolerance) 안의 SRT 중
+    원하는 좌석이 예약 가능하고 제외 목록에 없는 것만 후보가 되며,
+    preference 순서의 기준으로 비교한다. 비교 값은 schedule_parser가 미리 계산한
+    분 단위 시각으로만 만들므로 브라우저 호출이 없다.
+    """
+
+    def __init__(self, target_time, time_tolerance, seat_types, preference=DEFAULT_PREFERENCE,
+                 seat_priority=DEFAULT_SEAT_PRIORITY, excluded=()):
+        hour, minute = map(int, f"{target_time}:00".split(':')[:2])
+        self.start = hour * 60 + minute
+        self.end = self.start + int(time_tolerance)
+        self.preference = preference if preference in PREFERENCES else DEFAULT_PREFERENCE
+        # 원하는 좌석만 우선순위 순으로 (seat_key, 순위)
+        self.seats = tuple((key, rank) for rank, key in enumerate(
+            key for key in parse_seat_priority(seat_priority) if seat_types.get(key, False)))
+        self.excluded = parse_excluded(excluded)
+        fields = PREFERENCES[self.preference]
+        self._key = lambda candidate: tuple(getattr(candidate, field) for field in fields)
+
+    @classmethod
+    def from_settings(cls, train_info, settings=None):
+        settings = settings or {}
+        return cls(
+            target_time=train_info['target_time'],
+            time_tolerance=int(train_info['time_tolerance']),
+            seat_types=train_info['seat_types'],
+            preference=settings.get('selection_preference') or DEFAULT_PREFERENCE,
+            seat_priority=settings.get('seat_priority'),
+            excluded=settings.get('excluded_trains')
+        )
+
+    def candidates(self, rows):
+        """예약 가능한 (열차, 좌석) 후보를 모두 생성"""
+        for row in rows:
+            if row.cols < 7 or "SRT" not in row.train_type:
+                continue
+            # 출발 시간 (출발역 열, 없으면 도착역 열에서 찾은 시간)
+            if row.dep_time:
+                dep_time, dep_minutes = row.dep_time, row.dep_minutes
+            elif row.arr_time:
+                dep_time, dep_minutes = row.arr_time, row.arr_minutes
+            else:
+                continue
+            if dep_minutes < self.start or dep_minutes > self.end:
+                continue
+            if self.excluded and row.number.lstrip('0') in self.excluded:
+                continue
+
+            if row.dep_time and row.arr_minutes is not None:
+                # 자정을 넘기는 열차
+                travel = (row.arr_minutes - row.dep_minutes) % (24 * 60)
+            else:
+                travel = UNKNOWN_TRAVEL
+            for seat_key, seat_rank in self.seats:
+                if row.seat_state(seat_key) == 'available':
+                    yield Candidate(row, seat_key, dep_time, dep_minutes - self.start, travel, seat_rank)
+
+    def best(self, rows):
+        """(가장 좋은 후보, 후보 수) - 후보가 없으면 (None, 0)"""
+        best = None
+        best_key = None
+        count = 0
+        for candidate in self.candidates(rows):
+            count += 1
+            key = self._key(candidate)
+            # 기준이 같으면 먼저 나온(위쪽) 행 유지
+            if best is None or key < best_key:
+                best, best_key = candidate, key
+        return best, count
+
+    def select(self, rows):
+        """가장 좋은 후보의 열차 정보 dict (없으면 None)"""
+        best, count = self.best(rows)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("찾은 행 수: %d, 후보 %d개 (기준: %s, 좌석 순서: %s, 제외: %s)",
+                         len(rows), count, self.preference,
+                         [SEAT_NAMES[key] for key, _ in self.seats], sorted(self.excluded))
+            if best is not None:
+                logger.debug("선택: %s %s 출발 %s (시간차 %d분, 소요 %d분)", best.row.number,
+                             SEAT_NAMES[best.seat_key], best.dep_time, best.time_diff, best.travel)
+        return best.as_train(count) if best is not None else None
@@ -0,0 +1,59 @@
+import json
+import os
+import time
+
+# 로그인 세션(쿠키/localStorage) 저장 파일
+SESSION_FILE = "session_state.json"
+
+# 저장된 세션을 재사용할 최대 시간 (초)
+# 이보다 오래된 세션은 서버에서 만료됐을 가능성이 높으므로 바로 다시 로그인
+SESSION_MAX_AGE = 30 * 60
+
+def load_session_state(member_id, path=SESSION_FILE, max_age=SESSION_MAX_AGE):
+    """같은 회원번호로 저장된, 만료 전의 storage state를 반환 (없으면 None)"""
+    try:
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get('member_id') != member_id:
+            return None
+        if time.time() - data.get('saved_at', 0) > max_age:
+            return None
+        return data.get('storage_state')
+    except Exception:
+        return None
+
+def save_session_state(context, member_id, path=SESSION_FILE):
+    """현재 컨텍스트의 쿠키/localStorage 저장 (세션 쿠키가 담기므로 본인만 읽을 수 있게)"""
+    data = {
+        'member_id': member_id,
+        'saved_at': time.time(),
+        'storage_state': context.storage_state()
+    }
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+def clear_session_state(path=SESSION_FILE):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def restore_session(context, storage_state):
+    """저장된 쿠키와 localStorage를 이미 만들어진 컨텍스트에 다시 넣기"""
+    if storage_state.get('cookies'):
+        context.add_cookies(storage_state['cookies'])
+    origins = [origin for origin in storage_state.get('origins', []) if origin.get('localStorage')]
+    if origins:
+        # localStorage는 해당 origin 페이지에서만 쓸 수 있으므로 페이지 로드 시점에 채움
+        context.add_init_script(script="""
+            ((origins) => {
+                const saved = origins.find((o) => o.origin === location.origin);
+                if (!saved) return;
+                for (const item of saved.localStorage) {
+                    if (localStorage.getItem(item.name) === null) localStorage.setItem(item.name, item.value);
+                }
+            })(%s)
+        """ % json.dumps(origins))
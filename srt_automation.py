@@ -1,557 +1,878 @@
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+import os
 import time
+from datetime import datetime
 from version import VERSION
+from polling import PAUSE, MaintenanceError, PollScheduler
+from engines import STEP_TIMEOUTS, SessionExpiredError, create_engine
+from tracing import NullTracer, Tracer
+from logger import close_run_logger, get_logger, open_run_logger
+from locators import resolve
+from selection import SelectionPolicy
+from change_detect import ChangeDetector
+from history import HistoryStore
+from clock_sync import DEFAULT_START_LEAD, ClockSync, parse_start_time
+from session_store import (SESSION_FILE, clear_session_state, load_session_state,
+                           restore_session, save_session_state)
 
-def setup_driver():
+logger = get_logger("automation")
+
+# SRT 사이트 기본 주소
+# 로컬 목업 서버(tools/mock_server.py)로 돌릴 때는 SRT_HUNTER_BASE_URL 환경변수나
+# settings['base_url']로 바꿔서 사용
+DEFAULT_BASE_URL = "https://etk.srail.kr"
+
+def get_base_url(settings=None):
+    """settings > 환경변수 > 기본값 순으로 SRT 기본 주소 결정"""
+    base_url = (settings or {}).get('base_url') or os.environ.get('SRT_HUNTER_BASE_URL') or DEFAULT_BASE_URL
+    return base_url.rstrip('/')
+
+# 메모리/GPU 사용을 줄이는 Chromium 옵션 (상시 실행용 서버 등)
+LOW_FOOTPRINT_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-features=Translate,MediaRouter,OptimizationHints',
+    '--no-first-run',
+    '--mute-audio',
+    '--renderer-process-limit=2',
+    '--js-flags=--max-old-space-size=256'
+]
+
+# 브라우저 실행 모드
+# headless: 헤드리스 전용 셸, headless-new: 정식 Chromium의 새 헤드리스 모드,
+# minimal: 작은 창 + 저사양 옵션
+LAUNCH_MODES = {
+    'headed': {
+        'launch': {'headless': False, 'args': ['--start-maximized']},
+        'viewport': {'width': 1920, 'height': 1080}
+    },
+    'headless': {
+        'launch': {'headless': True, 'args': LOW_FOOTPRINT_ARGS},
+        'viewport': {'width': 1280, 'height': 720}
+    },
+    'headless-new': {
+        'launch': {'headless': True, 'channel': 'chromium', 'args': LOW_FOOTPRINT_ARGS},
+        'viewport': {'width': 1280, 'height': 720}
+    },
+    'minimal': {
+        'launch': {'headless': False, 'args': LOW_FOOTPRINT_ARGS + ['--window-size=800,600']},
+        'viewport': {'width': 800, 'height': 600}
+    }
+}
+
+HEADLESS_MODES = ('headless', 'headless-new')
+
+def get_launch_mode(launch_mode):
+    return LAUNCH_MODES.get(launch_mode, LAUNCH_MODES['headed'])
+
+def launch_browser(launch_mode='headed'):
+    """Playwright 드라이버와 Chromium 실행 (빌드본에서 브라우저가 없으면 설치 후 재시도)"""
     import sys
-    import os
     import subprocess
     
+    mode = get_launch_mode(launch_mode)
+    
+    def launch():
+        playwright = sync_playwright().start()
+        try:
+            return playwright, playwright.chromium.launch(**mode['launch'])
+        except Exception:
+            playwright.stop()
+            raise
+    
     # PyInstaller로 빌드된 경우 브라우저 확인 및 설치
     if getattr(sys, 'frozen', False):
         try:
             # 먼저 브라우저가 있는지 시도
-            playwright = sync_playwright().start()
-            browser = playwright.chromium.launch(
-                headless=False,
-                args=['--start-maximized']
-            )
+            return launch()
         except Exception as e:
             if "Executable doesn't exist" in str(e):
-                print("브라우저를 다운로드합니다. 잠시만 기다려주세요...")
+                logger.info("브라우저를 다운로드합니다. 잠시만 기다려주세요...")
                 # playwright install chromium 실행
                 subprocess.run(["playwright", "install", "chromium"], capture_output=False, check=False)
                 # 다시 시도
-                playwright = sync_playwright().start()
-                browser = playwright.chromium.launch(
-                    headless=False,
-                    args=['--start-maximized']
-                )
-            else:
-                raise
-    else:
-        # 개발 환경
-        playwright = sync_playwright().start()
-        browser = playwright.chromium.launch(
-            headless=False,
-            args=['--start-maximized']
-        )
+                return launch()
+            raise
     
+    # 개발 환경
+    return launch()
+
+def new_browser_page(browser, launch_mode='headed'):
+    """실행 모드에 맞는 새 컨텍스트와 페이지 생성"""
     context = browser.new_context(
-        viewport={'width': 1920, 'height': 1080},
+        viewport=get_launch_mode(launch_mode)['viewport'],
         ignore_https_errors=True
     )
     page = context.new_page()
+    return context, page
+
+def setup_driver(launch_mode='headed'):
+    playwright, browser = launch_browser(launch_mode)
+    context, page = new_browser_page(browser, launch_mode)
     return playwright, browser, context, page
 
-def parse_train_info(row):
+def reattach_headed(page):
+    """헤드리스로 진행 중인 페이지를 화면이 있는 브라우저로 다시 열기 (사람이 직접 결제해야 할 때)"""
+    context = page.context
+    headed = LAUNCH_MODES['headed']
+    headed_browser = context.browser.browser_type.launch(**headed['launch'])
     try:
-        cols = row.locator("td").all()
-        train_type = cols[1].text_content().split('\n')[0]  # 열차종류
-        train_number = cols[2].text_content().strip()  # 열차번호
-        # 출발역/도착역에서 시간 추출
-        dep_info = cols[3].text_content().strip().split('\n')
-        dep_time = dep_info[1] if len(dep_info) > 1 else dep_info[0]
-        arr_info = cols[4].text_content().strip().split('\n')
-        arr_time = arr_info[1] if len(arr_info) > 1 else arr_info[0]
-        
-        # td[7]이 일반실 예약 버튼 위치
-        # 특실 예약 버튼 찾기 (열 6 = td[6])
-        special_button = None
-        if len(cols) > 5:
-            special_text = cols[5].text_content().strip()
-            # "예약하기" 또는 "예약 하기" 둘 다 체크
-            if "예약" in special_text and "하기" in special_text and "매진" not in special_text:
-                # span 태그 내의 텍스트를 찾아서 버튼 선택
-                special_buttons = cols[5].locator("a.btn_burgundy_dark").all()
-                if special_buttons:
-                    special_button = special_buttons[0]
-        
-        # 일반실 예약 버튼 찾기 (열 7 = td[7])
-        general_button = None
-        if len(cols) > 6:
-            general_text = cols[6].text_content().strip()
-            # "예약하기" 또는 "예약 하기" 둘 다 체크
-            if "예약" in general_text and "하기" in general_text and "매진" not in general_text:
-                # span 태그 내의 텍스트를 찾아서 버튼 선택
-                general_buttons = cols[6].locator("a.btn_burgundy_dark").all()
-                if general_buttons:
-                    general_button = general_buttons[0]
-        
-        return {
-            'type': train_type,
-            'number': train_number,
-            'dep_time': dep_time,
-            'arr_time': arr_time,
-            'special_button': special_button,
-            'general_button': general_button
-        }
-    except Exception as e:
-        print(f"열차 정보 파싱 중 오류: {str(e)}")
-        return None
+        headed_context = headed_browser.new_context(
+            storage_state=context.storage_state(),
+            viewport=headed['viewport'],
+            ignore_https_errors=True
+        )
+        headed_page = headed_context.new_page()
+        headed_page.goto(page.url, wait_until="domcontentloaded")
+    except Exception:
+        headed_browser.close()
+        raise
+    return headed_page
+
+# 조회 단계에서 막을 리소스 (URL 패턴)
+# context.route("**/*")로 모든 요청을 파이썬까지 왕복시키면 문서/조회 요청도 느려지므로
+# 확장자와 호스트 패턴에 걸리는 요청만 가로챈다.
+RESOURCE_PATTERNS = {
+    'image': "**/*.{png,jpg,jpeg,gif,svg,webp,ico,bmp}*",
+    'font': "**/*.{woff,woff2,ttf,otf,eot}*",
+    'media': "**/*.{mp4,webm,mp3,ogg,wav}*",
+    'stylesheet': "**/*.css*"
+}
+
+# 분석/추적용 외부 호스트
+TRACKING_HOST_PATTERNS = [
+    "**/*google-analytics.com/**",
+    "**/*googletagmanager.com/**",
+    "**/*doubleclick.net/**",
+    "**/*adservice.google.com/**",
+    "**/*facebook.net/**",
+    "**/*wcs.naver.net/**",
+    "**/*scorecardresearch.com/**",
+    "**/*hotjar.com/**"
+]
 
-def time_diff_minutes(time1, time2):
-    h1, m1 = map(int, time1.split(':'))
-    h2, m2 = map(int, time2.split(':'))
-    return abs((h1 * 60 + m1) - (h2 * 60 + m2))
+# 차단 프로필: 막을 리소스 종류와 추적 호스트 차단 여부
+BLOCK_PROFILES = {
+    'off': {'resources': [], 'tracking': False},
+    'standard': {'resources': ['image', 'font', 'media'], 'tracking': True},
+    'aggressive': {'resources': ['image', 'font', 'media', 'stylesheet'], 'tracking': True}
+}
 
-def find_available_train(page, target_time, time_tolerance, seat_types):
+def _abort_route(route):
+    route.abort()
+
+def apply_resource_blocking(context, profile_name):
+    """조회 단계용 리소스 차단 등록, 해제할 때 쓸 패턴 목록 반환"""
+    profile = BLOCK_PROFILES.get(profile_name, BLOCK_PROFILES['standard'])
+    patterns = [RESOURCE_PATTERNS[name] for name in profile['resources']]
+    if profile['tracking']:
+        patterns.extend(TRACKING_HOST_PATTERNS)
+    for pattern in patterns:
+        context.route(pattern, _abort_route)
+    return patterns
+
+def lift_resource_blocking(context, patterns):
+    """리소스 차단 해제 (결제창은 제대로 그려져야 하므로)"""
+    for pattern in patterns:
+        try:
+            context.unroute(pattern, _abort_route)
+        except Exception:
+            pass
+
+def mark_phase(settings, phase):
+    """구간 시작/종료 시각 기록 (settings['phase_hook']가 있을 때만, 벤치마크용)"""
+    hook = settings.get('phase_hook')
+    if hook:
+        hook(phase, time.perf_counter())
+
+# 다시 로그인한 직후 세션이 또 끊기는 일이 이 횟수를 넘게 이어지면 검색 중단
+MAX_RELOGINS_IN_ROW = 3
+
+# 긴 대기를 나눠 기다리는 단위 (ms) - 조각 사이마다 중단 요청을 확인
+STOP_CHECK_SLICE = 500
+
+class StopRequested(Exception):
+    """중단 요청으로 진행 중인 단계를 그만둠"""
+
+def wait_or_stop(wait, timeout, stop_event):
+    """wait(조각 ms)를 timeout(ms, 0이면 무제한)까지 반복, 그사이 중단 요청이 오면 StopRequested
+
+    wait는 주어진 시간 안에 조건이 맞지 않으면 PlaywrightTimeoutError를 내는 함수.
+    공용 브라우저에서는 다른 스레드가 페이지를 닫아 줄 수 없으므로 긴 대기는 모두 이것을 거친다.
+    """
+    if stop_event is None:
+        return wait(timeout)
+    deadline = time.monotonic() + timeout / 1000 if timeout else None
+    while True:
+        if stop_event.is_set():
+            raise StopRequested()
+        slice_ms = STOP_CHECK_SLICE
+        if deadline is not None:
+            slice_ms = min(slice_ms, (deadline - time.monotonic()) * 1000)
+            if slice_ms <= 0:
+                raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded.")
+        try:
+            return wait(max(slice_ms, 1))
+        except PlaywrightTimeoutError:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise
+
+def check_stop(settings):
+    """단계 사이에서 중단 요청 확인"""
+    stop_event = settings.get('stop_event')
+    if stop_event is not None and stop_event.is_set():
+        raise StopRequested()
+
+# 결제 완료 화면에 나오는 문구 (하나라도 나타나면 완료)
+PAYMENT_COMPLETE_INDICATORS = [
+    "text=스마트티켓 발급이 완료되었습니다",
+    "text=결제완료",
+    "text=승인번호",
+    "text=결제금액"
+]
+
+def wait_for_payment_complete(page, log, stop_event=None):
+    """결제 완료 화면까지 대기 ('ok' / 'timeout'), 중단 요청이 오면 StopRequested"""
+    completion = page.locator(PAYMENT_COMPLETE_INDICATORS[0])
+    for indicator in PAYMENT_COMPLETE_INDICATORS[1:]:
+        completion = completion.or_(page.locator(indicator))
     try:
-        # 조회 결과 대기
-        page.wait_for_selector("tbody tr", timeout=10000)
-        
-        # 모든 행을 가져옴 (여러 tbody가 있을 수 있으므로 모두 확인)
-        rows = page.locator("tbody tr").all()
-        
-        print(f"[DEBUG] 찾은 행 수: {len(rows)}")
-        print(f"[DEBUG] 목표 시간: {target_time}, 허용 범위: {time_tolerance}분")
-        print(f"[DEBUG] 좌석 선택: 특실={seat_types.get('special', False)}, 일반실={seat_types.get('general', False)}")
-        
-        target_time_str = f"{target_time}:00"
-        
-        # 각 행을 순서대로 확인
-        for idx, row in enumerate(rows):
-            try:
-                # 모든 td 가져오기
-                cols = row.locator("td").all()
-                if len(cols) < 7:  # 최소 7개 열이 필요
-                    continue
-                
-                # 열차 정보 추출 (간단하게)
-                train_type = cols[1].text_content().strip().split('\n')[0] if len(cols) > 1 else ""
-                
-                # SRT만 처리
-                if "SRT" not in train_type:
-                    continue
-                
-                # 출발 시간 찾기 (보통 3번째 또는 4번째 열)
-                dep_time = None
-                for i in [3, 4]:
-                    if i < len(cols):
-                        time_text = cols[i].text_content()
-                        if ":" in time_text:
-                            # 시간 포맷 찾기 (HH:MM)
-                            import re
-                            time_match = re.search(r'(\d{2}:\d{2})', time_text)
-                            if time_match:
-                                dep_time = time_match.group(1)
-                                break
-                
-                if not dep_time:
-                    continue
-                
-                # 시간 범위 체크: target_time <= dep_time <= target_time + tolerance
-                # 예: 10:00 목표, 120분 허용 -> 10:00 ~ 12:00 사이
-                dep_hour, dep_min = map(int, dep_time.split(':'))
-                target_hour, target_min = map(int, target_time_str.split(':'))
-                
-                # 분 단위로 변환
-                dep_total_minutes = dep_hour * 60 + dep_min
-                target_total_minutes = target_hour * 60 + target_min
-                
-                # 출발 시간이 목표 시간보다 이전이면 스킵
-                if dep_total_minutes < target_total_minutes:
-                    continue
-                
-                # 출발 시간이 허용 범위를 벗어나면 스킵
-                if dep_total_minutes > target_total_minutes + time_tolerance:
-                    continue
-                
-                time_difference = dep_total_minutes - target_total_minutes
-                
-                print(f"[DEBUG] 행 {idx}: 출발 {dep_time}, 시간차 {time_difference}분")
-                
-                # 예약 버튼 찾기
-                # 일반실 체크 (td[7] = 인덱스 6)
-                if seat_types.get('general', False) and len(cols) > 6:
-                    general_col = cols[6]  # td[7] = 일반실 열
-                    
-                    # 매진이 아닌지 먼저 확인
-                    if "매진" not in general_col.text_content():
-                        # "예약하기" 버튼만 찾기 (좌석선택 버튼은 무시)
-                        reserve_buttons = general_col.locator("a").all()
-                        for btn in reserve_buttons:
-                            btn_text = btn.text_content().strip()
-                            # "예약하기" 또는 "예약 하기" 텍스트를 가진 버튼만 선택
-                            if "예약" in btn_text and "하기" in btn_text and "좌석" not in btn_text:
-                                print(f"[DEBUG] 일반실 예약 가능! 행 {idx}, 출발 {dep_time}")
-                                return {
-                                    'dep_time': dep_time,
-                                    'reserve_button': btn,
-                                    'time_diff': time_difference,
-                                    'row_index': idx,
-                                    'seat_type': '일반실'
-                                }
-                
-                # 특실 체크 (td[6] = 인덱스 5)
-                if seat_types.get('special', False) and len(cols) > 5:
-                    special_col = cols[5]  # td[6] = 특실 열
-                    
-                    # 매진이 아닌지 먼저 확인
-                    if "매진" not in special_col.text_content():
-                        # "예약하기" 버튼만 찾기 (좌석선택 버튼은 무시)
-                        reserve_buttons = special_col.locator("a").all()
-                        for btn in reserve_buttons:
-                            btn_text = btn.text_content().strip()
-                            # "예약하기" 또는 "예약 하기" 텍스트를 가진 버튼만 선택
-                            if "예약" in btn_text and "하기" in btn_text and "좌석" not in btn_text:
-                                print(f"[DEBUG] 특실 예약 가능! 행 {idx}, 출발 {dep_time}")
-                                return {
-                                    'dep_time': dep_time,
-                                    'reserve_button': btn,
-                                    'time_diff': time_difference,
-                                    'row_index': idx,
-                                    'seat_type': '특실'
-                                }
-                
-            except Exception as e:
-                print(f"[DEBUG] 행 {idx} 처리 중 오류: {str(e)}")
-                continue
-        
-        return None
-        
-    except Exception as e:
-        print(f"열차 검색 중 오류: {str(e)}")
-        return None
+        wait_or_stop(lambda timeout: completion.first.wait_for(timeout=timeout),
+                     STEP_TIMEOUTS['payment_complete'], stop_event)
+    except PlaywrightTimeoutError:
+        log("결제 시간이 초과되었습니다. (10분 경과)")
+        # 결제완료 문구가 뜨거나 결제창이 닫힐 때까지 계속 대기
+        try:
+            wait_or_stop(lambda timeout: page.wait_for_selector("text=결제완료", timeout=timeout), 0, stop_event)
+        except StopRequested:
+            raise
+        except:
+            pass
+        log("결제가 완료되었습니다!")
+        return 'timeout'
+    
+    # 결제 정보 추출
+    try:
+        amount = page.locator("td:has-text('원')").first.text_content()
+        approval_date = page.locator("td:has-text('20')").first.text_content()
+        log("결제가 완료되었습니다!")
+        log("결제 금액: %s", amount)
+        log("승인 일시: %s", approval_date)
+    except:
+        log("결제가 완료되었습니다!")
+    return 'ok'
 
-def search_and_reserve(page, login_info, train_info, settings, personal_info, progress_signal=None):
-    def log(message):
-        if progress_signal:
-            progress_signal.emit(message)
-        print(message)
+def search_and_reserve(page, login_info, train_info, settings, personal_info, progress_signal=None,
+                       start_at=None, refill_form=False):
+    """조회 루프 실행 (start_at: 첫 조회를 보낼 서버 시각 epoch 초, refill_form: 그 뒤에 조회 폼을 채울지)"""
+    # 실행 로거 (start_reservation이 만들어 넘기지 않았으면 여기서 준비)
+    owns_logger = open_run_logger(settings, progress_signal)
+    # 좌석 변경 이벤트 기록 (start_reservation이 만든 저장소가 있을 때만)
+    history = settings.get('history')
+    if history:
+        settings['history_run'] = history.open_run(train_info)
+    try:
+        return _search_and_reserve(page, login_info, train_info, settings, personal_info, start_at, refill_form)
+    finally:
+        if history:
+            settings.pop('history_run').close()
+        if owns_logger:
+            close_run_logger(settings)
+
+def _search_and_reserve(page, login_info, train_info, settings, personal_info, start_at=None, refill_form=False):
+    # 메시지는 큐에 넣기만 하고 출력/GUI 전달은 로그 스레드에서 처리
+    log = settings['logger'].info
+    
+    def mark(phase):
+        mark_phase(settings, phase)
+    
+    # SRT 2개 편성 연결 열차 알림창 처리 (예약하기 클릭 직후 뜨므로 미리 등록)
+    page.on("dialog", lambda dialog: dialog.accept())
+    
+    # 조회 중에는 이미지/폰트/추적 스크립트 등 불필요한 리소스 차단
+    blocked_patterns = apply_resource_blocking(page.context, settings.get('block_profile', 'standard'))
+    
+    # 조회 엔진 (기본: 화면 조회, http: 세션 쿠키로 직접 조회 후 찾았을 때만 화면으로 넘김)
+    engine = create_engine(page, settings, mark)
+    log("조회 엔진: %s", engine.label)
+    
+    stop_event = settings.get('stop_event')
+    
+    # 조회 간격 (서버 응답 시간/오류에 따라 조정, 최대 조회 속도 제한)
+    scheduler = PollScheduler.from_settings(settings)
+    # 조회 계획(polling_plan) 구간이 바뀔 때마다 진행 로그에 표시
+    scheduler.on_plan_change = lambda label, mode: log(
+        "조회 계획: %s%s", label, " (조회 멈춤)" if mode == PAUSE else "")
+    
+    # 사이클/구간별 소요 시간 기록 (start_reservation이 만들어 넘김)
+    tracer = settings.get('tracer') or NullTracer()
+    
+    # 후보 선택 기준 (허용 시간, 좌석 우선순위, 제외 열차 등은 루프 밖에서 한 번만 계산)
+    policy = SelectionPolicy.from_settings(train_info, settings)
+    
+    # 조회 결과 변화 감지 (예약 가능/다시 매진/새 열차 이벤트를 진행 로그에 표시)
+    detector = ChangeDetector()
+    detector.listeners.append(lambda event: log(event.describe()))
+    if settings.get('history_run'):
+        detector.listeners.append(settings['history_run'].record)
+    # 지난 선택에서 열차를 찾았는지 (못 찾았고 결과도 그대로면 선택 단계를 건너뜀)
+    last_found = True
+    # 로그인 상태를 다시 확인해야 하는지 (조회 멈춤이 끝났거나 로그인 화면/점검 응답을 받은 뒤)
+    session_check = False
+    # 다시 로그인한 직후 또 세션이 끊긴 횟수 (계속되면 중단)
+    relogins_in_row = 0
+    
+    # 예매 시작 시각: 위의 준비를 모두 마치고 첫 조회 바로 앞에서 서버 시각에 맞춰 대기
+    if start_at is not None:
+        if not refill_form:
+            engine.prepare()
+        if not wait_for_start(page, get_base_url(settings), start_at, settings, log):
+            return False
+        if refill_form:
+            # 예매가 열린 뒤에야 출발일이 목록에 생기므로 이 경우만 시작 후 폼 입력
+            with tracer.span('fill_form'):
+                open_schedule_page(page, get_base_url(settings))
+                fill_search_form(page, train_info, log)
     
     while True:
+        if not scheduler.wait(stop_event):
+            log("중단 요청으로 검색을 종료합니다.")
+            return False
+        if scheduler.resumed:
+            session_check = True
+        
+        tracer.start_cycle()
         try:
+            if session_check:
+                with tracer.span('restore_search'):
+                    restored = restore_search_page(page, login_info, train_info, settings, log)
+                if not restored:
+                    log("다시 로그인하지 못해 검색을 종료합니다.")
+                    tracer.end_cycle('login_failed')
+                    return False
+                session_check = False
+                # 다시 연 화면 기준으로 조회 폼과 비교 기준을 새로 잡음
+                engine.reset()
+                detector.reset()
+                last_found = True
             
-            # 조회하기 버튼 클릭
-            log("\n새로운 검색 시도...")
-            search_button = page.locator("xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[2]/input")
-            search_button.wait_for(timeout=10000)
-            
-            # JavaScript로 클릭 실행
-            page.evaluate("(element) => element.click()", search_button.element_handle())
-            log("조회하기 버튼 클릭 완료")
+            mark('cycle_start')
             
-            time.sleep(1)  # 검색 결과 로딩 대기
+            # 조회 실행 (조회 응답과 새 결과 테이블까지 대기)
+            log("\n새로운 검색 시도...")
+            tracer.begin('search', engine=engine.name)
+            search_started = time.perf_counter()
+            rows = engine.search()
+            scheduler.record_success(time.perf_counter() - search_started)
+            relogins_in_row = 0
+            tracer.end('search', rows=len(rows))
+            log("조회 완료")
             
-            # 허용 시간 내의 예약 가능한 열차 찾기
-            target_time = train_info['target_time']
-            time_tolerance = int(train_info['time_tolerance'])
-            seat_types = train_info['seat_types']
-            available_train = find_available_train(page, target_time, time_tolerance, seat_types)
+            # 허용 시간 내의 예약 가능한 후보 중 가장 좋은 열차 하나 선택
+            tracer.begin('scan')
+            changed, events = detector.update(rows)
+            if changed or last_found:
+                available_train = policy.select(rows)
+            else:
+                # 매진뿐이던 지난 결과와 같으므로 다시 볼 필요 없음
+                available_train = None
+            last_found = available_train is not None
+            mark('row_scan')
+            tracer.end('scan', found=last_found,
+                       candidates=available_train['candidates'] if available_train else 0,
+                       changed=changed, events=len(events))
             
             if available_train:
-                log(f"\n예약 가능한 열차를 찾았습니다!")
-                log(f"출발시간: {available_train['dep_time']}")
-                log(f"좌석 유형: {available_train.get('seat_type', 'N/A')}")
-                log(f"행 번호: {available_train.get('row_index', 'N/A')}")
+                log("\n예약 가능한 열차를 찾았습니다!")
+                log("출발시간: %s (열차 %s, 후보 %d개 중 선택)", available_train['dep_time'],
+                    available_train['number'], available_train['candidates'])
+                log("좌석 유형: %s", available_train.get('seat_type', 'N/A'))
+                log("행 번호: %s", available_train.get('row_index', 'N/A'))
+                
+                # 예약하기 버튼 찾기 (http 엔진은 여기서 브라우저 조회로 넘김)
+                tracer.begin('reserve', train=available_train['number'], seat=available_train['seat_type'])
+                reserve_button = engine.reserve_button(available_train)
+                if reserve_button is None:
+                    log("화면에서 다시 확인하는 사이 매진되었습니다. 다시 검색을 시도합니다.")
+                    tracer.end('reserve', 'sold_out')
+                    tracer.end_cycle('sold_out')
+                    continue
                 
                 # 예약하기 버튼 클릭
-                available_train['reserve_button'].click()
+                reserve_button.click()
                 log("예약하기 버튼 클릭 완료")
+                mark('reserve_click')
+                tracer.end('reserve')
                 
-                # SRT 2개 편성 연결 열차 알림창 처리
-                page.on("dialog", lambda dialog: dialog.accept())
-                
+                tracer.begin('confirm')
                 # confirmReservationInfo 페이지로 이동될 때까지 대기 (대기열 자동 처리)
-                page.wait_for_url("**/confirmReservationInfo**", timeout=30000)
+                wait_or_stop(lambda timeout: page.wait_for_url("**/confirmReservationInfo**",
+                                                               wait_until="domcontentloaded", timeout=timeout),
+                             STEP_TIMEOUTS['confirm_page'], stop_event)
                 log("예약 확인 페이지 로드 완료")
+                mark('confirm_loaded')
                 
                 # 잔여석 없음 메시지 확인
-                time.sleep(1)
-                if "잔여석 없음" in page.content() or "좌석이 매진" in page.content():
+                page_content = page.content()
+                if "잔여석 없음" in page_content or "좌석이 매진" in page_content:
                     log("다른 사용자가 먼저 좌석을 예약했습니다. 다시 검색을 시도합니다.")
+                    tracer.end('confirm', 'sold_out')
+                    tracer.end_cycle('lost_race')
                     page.go_back()
                     continue
+                tracer.end('confirm')
                 
                 log("좌석이 있는 것으로 확인됩니다. 결제 진행 중...")
                 
                 # 결제하기 버튼 클릭
+                tracer.begin('payment_button')
                 try:
-                    payment_button = page.locator("xpath=/html/body/div/div[4]/div/div[2]/form/fieldset/div[11]/a[1]")
-                    payment_button.wait_for(state="visible", timeout=5000)
+                    payment_button = resolve(page, 'payment_button', timeout=STEP_TIMEOUTS['payment_button'])
                     payment_button.click()
                     log("결제하기 버튼 클릭 완료")
+                    tracer.end('payment_button')
                 except Exception as e:
-                    log(f"결제하기 버튼 클릭 실패: {str(e)}")
+                    log("결제하기 버튼 클릭 실패: %s", e)
                     
                     # 페이지 내용 확인
                     page_content = page.content()
                     if "잔여석 없음" in page_content or "좌석이 매진" in page_content:
                         log("다른 사용자가 먼저 좌석을 예약했습니다. 다시 검색을 시도합니다.")
+                        outcome = 'lost_race'
                     else:
                         log("알 수 없는 이유로 결제하기 버튼을 찾을 수 없습니다.")
+                        outcome = 'payment_button_missing'
                     
+                    tracer.end('payment_button', 'error', error=type(e).__name__)
+                    tracer.end_cycle(outcome)
                     page.go_back()
                     continue
 
                 
                 # 간편결제 탭과 카카오페이 선택
+                tracer.begin('payment_method')
+                payment_method_outcome = 'ok'
                 try:
                     log("간편결제 탭으로 전환 중...")
-                    time.sleep(1)
                     
-                    # id로 요소 찾기
-                    easy_payment_tab = page.locator("#chTab2")
+                    easy_payment_tab = resolve(page, 'easy_payment_tab', state="attached",
+                                               timeout=STEP_TIMEOUTS['payment_method'])
                     page.evaluate("(element) => element.click()", easy_payment_tab.element_handle())
                     log("간편결제 탭 클릭 완료")
                     
-                    time.sleep(1)
-                    
                     # 카카오페이 라디오 버튼 선택
-                    kakao_pay_button = page.locator("#kakaoPay")
+                    kakao_pay_button = resolve(page, 'kakao_pay', state="attached",
+                                               timeout=STEP_TIMEOUTS['payment_method'])
                     page.evaluate("(element) => element.click()", kakao_pay_button.element_handle())
                     log("카카오페이 선택 완료")
                     
                 except Exception as e:
-                    log(f"결제 방식 선택 중 오류: {str(e)}")
+                    log("결제 방식 선택 중 오류: %s", e)
                     # 대체 방법 시도
                     try:
                         page.evaluate("window.scrollBy(0, 300)")
-                        time.sleep(1)
+                        page.wait_for_function("typeof changeTab === 'function'", timeout=STEP_TIMEOUTS['payment_method'])
                         page.evaluate("changeTab(1); return false;")
                         log("간편결제 탭 클릭 완료 (스크립트 호출)")
-                        time.sleep(1)
-                        page.evaluate("changeStlTpCd(document.getElementById('kakaoPay'))")
+                        kakao_pay_button = resolve(page, 'kakao_pay', state="attached",
+                                                   timeout=STEP_TIMEOUTS['payment_method'])
+                        page.evaluate("(element) => changeStlTpCd(element)", kakao_pay_button.element_handle())
                         log("카카오페이 선택 완료 (스크립트 호출)")
+                        payment_method_outcome = 'fallback'
                     except Exception as sub_e:
-                        log(f"대체 방법 실패: {str(sub_e)}")
+                        log("대체 방법 실패: %s", sub_e)
+                        payment_method_outcome = 'error'
+                tracer.end('payment_method', payment_method_outcome)
 
                 # 스마트폰 발권 옵션 클릭
-                smartphone_ticket = page.locator("xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[11]/div[2]/ul/li[2]/a")
+                tracer.begin('payment_popup')
+                smartphone_ticket = resolve(page, 'smartphone_ticket', timeout=STEP_TIMEOUTS['payment_popup'])
                 smartphone_ticket.click()
                 log("스마트폰 발권 옵션 선택 완료")
 
-                # alert 창 처리는 이미 설정됨
-                time.sleep(1)
-
-                # 결제 및 발권 버튼 클릭
-                final_payment_button = page.locator("xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[11]/div[11]/input[2]")
-                final_payment_button.click()
-                log("결제 및 발권 버튼 클릭 완료")
-
-                # 새 창/탭 처리 - 레거시처럼 처리
-                time.sleep(2)  # 새 창이 열릴 때까지 대기
-                
-                # 이미 열려있는 모든 페이지 확인
-                all_pages = page.context.pages
-                log(f"현재 열린 페이지 수: {len(all_pages)}")
-                
-                if len(all_pages) > 1:
-                    # 마지막으로 열린 페이지로 전환 (레거시처럼)
-                    new_page = all_pages[-1]
-                    log("카카오페이 결제창으로 전환 완료 (이미 열림)")
-                else:
-                    # 새 페이지가 아직 안 열렸다면 대기
-                    try:
-                        with page.context.expect_page(timeout=5000) as new_page_info:
-                            pass
-                        new_page = new_page_info.value
-                        log("카카오페이 결제창으로 전환 완료 (새로 열림)")
-                    except:
+                # 결제 및 발권 버튼 클릭 - 카카오페이 결제창(새 창)이 뜨는 이벤트를 기다림
+                final_payment_button = resolve(page, 'final_payment_button', timeout=STEP_TIMEOUTS['payment_popup'])
+                # 결제창은 차단 없이 열리도록 해제
+                lift_resource_blocking(page.context, blocked_patterns)
+                blocked_patterns = []
+                try:
+                    with page.context.expect_page(timeout=STEP_TIMEOUTS['payment_popup']) as new_page_info:
+                        final_payment_button.click()
+                    new_page = new_page_info.value
+                    log("결제 및 발권 버튼 클릭 완료")
+                    log("카카오페이 결제창으로 전환 완료 (새로 열림)")
+                except PlaywrightTimeoutError:
+                    log("결제 및 발권 버튼 클릭 완료")
+                    # 이미 열려있는 모든 페이지 확인
+                    all_pages = page.context.pages
+                    log("현재 열린 페이지 수: %s", len(all_pages))
+                    if len(all_pages) > 1:
+                        # 마지막으로 열린 페이지로 전환 (레거시처럼)
+                        new_page = all_pages[-1]
+                        log("카카오페이 결제창으로 전환 완료 (이미 열림)")
+                    else:
                         log("새 창을 찾을 수 없음 - 현재 페이지에서 계속")
                         new_page = page  # 현재 페이지 사용
                 
-                # 페이지 완전 로딩 대기
-                new_page.wait_for_load_state("networkidle")
-                time.sleep(2)  # 추가 대기
-
-                # Tab 키로 카톡결제 탭으로 이동
-                log("Tab 키로 카톡결제 탭 선택 시도")
-                # Tab 2번 누르기 (QR결제 -> 카톡결제)
-                new_page.keyboard.press("Tab")
-                time.sleep(0.2)
-                new_page.keyboard.press("Tab")
-                time.sleep(0.2)
-                # 스페이스바 또는 엔터로 선택
-                new_page.keyboard.press("Enter")
-                log("카톡결제 탭 선택 완료")
+                mark('payment_handoff')
+                tracer.end('payment_popup', popup='new' if new_page is not page else 'none')
                 
-                time.sleep(2)  # 탭/화면 전환 대기
+                # 결제창은 화면을 스크립트로 그리므로 load 이후에도 탭이 실제로 보일 때까지 대기
+                tracer.begin('kakao_input')
 
-                # 휴대폰 번호 입력
+                # 자동 입력이 하나라도 실패하면 사람이 직접 처리해야 함
+                kakao_failed = False
+                
+                # 카톡결제 탭 선택 (QR결제 -> 카톡결제)
+                try:
+                    kakao_talk_tab = resolve(new_page, 'kakao_talk_tab', timeout=STEP_TIMEOUTS['kakao_input'])
+                    kakao_talk_tab.click(timeout=STEP_TIMEOUTS['kakao_input'])
+                    log("카톡결제 탭 선택 완료")
+                except Exception as e:
+                    kakao_failed = True
+                    log("카톡결제 탭 선택 실패: %s", e)
+                
+                # 휴대폰 번호 입력 (탭 전환은 입력란이 보일 때까지 기다리는 것으로 확인)
                 try:
-                    phone_input = new_page.locator("xpath=/html/body/div[1]/main/div/div[2]/div/div[2]/form/div[1]/div/div/span/input")
-                    phone_input.wait_for(state="visible", timeout=5000)
+                    phone_input = resolve(new_page, 'kakao_phone', timeout=STEP_TIMEOUTS['kakao_input'])
                     phone_input.fill(personal_info['phone'])
                     log("휴대폰 번호 입력 완료")
                 except:
+                    kakao_failed = True
                     log("휴대폰 번호 입력 실패")
 
                 # 생년월일 입력
                 try:
-                    birth_input = new_page.locator("xpath=/html/body/div[1]/main/div/div[2]/div/div[2]/form/div[2]/div/div/span/input")
-                    birth_input.wait_for(state="visible", timeout=5000)
+                    birth_input = resolve(new_page, 'kakao_birth', timeout=STEP_TIMEOUTS['kakao_input'])
                     birth_input.fill(personal_info['birth'])
                     log("생년월일 입력 완료")
                 except:
+                    kakao_failed = True
                     log("생년월일 입력 실패")
 
                 # 최종 결제요청 버튼 클릭
                 try:
-                    # 레거시와 동일한 XPath 사용
-                    final_request_button = new_page.locator("xpath=/html/body/div[1]/main/div/div[2]/div/div[2]/form/button")
-                    final_request_button.wait_for(state="visible", timeout=5000)
-                    time.sleep(0.5)  # 버튼 활성화 대기
-                    final_request_button.click()
+                    final_request_button = resolve(new_page, 'kakao_request', timeout=STEP_TIMEOUTS['kakao_input'])
+                    # click()이 버튼이 활성화될 때까지 기다림
+                    final_request_button.click(timeout=STEP_TIMEOUTS['kakao_input'])
                     log("최종 결제요청 완료")
                 except:
+                    kakao_failed = True
                     log("결제요청 버튼 클릭 실패")
+                
+                tracer.end('kakao_input', 'error' if kakao_failed else 'ok')
+                
+                # 헤드리스 모드에서는 사람이 직접 결제할 수 있도록 화면이 있는 브라우저로 결제창을 다시 연다
+                reattached = False
+                if kakao_failed and settings.get('launch_mode') in HEADLESS_MODES:
+                    try:
+                        new_page = reattach_headed(new_page)
+                        reattached = True
+                        log("결제창을 화면에 표시했습니다. 직접 결제를 진행해주세요.")
+                    except Exception as e:
+                        log("결제창 표시 실패: %s", e)
 
-                # 결제 완료 대기 (최대 10분)
+                # 결제 완료 대기 (최대 10분), 화면용으로 띄운 브라우저는 어떤 경우에도 닫음
+                tracer.begin('payment_complete', reattached=reattached)
                 try:
-                    completion_indicators = [
-                        "text=스마트티켓 발급이 완료되었습니다",
-                        "text=결제완료",
-                        "text=승인번호",
-                        "text=결제금액"
-                    ]
-                    
-                    # 여러 선택자 중 하나라도 나타나면 완료
-                    for indicator in completion_indicators:
-                        try:
-                            new_page.wait_for_selector(indicator, timeout=600000)
-                            break
-                        except:
-                            continue
-                    
-                    # 결제 정보 추출
-                    try:
-                        amount = new_page.locator("td:has-text('원')").first.text_content()
-                        approval_date = new_page.locator("td:has-text('20')").first.text_content()
-                        log(f"결제가 완료되었습니다!")
-                        log(f"결제 금액: {amount}")
-                        log(f"승인 일시: {approval_date}")
-                    except:
-                        log("결제가 완료되었습니다!")
-                    
-                    time.sleep(2)
-                    
-                    # 모든 페이지 닫기
-                    new_page.close()
-                    
-                    log("예매가 완료되어 브라우저를 종료합니다.")
-                    return True
-                    
-                except PlaywrightTimeoutError:
-                    log("결제 시간이 초과되었습니다. (10분 경과)")
-                    # 계속 대기
-                    while True:
+                    outcome = wait_for_payment_complete(new_page, log, stop_event)
+                    if outcome == 'ok':
+                        log("예매가 완료되어 브라우저를 종료합니다.")
+                        if not reattached:
+                            new_page.close()
+                finally:
+                    if reattached:
                         try:
-                            page_content = new_page.content()
-                            if "결제완료" in page_content:
-                                log("결제가 완료되었습니다!")
-                                time.sleep(2)
-                                return True
-                            time.sleep(1)
-                        except:
-                            log("결제가 완료되었습니다!")
-                            return True
-
+                            new_page.context.browser.close()
+                        except Exception:
+                            pass
+                tracer.end('payment_complete', outcome)
+                tracer.end_cycle('reserved')
                 return True
             
             log("예약 가능한 열차가 없습니다. 잠시 후 다시 시도합니다...")
-            time.sleep(float(settings['refresh_interval']))
-                
+            tracer.end_cycle('no_train')
+        
+        except StopRequested:
+            tracer.end_cycle('stopped')
+            log("중단 요청으로 검색을 종료합니다.")
+            return False
+        except SessionExpiredError as e:
+            # 끊긴 세션으로 재시도 간격만 늘리지 않고 바로 다시 로그인
+            tracer.end_cycle('session_expired', error=e)
+            relogins_in_row += 1
+            if relogins_in_row > MAX_RELOGINS_IN_ROW:
+                log("다시 로그인해도 세션이 계속 끊겨 검색을 종료합니다.")
+                return False
+            log("세션이 만료되어 다시 로그인합니다.")
+            session_check = True
         except Exception as e:
-            log(f"검색 중 오류 발생: {str(e)}")
+            tracer.end_cycle('error', error=e)
+            log("검색 중 오류 발생: %s", e)
             if "Connection aborted" in str(e) or "Failed to establish" in str(e):
                 log("브라우저 연결이 종료되었습니다.")
                 return False
-            time.sleep(float(settings['refresh_interval']))
+            if isinstance(e, MaintenanceError):
+                # 점검이 끝나면 세션이 초기화되어 있을 수 있음
+                session_check = True
+            delay = scheduler.record_error(maintenance=isinstance(e, MaintenanceError))
+            if delay >= 1:
+                log("%.1f초 후 다시 시도합니다.", delay)
+
+def login(page, base_url, login_info, log, stop_event=None):
+    """로그인 폼 제출 후 main.do로 이동하면 성공"""
+    # 1. 로그인 페이지로 이동
+    log("로그인 페이지로 이동 중...")
+    page.goto(f"{base_url}/cmc/01/selectLoginForm.do?pageId=TK0701000000", wait_until="domcontentloaded")
+    
+    # 2. 로그인 정보 입력
+    member_id = login_info['id']
+    member_pw = login_info['password']
+    
+    log("로그인 시도 중...")
+    id_input = resolve(page, 'login_id', timeout=STEP_TIMEOUTS['login_form'])
+    id_input.fill("")
+    id_input.fill(member_id)
+    
+    pw_input = resolve(page, 'login_password', timeout=STEP_TIMEOUTS['login_form'])
+    pw_input.fill("")
+    pw_input.fill(member_pw)
+    
+    # 3. 로그인 버튼 클릭 (회원번호 로그인 폼의 버튼, 이메일 로그인 폼은 숨겨져 있음)
+    submit_button = resolve(page, 'login_submit', timeout=STEP_TIMEOUTS['login_form'])
+    submit_button.click()
+    
+    # 4. 로그인 성공 확인
+    try:
+        wait_or_stop(lambda timeout: page.wait_for_url(f"{base_url}/main.do", timeout=timeout), 10000, stop_event)
+        log("로그인 성공!")
+        return True
+    except PlaywrightTimeoutError:
+        log("로그인 실패: 아이디나 비밀번호를 확인해주세요.")
+        return False
+
+def open_schedule_page(page, base_url):
+    page.goto(f"{base_url}/hpg/hra/01/selectScheduleList.do?pageId=TK0101010000", wait_until="domcontentloaded")
+
+def is_logged_in(page):
+    """로그인 폼으로 튕기지 않았고 로그아웃 링크가 있으면 로그인 상태"""
+    if "selectLoginForm" in page.url:
+        return False
+    return page.locator("a:has-text('로그아웃')").count() > 0
+
+def resume_session(page, base_url, login_info, session_file, log):
+    """저장된 세션으로 조회 페이지를 열어보고 유효하면 True"""
+    storage_state = load_session_state(login_info['id'], session_file)
+    if not storage_state:
+        return False
+    
+    log("저장된 세션 확인 중...")
+    restore_session(page.context, storage_state)
+    open_schedule_page(page, base_url)
+    if is_logged_in(page):
+        log("저장된 세션으로 로그인을 생략합니다.")
+        return True
+    
+    log("저장된 세션이 만료되어 다시 로그인합니다.")
+    clear_session_state(session_file)
+    page.context.clear_cookies()
+    return False
+
+def restore_search_page(page, login_info, train_info, settings, log):
+    """조회 화면을 다시 열어 로그인 상태를 확인하고 조회 폼을 채움 (세션이 끊겼으면 다시 로그인, 실패하면 False)"""
+    base_url = get_base_url(settings)
+    session_file = settings.get('session_file', SESSION_FILE)
+    open_schedule_page(page, base_url)
+    if not is_logged_in(page):
+        page.context.clear_cookies()
+        if not resume_session(page, base_url, login_info, session_file, log):
+            if not login(page, base_url, login_info, log, settings.get('stop_event')):
+                return False
+            try:
+                save_session_state(page.context, login_info['id'], session_file)
+            except Exception as e:
+                log("세션 저장 실패: %s", e)
+            open_schedule_page(page, base_url)
+    fill_search_form(page, train_info, log)
+    return True
+
+def fill_search_form(page, train_info, log):
+    # 출발역 입력
+    dep_stn = train_info['departure']
+    log("출발역 입력 시도: %s", dep_stn)
+    dep_input = resolve(page, 'departure_input', timeout=STEP_TIMEOUTS['search_form'])
+    dep_input.fill("")
+    dep_input.fill(dep_stn)
+    log("출발역 입력 완료")
+    
+    # 도착역 입력
+    arr_stn = train_info['arrival']
+    log("도착역 입력 시도: %s", arr_stn)
+    arr_input = resolve(page, 'arrival_input', timeout=STEP_TIMEOUTS['search_form'])
+    arr_input.fill("")
+    arr_input.fill(arr_stn)
+    log("도착역 입력 완료")
+    
+    # 날짜 선택
+    date = train_info['date']
+    log("날짜 선택 시도: %s", date)
+    
+    date_select = resolve(page, 'date_select', state="attached", timeout=STEP_TIMEOUTS['search_form'])
+    date_select.select_option(label=date)
+    log("날짜 선택 완료")
+    
+    # 시간 선택
+    target_time = train_info['target_time']
+    log("시간 선택 시도: %s시", target_time)
+    
+    time_select = resolve(page, 'time_select', state="attached", timeout=STEP_TIMEOUTS['search_form'])
+    time_select.select_option(value=f"{target_time}0000")
+    log("시간 선택 완료")
+
+def has_date_option(page, date):
+    """출발일 목록에 date가 있는지 (예매가 열리기 전에는 목록에 없음)"""
+    date_select = resolve(page, 'date_select', state="attached", timeout=STEP_TIMEOUTS['search_form'])
+    return date_select.evaluate("(select, label) => Array.from(select.options).some(o => o.label === label)", date)
+
+def http_date_probe(context, base_url):
+    """서버 시각 측정용 요청 함수 (HEAD 한 번, 리다이렉트 없이 Date 헤더만 사용)"""
+    def fetch_date():
+        response = context.request.head(f"{base_url}/", max_redirects=0, timeout=STEP_TIMEOUTS['clock_sync'])
+        return response.headers.get('date')
+    return fetch_date
+
+def wait_for_start(page, base_url, start_at, settings, log):
+    """서버 시각을 측정한 뒤 서버 시각 start_at(epoch 초)까지 대기, 중단 요청이 오면 False"""
+    sync = ClockSync(http_date_probe(page.context, base_url))
+    try:
+        with settings['tracer'].span('clock_sync'):
+            offset = sync.estimate()
+        log("서버 시각 차이: %s", offset.describe())
+    except Exception as e:
+        log("서버 시각을 측정하지 못해 이 컴퓨터의 시각으로 시작합니다: %s", e)
+    
+    log("%s에 첫 조회를 시작합니다.", datetime.fromtimestamp(start_at).strftime('%H:%M:%S.%f')[:-3])
+    if not sync.wait_until(start_at, settings.get('stop_event')):
+        log("중단 요청으로 대기를 종료합니다.")
+        return False
+    return True
 
 def start_reservation(playwright, browser, context, page, login_info, train_info, personal_info, settings, progress_signal=None):
-    def log(message):
-        if progress_signal:
-            progress_signal.emit(message)
-        print(message)
+    owns_logger = open_run_logger(settings, progress_signal)
+    log = settings['logger'].info
         
+    base_url = get_base_url(settings)
+    session_file = settings.get('session_file', SESSION_FILE)
+    
+    # 구간 기록 (settings['trace_file']에 JSONL로 저장, 호출한 쪽에서 넘겨주면 그것을 사용)
+    owns_tracer = settings.get('tracer') is None
+    if owns_tracer:
+        settings['tracer'] = Tracer.from_settings(settings)
+        # 메트릭 엔드포인트가 켜져 있으면 구간 기록으로 값을 채움
+        if settings.get('metrics'):
+            settings['tracer'].listeners.append(settings['metrics'].observe_span)
+    tracer = settings['tracer']
+    
+    # 좌석 변경 이벤트 저장소 (settings['history_file']에 SQLite로 저장)
+    owns_history = 'history' not in settings
+    if owns_history:
+        try:
+            settings['history'] = HistoryStore.from_settings(settings)
+        except Exception as e:
+            logger.warning("기록 저장소를 열지 못했습니다: %s", e)
+            settings['history'] = None
+    
+    # 예매 시작 시각 (settings['start_at'], 비우면 바로 시작)
+    # start_lead초 전에 로그인과 조회 폼 입력을 마치고, 서버 시각에 맞춰 첫 조회를 보냄
+    start_at = parse_start_time(settings.get('start_at'))
+    if start_at is not None and start_at <= time.time():
+        log("예매 시작 시각이 이미 지나 바로 시작합니다.")
+        start_at = None
+    
     try:
-        # 1. 로그인 페이지로 이동
-        log("로그인 페이지로 이동 중...")
-        page.goto("https://etk.srail.kr/cmc/01/selectLoginForm.do?pageId=TK0701000000")
-        time.sleep(0.5)
-        
-        # 2. 로그인 정보 입력
-        member_id = login_info['id']
-        member_pw = login_info['password']
-        
-        log("로그인 시도 중...")
-        id_input = page.locator("#srchDvNm01")
-        id_input.fill("")
-        id_input.fill(member_id)
-        
-        pw_input = page.locator("#hmpgPwdCphd01")
-        pw_input.fill("")
-        pw_input.fill(member_pw)
+        if start_at is not None:
+            lead = float(settings.get('start_lead') or DEFAULT_START_LEAD)
+            log("예매 시작 대기: %s (%d초 전에 로그인)",
+                datetime.fromtimestamp(start_at).strftime('%Y-%m-%d %H:%M:%S'), lead)
+            delay = start_at - lead - time.time()
+            stop_event = settings.get('stop_event')
+            if delay > 0:
+                if stop_event is not None:
+                    if stop_event.wait(delay):
+                        log("중단 요청으로 대기를 종료합니다.")
+                        return False
+                else:
+                    time.sleep(delay)
         
-        # 3. 로그인 버튼 클릭 (첫 번째 활성화된 버튼 선택)
-        # 더 명확한 선택자 사용 - nth(0)로 첫 번째 요소 선택
-        submit_button = page.locator("input.submit.btn_pastel2.loginSubmit[type='submit']").nth(0)
-        submit_button.click()
+        # 1. 저장된 세션이 유효하면 바로 조회 페이지에서 시작
+        resumed = False
+        if settings.get('reuse_session', True):
+            tracer.begin('resume_session')
+            resumed = resume_session(page, base_url, login_info, session_file, log)
+            tracer.end('resume_session', 'resumed' if resumed else 'login_required')
         
-        # 4. 로그인 성공 확인
-        try:
-            page.wait_for_url("https://etk.srail.kr/main.do", timeout=10000)
-            log("로그인 성공!")
+        if not resumed:
+            # 2. 로그인 후 세션 저장
+            # 중단 요청이나 예외로 빠져나가도 구간은 닫아서 기록
+            tracer.begin('login')
+            outcome = 'error'
+            try:
+                check_stop(settings)
+                logged_in = login(page, base_url, login_info, log, settings.get('stop_event'))
+                outcome = 'ok' if logged_in else 'failed'
+            except StopRequested:
+                outcome = 'stopped'
+                raise
+            finally:
+                tracer.end('login', outcome)
+            if not logged_in:
+                return False
+            try:
+                save_session_state(context, login_info['id'], session_file)
+            except Exception as e:
+                log("세션 저장 실패: %s", e)
             
-            # 5. 일반승차권 조회 페이지로 이동
+            # 3. 일반승차권 조회 페이지로 이동
             log("일반승차권 조회 페이지로 이동 중...")
-            page.goto("https://etk.srail.kr/hpg/hra/01/selectScheduleList.do?pageId=TK0101010000")
-            time.sleep(0.5)
-            
-            # 6. 출발역 입력
-            dep_stn = train_info['departure']
-            log(f"출발역 입력 시도: {dep_stn}")
-            dep_input = page.locator("xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[1]/div/div/div[1]/input")
-            dep_input.fill("")
-            dep_input.fill(dep_stn)
-            log("출발역 입력 완료")
-            
-            time.sleep(0.3)
-            
-            # 7. 도착역 입력
-            arr_stn = train_info['arrival']
-            log(f"도착역 입력 시도: {arr_stn}")
-            arr_input = page.locator("xpath=/html/body/div[1]/div[4]/div/div[2]/form/fieldset/div[1]/div/div/div[2]/input")
-            arr_input.fill("")
-            arr_input.fill(arr_stn)
-            log("도착역 입력 완료")
-            
-            time.sleep(0.3)
-            
-            # 8. 날짜 선택
-            date = train_info['date']
-            log(f"날짜 선택 시도: {date}")
-            
-            date_select = page.locator("select[name='dptDt']")
-            date_select.select_option(label=date)
-            log("날짜 선택 완료")
-            
-            time.sleep(0.3)
-            
-            # 9. 시간 선택
-            target_time = train_info['target_time']
-            log(f"시간 선택 시도: {target_time}시")
-            
-            time_select = page.locator("select[name='dptTm']")
-            time_select.select_option(value=f"{target_time}0000")
-            log("시간 선택 완료")
-            
-            time.sleep(0.3)
-            
-            # 10. 조회 및 예약 시도
-            return search_and_reserve(page, login_info, train_info, settings, personal_info, progress_signal)
-            
-        except PlaywrightTimeoutError:
-            log("로그인 실패: 아이디나 비밀번호를 확인해주세요.")
-            return False
+            with tracer.span('open_schedule'):
+                open_schedule_page(page, base_url)
+        
+        # 4. 출발역/도착역/날짜/시간 입력 (예매 시작 전이라 출발일이 아직 없으면 시작 후 입력)
+        check_stop(settings)
+        deferred_fill = start_at is not None and not has_date_option(page, train_info['date'])
+        if deferred_fill:
+            log("출발일 %s은(는) 아직 열리지 않아 예매 시작 후 입력합니다.", train_info['date'])
+        else:
+            with tracer.span('fill_form'):
+                fill_search_form(page, train_info, log)
+        
+        # 5. 조회 및 예약 시도 (예매 시작 시각이 있으면 조회 준비를 마친 뒤 첫 조회 직전까지 대기)
+        check_stop(settings)
+        return search_and_reserve(page, login_info, train_info, settings, personal_info,
+                                  start_at=start_at, refill_form=deferred_fill)
             
+    except StopRequested:
+        log("중단 요청으로 종료합니다.")
+        return False
     except Exception as e:
-        log(f"오류 발생: {str(e)}")
+        log("오류 발생: %s", e)
         import traceback
-        log(f"상세 오류 정보:\n{traceback.format_exc()}")
+        log("상세 오류 정보:\n%s", traceback.format_exc())
         return False
+    finally:
+        if owns_tracer:
+            settings.pop('tracer').close()
+        if owns_history:
+            history = settings.pop('history')
+            if history:
+                history.close()
+        if owns_logger:
+            close_run_logger(settings)
 
 
 def main():
@@ -0,0 +1,219 @@
+import importlib.util
+import os
+import platform
+from functools import lru_cache
+
+from PyQt6.QtGui import QColor, QPalette
+
+# 앱 전체 스타일 (위젯마다 setStyleSheet를 부르지 않고 QApplication에 한 번만 적용)
+# 개별 위젯은 objectName(#이름) 또는 동적 속성([role=...], [state=...])으로 구분한다.
+APP_STYLES = """
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #3c3c3c;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QLineEdit {
+    padding: 8px;
+    border: 1px solid #3c3c3c;
+    border-radius: 4px;
+    font-size: 14px;
+}
+QLineEdit:focus {
+    border: 1px solid #4CAF50;
+}
+QComboBox {
+    padding: 8px;
+    border: 1px solid #3c3c3c;
+    border-radius: 4px;
+    font-size: 14px;
+}
+QComboBox:focus {
+    border: 1px solid #4CAF50;
+}
+QComboBox::drop-down {
+    border: none;
+}
+QTabWidget::pane {
+    border: 1px solid #3c3c3c;
+    background-color: #2b2b2b;
+    border-radius: 5px;
+}
+QTabBar::tab {
+    padding: 6px 16px;
+    margin-right: 3px;
+}
+QTabBar::tab:selected {
+    background-color: #3c3c3c;
+    border-bottom: 2px solid #4CAF50;
+}
+QProgressBar {
+    border: 1px solid #3c3c3c;
+    border-radius: 5px;
+    text-align: center;
+    height: 22px;
+    background-color: #1e1e1e;
+}
+QProgressBar::chunk {
+    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+        stop: 0 #3d8b40, stop: 1 #4CAF50);
+    border-radius: 3px;
+}
+QLabel#titleLabel {
+    font-size: 18px;
+    font-weight: bold;
+    color: #4CAF50;
+}
+QLabel#statusLabel {
+    font-size: 14px;
+    padding: 5px 10px;
+    background-color: #2b2b2b;
+    border-radius: 10px;
+}
+QLabel#statusLabel[state="running"], QLabel#statusLabel[state="done"] {
+    background-color: #2b4c2b;
+    color: #4CAF50;
+}
+QLabel#statusLabel[state="failed"] {
+    background-color: #4c2b2b;
+    color: #f44336;
+}
+QLabel#statusLabel[state="stopped"] {
+    background-color: #3c3c3c;
+    color: #999999;
+}
+QLabel#versionLabel {
+    color: #666666;
+    font-size: 11px;
+}
+QLabel[role="help"] {
+    color: #888888;
+    font-size: 11px;
+    font-weight: normal;
+}
+QLabel#infoText {
+    font-size: 12px;
+    font-weight: normal;
+    color: #e0e0e0;
+    padding: 10px;
+    background-color: #1e1e1e;
+    border-radius: 3px;
+}
+QPlainTextEdit#logView {
+    border: 1px solid #3c3c3c;
+    border-radius: 5px;
+    padding: 8px;
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+    font-size: 11px;
+    background-color: #1e1e1e;
+    color: #e0e0e0;
+}
+QPushButton#startButton, QPushButton#stopButton {
+    color: white;
+    border: none;
+    padding: 10px 25px;
+    font-size: 15px;
+    font-weight: bold;
+    border-radius: 5px;
+    min-width: 120px;
+}
+QPushButton#startButton {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 #4CAF50, stop: 1 #45a049);
+}
+QPushButton#startButton:hover {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 #45a049, stop: 1 #3d8b40);
+}
+QPushButton#startButton:pressed {
+    background: #3d8b40;
+}
+QPushButton#startButton:disabled {
+    background: #555555;
+    color: #999999;
+}
+QPushButton#stopButton {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 #f44336, stop: 1 #da190b);
+}
+QPushButton#stopButton:hover {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 #da190b, stop: 1 #c41e08);
+}
+QPushButton#stopButton:pressed {
+    background: #c41e08;
+}
+QPushButton[role="secondary"] {
+    padding: 10px 20px;
+    border: 1px solid #3c3c3c;
+    border-radius: 4px;
+    font-size: 14px;
+}
+QPushButton[role="secondary"]:hover {
+    background-color: #3c3c3c;
+}
+"""
+
+# qdarkstyle 다크 팔레트 값 (qdarkstyle.dark.palette.DarkPalette)
+LINK_COLOR = "#1A72BB"
+MAC_DOCK_TITLE_COLOR = "#455364"
+
+def _read_qdarkstyle_qss():
+    """qdarkstyle의 QSS를 패키지 파일에서 바로 읽음 (qtpy/리소스 모듈 로딩을 건너뜀)
+
+    리소스 경로(:/qss_icons/dark/rc/)는 패키지 안의 실제 이미지 경로로 바꾼다.
+    파일이 없으면(예: 데이터 파일 없이 빌드된 실행 파일) None.
+    """
+    spec = importlib.util.find_spec("qdarkstyle")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    package_dir = list(spec.submodule_search_locations)[0]
+    qss_path = os.path.join(package_dir, "dark", "darkstyle.qss")
+    rc_dir = os.path.join(package_dir, "dark", "rc")
+    if not os.path.exists(qss_path) or not os.path.isdir(rc_dir):
+        return None
+    with open(qss_path, "r", encoding="utf-8") as f:
+        qss = f.read()
+    qss = qss.replace(":/qss_icons/dark/rc/", rc_dir.replace(os.sep, "/") + "/")
+    if platform.system().lower() == 'darwin':
+        qss += """
+        QDockWidget::title {
+            background-color: %s;
+            text-align: center;
+            height: 12px;
+        }
+        QTabBar::close-button {
+            padding: 2px;
+        }
+        """ % MAC_DOCK_TITLE_COLOR
+    return qss
+
+@lru_cache(maxsize=1)
+def build_stylesheet():
+    """다크 테마 + 앱 스타일을 합친 스타일시트 (프로세스당 한 번만 만듦)"""
+    base = _read_qdarkstyle_qss()
+    if base is None:
+        import qdarkstyle
+        base = qdarkstyle.load_stylesheet_pyqt6()
+    return base + APP_STYLES
+
+def apply_stylesheet(app):
+    """위젯을 만들기 전에 한 번 호출 (이후 위젯은 생성 시 한 번만 polish됨)"""
+    palette = app.palette()
+    palette.setColor(QPalette.ColorGroup.Normal, QPalette.ColorRole.Link, QColor(LINK_COLOR))
+    app.setPalette(palette)
+    app.setStyleSheet(build_stylesheet())
+
+def set_style_state(widget, state):
+    """[state=...] 선택자를 쓰는 위젯의 상태를 바꾸고 그 위젯만 다시 polish"""
+    widget.setProperty("state", state)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
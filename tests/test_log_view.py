@@ -0,0 +1,57 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+# 예약 가능한 열차가 없을 때 한 사이클 동안 진행 로그로 오는 메시지 (srt_automation / engines 순서대로)
+NO_TRAIN_CYCLE = (
+    "\n새로운 검색 시도...",
+    "조회하기 버튼 클릭 완료",
+    "조회 완료",
+    "예약 가능한 열차가 없습니다. 잠시 후 다시 시도합니다..."
+)
+
+@unittest.skipIf(QApplication is None, "PyQt6가 설치되어 있지 않음")
+class LogViewTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from log_view import LogView
+        self.view = LogView(flush_interval=0)
+
+    def feed(self, *messages):
+        for message in messages:
+            self.view.append(message)
+        self.view.flush()
+
+    def lines(self):
+        return self.view.toPlainText().split("\n")
+
+    def test_idle_cycles_collapse_into_one_counter(self):
+        for _ in range(5):
+            self.feed(*NO_TRAIN_CYCLE)
+        lines = self.lines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn("× 5", lines[0])
+
+    def test_other_message_ends_counter(self):
+        self.feed("🚀 예매를 시작합니다...")
+        for _ in range(3):
+            self.feed(*NO_TRAIN_CYCLE)
+        self.feed(*NO_TRAIN_CYCLE[:3], "\n예약 가능한 열차를 찾았습니다!")
+        lines = self.lines()
+        self.assertEqual(lines[0], "🚀 예매를 시작합니다...")
+        self.assertIn("× 3", lines[1])
+        # 끝나지 않은 사이클의 메시지는 그대로 보임
+        self.assertEqual([line for line in lines[2:] if line],
+                         ["새로운 검색 시도...", "조회하기 버튼 클릭 완료", "조회 완료", "예약 가능한 열차를 찾았습니다!"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+import schedule_parser
+from schedule_parser import parse_schedule_html
+from tools.mock_server import AVAILABLE_CELL, SOLD_OUT_CELL, load_fixture
+
+RESULTS = load_fixture("schedule_results.html")
+ROW = load_fixture("schedule_row.html")
+AVAILABLE = AVAILABLE_CELL.replace("$query", "trnNo=301").replace("$onclick", "")
+
+def row(number, dep_time="07:00", arr_time="09:30", special=SOLD_OUT_CELL, general=SOLD_OUT_CELL):
+    return ROW.substitute(train_type="SRT", number=number, departure="수서", arrival="부산",
+                          dep_time=dep_time, arr_time=arr_time, special=special,
+                          general=general, duration="2시간 30분")
+
+def results(*rows):
+    return RESULTS.substitute(rows="".join(rows))
+
+def backends():
+    return [name for name in schedule_parser.BACKENDS
+            if name != 'lxml' or schedule_parser.lxml_html is not None]
+
+class ParseScheduleTest(unittest.TestCase):
+    def parse_all(self, html):
+        """모든 백엔드 결과가 같은지 확인하고 그 결과를 돌려줌"""
+        parsed = {name: parse_schedule_html(html, backend=name) for name in backends()}
+        expected = parsed['stdlib']
+        for name, records in parsed.items():
+            self.assertEqual(records, expected, f"{name} 결과가 stdlib와 다름")
+        return expected
+
+    def test_fixture_rows(self):
+        records = self.parse_all(results(
+            row("301", general=AVAILABLE),
+            row("303", "07:30", "10:05", special=AVAILABLE),
+            row("305", "08:00", "10:40")
+        ))
+        self.assertEqual([(r.index, r.number) for r in records], [(0, '301'), (1, '303'), (2, '305')])
+        first = records[0]
+        self.assertEqual(first.train_type, "SRT")
+        self.assertEqual((first.dep_time, first.arr_time), ("07:00", "09:30"))
+        self.assertEqual((first.dep_minutes, first.arr_minutes), (420, 570))
+        self.assertEqual((first.special, first.general), ('sold_out', 'available'))
+        self.assertEqual((records[1].special, records[1].general), ('available', 'sold_out'))
+        self.assertEqual(first.cols, 9)
+
+    def test_no_table(self):
+        self.assertEqual(self.parse_all("<div>조회 결과가 없습니다.</div>"), [])
+        self.assertEqual(self.parse_all(results()), [])
+
+    def test_thead_rows_of_later_tables_are_not_counted(self):
+        # 두 번째 표의 thead 행이 첫 tbody와 마지막 tbody 사이에 들어감
+        records = self.parse_all(results(row("301")) + results(row("303")))
+        self.assertEqual([(r.index, r.number) for r in records], [(0, '301'), (1, '303')])
+
+    def test_rows_without_cells_keep_dom_index(self):
+        # td 없는 행은 결과에서 빠지지만 tbody tr 번호(클릭할 행)는 그대로 셈
+        records = self.parse_all(results(row("301"), "<tr><th>안내</th></tr>", row("303")))
+        self.assertEqual([(r.index, r.number) for r in records], [(0, '301'), (2, '303')])
+
+    def test_snapshot_matches_parser(self):
+        html = results(row("301", general=AVAILABLE), "<tr></tr>", row("303"))
+        snapshot = [
+            {'index': r.index, 'cols': r.cols, 'type': r.train_type, 'number': r.number,
+             'dep_time': r.dep_time, 'arr_time': r.arr_time, 'special': r.special, 'general': r.general}
+            for r in parse_schedule_html(html, backend='stdlib')
+        ]
+        snapshot.insert(1, {'index': 1, 'cols': 0, 'type': '', 'number': '', 'dep_time': None,
+                            'arr_time': None, 'special': 'none', 'general': 'none'})
+        self.assertEqual(schedule_parser.parse_snapshot(snapshot), self.parse_all(html))
+
+if __name__ == "__main__":
+    unittest.main()
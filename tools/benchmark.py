@@ -0,0 +1,174 @@
+"""조회 -> 예약 -> 확인 -> 결제창 구간별 지연 시간 벤치마크
+
+로컬 목업 서버(tools/mock_server.py)를 띄우고 start_reservation 전체 흐름을
+N번 반복 실행하면서 search_and_reserve가 남기는 구간 기록(settings['phase_hook'])을
+모아 구간별 백분위수를 출력한다.
+
+사용 예:
+    python -m tools.benchmark -n 20
+    python -m tools.benchmark -n 50 --available-after 3 --search-delay 0.05 --json bench.json
+"""
+import argparse
+import json
+import time
+from datetime import date
+
+from playwright.sync_api import sync_playwright
+
+from srt_automation import LAUNCH_MODES, get_launch_mode, start_reservation
+from tools.mock_server import WEEKDAYS, MockSRTServer
+from tools.stats import PERCENTILES, percentile
+
+# (구간 이름, 시작 기록, 종료 기록)
+PHASES = [
+    ('search_click', 'cycle_start', 'search_click'),
+    ('results_ready', 'search_click', 'results_ready'),
+    ('row_scan', 'results_ready', 'row_scan'),
+    ('reserve_click', 'row_scan', 'reserve_click'),
+    ('confirm_loaded', 'reserve_click', 'confirm_loaded'),
+    ('payment_handoff', 'confirm_loaded', 'payment_handoff'),
+    ('total', 'cycle_start', 'payment_handoff')
+]
+
+class PhaseRecorder:
+    """phase_hook으로 넘겨서 사이클별 구간 기록을 모은다"""
+
+    def __init__(self):
+        self.cycles = []
+
+    def __call__(self, phase, timestamp):
+        if phase == 'cycle_start' or not self.cycles:
+            self.cycles.append({})
+        self.cycles[-1][phase] = timestamp
+
+    def completed_cycle(self):
+        """결제창까지 도달한 마지막 사이클"""
+        for cycle in reversed(self.cycles):
+            if 'payment_handoff' in cycle:
+                return cycle
+        return None
+
+def summarize(samples):
+    """구간별 ms 단위 백분위수"""
+    summary = {}
+    for name, _, _ in PHASES:
+        values = samples.get(name, [])
+        if not values:
+            continue
+        summary[name] = {f"p{pct}": percentile(values, pct) * 1000 for pct in PERCENTILES}
+        summary[name]['max'] = max(values) * 1000
+        summary[name]['count'] = len(values)
+    return summary
+
+def print_summary(summary, iterations, failures, cycles):
+    print(f"\n반복 {iterations}회 (실패 {failures}회), 평균 조회 사이클 {cycles:.1f}회")
+    header = f"{'phase':<16}" + "".join(f"{f'p{pct}':>10}" for pct in PERCENTILES) + f"{'max':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, _, _ in PHASES:
+        if name not in summary:
+            continue
+        row = summary[name]
+        print(f"{name:<16}" + "".join(f"{row[f'p{pct}']:>10.1f}" for pct in PERCENTILES) + f"{row['max']:>10.1f}")
+    print("(단위: ms)")
+
+def run(args):
+    samples = {name: [] for name, _, _ in PHASES}
+    failures = 0
+    cycle_counts = []
+
+    login_info = {'id': '1234567890', 'password': 'benchmark'}
+    personal_info = {'phone': '01012345678', 'birth': '990101'}
+
+    with MockSRTServer(
+        available=[f"{args.train}:{args.seat}"],
+        available_after=args.available_after,
+        search_delay=args.search_delay,
+        queue_delay=args.queue_delay
+    ) as server, sync_playwright() as playwright:
+        mode = get_launch_mode(args.mode)
+        browser = playwright.chromium.launch(**mode['launch'])
+        train = server.find_train(args.train)
+        train_info = {
+            'departure': '수서',
+            'arrival': '부산',
+            'date': args.date,
+            'target_time': f"{int(train['dep_time'][:2]) // 2 * 2:02d}",
+            'time_tolerance': '180',
+            'seat_types': {
+                'special': args.seat == 'special',
+                'general': args.seat == 'general'
+            }
+        }
+
+        for i in range(args.iterations):
+            server.reset()
+            recorder = PhaseRecorder()
+            settings = {
+                'refresh_interval': str(args.refresh_interval),
+                'base_url': server.base_url,
+                'launch_mode': args.mode,
+                'reuse_session': False,
+                'engine': args.engine,
+                'trace_file': args.trace or "",
+                'history_file': "",
+                'phase_hook': recorder
+            }
+            context = browser.new_context(viewport=mode['viewport'], ignore_https_errors=True)
+            page = context.new_page()
+            started = time.perf_counter()
+            try:
+                success = start_reservation(playwright, browser, context, page, login_info,
+                                            train_info, personal_info, settings)
+            finally:
+                context.close()
+            elapsed = time.perf_counter() - started
+
+            cycle = recorder.completed_cycle()
+            if not success or cycle is None:
+                failures += 1
+                print(f"[{i + 1}/{args.iterations}] 실패 ({elapsed:.2f}s)")
+                continue
+            for name, start, end in PHASES:
+                if start in cycle and end in cycle:
+                    samples[name].append(cycle[end] - cycle[start])
+            cycle_counts.append(len(recorder.cycles))
+            print(f"[{i + 1}/{args.iterations}] 결제창까지 {(cycle['payment_handoff'] - cycle['cycle_start']) * 1000:.1f}ms "
+                  f"(조회 {len(recorder.cycles)}회, 전체 {elapsed:.2f}s)")
+
+        browser.close()
+
+    summary = summarize(samples)
+    average_cycles = sum(cycle_counts) / len(cycle_counts) if cycle_counts else 0
+    print_summary(summary, args.iterations, failures, average_cycles)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                'iterations': args.iterations,
+                'failures': failures,
+                'average_cycles': average_cycles,
+                'phases_ms': summary,
+                'samples_ms': {name: [v * 1000 for v in values] for name, values in samples.items()}
+            }, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+
+def main():
+    today = date.today()
+    parser = argparse.ArgumentParser(description="SRT Hunter 예매 흐름 지연 시간 벤치마크")
+    parser.add_argument("-n", "--iterations", type=int, default=10)
+    parser.add_argument("--train", default="331", help="예약 가능하게 만들 열차번호")
+    parser.add_argument("--seat", choices=['general', 'special'], default='general')
+    parser.add_argument("--available-after", type=int, default=0, help="n번째 조회부터 예약 가능")
+    parser.add_argument("--search-delay", type=float, default=0.0, help="목업 서버 조회 응답 지연 (초)")
+    parser.add_argument("--queue-delay", type=float, default=0.0, help="목업 서버 예약 대기열 지연 (초)")
+    parser.add_argument("--refresh-interval", type=float, default=0.05)
+    parser.add_argument("--date", default=f"{today.strftime('%Y/%m/%d')}({WEEKDAYS[today.weekday()]})")
+    parser.add_argument("--engine", choices=['dom', 'http'], default="dom", help="조회 엔진")
+    parser.add_argument("--mode", choices=list(LAUNCH_MODES), default="headless", help="브라우저 실행 모드")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--trace", help="구간 기록(JSONL)을 남길 파일")
+    run(parser.parse_args())
+
+if __name__ == "__main__":
+    main()
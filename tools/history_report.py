@@ -0,0 +1,54 @@
+"""좌석 변경 기록(history.sqlite3) 요약
+
+history.HistoryStore가 남긴 예약 가능/다시 매진 이벤트로 시간대별 취소표 풀림 횟수,
+조회 1시간당 풀린 횟수, 다시 매진되기까지 걸린 시간을 출력한다.
+조회하지 않은 시간대는 '-'로 표시해 0건과 구분한다.
+
+사용 예:
+    python -m tools.history_report
+    python -m tools.history_report history.sqlite3 --departure 수서 --arrival 부산 --days 14
+"""
+import argparse
+import time
+
+from history import HISTORY_FILE, hourly_summary, load_events, release_windows
+
+def print_summary(summary):
+    header = f"{'hour':<6}{'releases':>10}{'polled min':>12}{'per hour':>10}{'open s p50':>12}"
+    print(header)
+    print("-" * len(header))
+    for row in summary:
+        if not row['releases'] and not row['polled_minutes']:
+            continue
+        per_hour = f"{row['per_hour']:.2f}" if row['per_hour'] is not None else "-"
+        median_open = f"{row['median_open']:.1f}" if row['median_open'] is not None else "-"
+        print(f"{row['hour']:02d}:00 {row['releases']:>10}{row['polled_minutes']:>12.0f}{per_hour:>10}{median_open:>12}")
+
+def print_trains(events, limit):
+    """가장 자주 풀린 열차/좌석"""
+    counts = {}
+    for event, _ in release_windows(events):
+        key = (event['departure'], event['arrival'], event['travel_date'], event['train'], event['seat'])
+        counts[key] = counts.get(key, 0) + 1
+    if not counts:
+        return
+    print(f"\n자주 풀린 열차 (상위 {limit})")
+    for (departure, arrival, travel_date, train, seat), count in sorted(
+            counts.items(), key=lambda item: item[1], reverse=True)[:limit]:
+        print(f"  {travel_date} {departure}-{arrival} {train} {seat}: {count}회")
+
+def main():
+    parser = argparse.ArgumentParser(description="좌석 변경 기록 시간대별 요약")
+    parser.add_argument("path", nargs="?", default=HISTORY_FILE)
+    parser.add_argument("--departure", help="출발역")
+    parser.add_argument("--arrival", help="도착역")
+    parser.add_argument("--days", type=float, help="최근 N일만")
+    parser.add_argument("--top", type=int, default=10, help="자주 풀린 열차 표시 개수")
+    args = parser.parse_args()
+
+    since = time.time() - args.days * 86400 if args.days else None
+    print_summary(hourly_summary(args.path, args.departure, args.arrival, since))
+    print_trains(load_events(args.path, args.departure, args.arrival, since), args.top)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+"""SRT 사이트 로컬 목업 서버
+
+etk.srail.kr 대신 로그인, 일반승차권 조회(selectScheduleList.do), 예약확인
+(confirmReservationInfo), 카카오페이 결제창을 흉내 내는 HTTP 서버.
+페이지는 tools/fixtures의 HTML을 사용하며, locators.py에 등록된
+선택자(XPath 포함)가 그대로 동작하도록 구조를 맞춰 두었다.
+
+사용 예:
+    python -m tools.mock_server --port 8765 --available 331:general --available-after 20
+    SRT_HUNTER_BASE_URL=http://127.0.0.1:8765 python main.py
+"""
+import argparse
+import os
+import random
+import secrets
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+SESSION_COOKIE = "JSESSIONID"
+
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+SEAT_NAMES = {
+    'special': '특실',
+    'general': '일반실'
+}
+
+AVAILABLE_CELL = ('<a href="/hpg/hra/02/requestReservationInfo.do?$query" class="btn_small btn_burgundy_dark val_m wx90"$onclick>'
+                  '<span>예약하기</span></a>\n'
+                  '          <a href="javascript:void(0);" class="btn_small btn_midgray val_m wx90"><span>좌석선택</span></a>')
+SOLD_OUT_CELL = '<a href="javascript:void(0);" class="btn_small w80 btn_silver val_m"><span>매진</span></a>'
+
+COUPLED_TRAIN_MESSAGE = "SRT 2개 편성을 연결하여 운행하는 열차입니다."
+
+def default_trains():
+    """05:30부터 22:50까지 40분 간격의 SRT 열차 목록 (수서 -> 부산, 2시간 30분)"""
+    trains = []
+    start = datetime(2000, 1, 1, 5, 30)
+    for i in range(27):
+        dep = start + timedelta(minutes=40 * i)
+        arr = dep + timedelta(minutes=150)
+        trains.append({
+            'type': 'SRT',
+            'number': str(301 + i * 2),
+            'dep_time': dep.strftime("%H:%M"),
+            'arr_time': arr.strftime("%H:%M")
+        })
+    return trains
+
+def default_options():
+    return {
+        'trains': default_trains(),
+        # 예약 가능해질 좌석 목록: "열차번호:special|general"
+        'available': [],
+        # n번째 조회부터 예약 가능 (0이면 처음부터)
+        'available_after': 0,
+        # 예약 가능 상태가 유지되는 조회 횟수 (None이면 계속)
+        'available_for': None,
+        # 예약확인 페이지에서 "잔여석 없음"이 나올 확률
+        'race_lost_rate': 0.0,
+        # 조회 응답 지연 (초)
+        'search_delay': 0.0,
+        # 예약 요청 시 대기열 지연 (초)
+        'queue_delay': 0.0,
+        # 2개 편성 연결 알림창을 띄울 열차번호
+        'coupled_trains': [],
+        # 로그인 비밀번호 (None이면 아무 값이나 허용)
+        'password': None
+    }
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return Template(f.read())
+
+class MockSRTServer:
+    """백그라운드 스레드에서 도는 SRT 목업 서버"""
+
+    def __init__(self, host="127.0.0.1", port=0, **options):
+        self.options = default_options()
+        self.options.update(options)
+        self.templates = {
+            name: load_fixture(f"{name}.html")
+            for name in ('login', 'main', 'schedule', 'schedule_results', 'schedule_row',
+                         'confirm', 'kakaopay', 'payment_complete')
+        }
+        self.lock = threading.Lock()
+        self.sessions = set()
+        self.search_count = 0
+        self.reservations = 0
+        self.httpd = ThreadingHTTPServer((host, port), MockSRTHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.mock = self
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset(self, **options):
+        """조회 횟수와 세션을 초기화하고 필요하면 옵션을 바꾼다"""
+        with self.lock:
+            self.options.update(options)
+            self.sessions.clear()
+            self.search_count = 0
+            self.reservations = 0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def new_session(self):
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions.add(token)
+        return token
+
+    def next_search(self):
+        """조회 1회를 기록하고 이번 조회에서 예약 가능한 좌석 집합을 반환"""
+        with self.lock:
+            count = self.search_count
+            self.search_count += 1
+        opts = self.options
+        if count < opts['available_after']:
+            return set()
+        if opts['available_for'] is not None and count >= opts['available_after'] + opts['available_for']:
+            return set()
+        seats = set()
+        for spec in opts['available']:
+            number, _, seat = spec.partition(':')
+            seats.add((number, seat or 'general'))
+        return seats
+
+    def find_train(self, number):
+        for train in self.options['trains']:
+            if train['number'] == number:
+                return train
+        return None
+
+class MockSRTHandler(BaseHTTPRequestHandler):
+    server_version = "MockSRT/1.0"
+
+    @property
+    def mock(self):
+        return self.server.mock
+
+    def log_message(self, format, *args):
+        pass
+
+    # 요청 파싱 / 응답 헬퍼
+
+    def read_form(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        return {k: v[0] for k, v in parse_qs(body).items()}
+
+    def query(self):
+        return {k: v[0] for k, v in parse_qs(urlsplit(self.path).query).items()}
+
+    def session(self):
+        for part in (self.headers.get('Cookie') or "").split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == SESSION_COOKIE and value in self.mock.sessions:
+                return value
+        return None
+
+    def send_html(self, html, status=200, headers=None):
+        body = html.encode("utf-8")
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def redirect(self, location, headers=None):
+        self.send_response(302)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def render(self, name, **values):
+        return self.mock.templates[name].safe_substitute(**values)
+
+    # 라우팅
+
+    def do_GET(self):
+        route = urlsplit(self.path).path
+        handler = {
+            '/cmc/01/selectLoginForm.do': self.login_form,
+            '/main.do': self.main_page,
+            '/hpg/hra/01/selectScheduleList.do': self.schedule_page,
+            '/hpg/hra/02/requestReservationInfo.do': self.request_reservation,
+            '/hpg/hra/02/confirmReservationInfo.do': self.confirm_page,
+            '/ard/02/selectKakaoPayReady.do': self.kakaopay_page,
+            '/ard/02/selectKakaoPayResult.do': self.payment_complete,
+            '/cmc/01/selectLogout.do': self.logout
+        }.get(route)
+        if handler is None:
+            self.send_html("<html><body>Not Found</body></html>", status=404)
+            return
+        handler()
+
+    def do_POST(self):
+        route = urlsplit(self.path).path
+        if route == '/cmc/01/selectLoginInfo.do':
+            self.login(self.read_form())
+        elif route == '/hpg/hra/01/selectScheduleList.do':
+            self.schedule_page(self.read_form())
+        else:
+            self.send_html("<html><body>Not Found</body></html>", status=404)
+
+    # 페이지
+
+    def login_form(self, message=""):
+        self.send_html(self.render('login', message=message))
+
+    def login(self, form):
+        password = self.mock.options['password']
+        if not form.get('srchDvNm01') or (password is not None and form.get('hmpgPwdCphd01') != password):
+            self.login_form('<p class="error">아이디 또는 비밀번호가 일치하지 않습니다.</p>')
+            return
+        token = self.mock.new_session()
+        self.redirect('/main.do', {'Set-Cookie': f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+
+    def logout(self):
+        token = self.session()
+        if token:
+            with self.mock.lock:
+                self.mock.sessions.discard(token)
+        self.redirect('/cmc/01/selectLoginForm.do?pageId=TK0701000000')
+
+    def main_page(self):
+        if not self.session():
+            self.redirect('/cmc/01/selectLoginForm.do?pageId=TK0701000000')
+            return
+        self.send_html(self.render('main'))
+
+    def schedule_page(self, form=None):
+        if not self.session():
+            self.redirect('/cmc/01/selectLoginForm.do?pageId=TK0701000000')
+            return
+        form = form or {}
+        departure = form.get('dptRsStnCdNm', '수서')
+        arrival = form.get('arvRsStnCdNm', '부산')
+        results = ""
+        if form:
+            delay = self.mock.options['search_delay']
+            if delay:
+                time.sleep(delay)
+            results = self.render_results(departure, arrival, form, self.mock.next_search())
+        self.send_html(self.render(
+            'schedule',
+            departure=departure,
+            arrival=arrival,
+            date_options=self.date_options(form.get('dptDt')),
+            time_options=self.time_options(form.get('dptTm')),
+            results=results
+        ))
+
+    def render_results(self, departure, arrival, form, available):
+        opts = self.mock.options
+        target = form.get('dptTm', '000000')[:4]
+        target = f"{target[:2]}:{target[2:]}"
+        rows = []
+        for train in opts['trains']:
+            if train['dep_time'] < target:
+                continue
+            cells = {}
+            for seat in ('special', 'general'):
+                if (train['number'], seat) in available:
+                    query = urlencode({
+                        'trnNo': train['number'],
+                        'psrmClCd': seat,
+                        'dptRsStnCdNm': departure,
+                        'arvRsStnCdNm': arrival
+                    })
+                    onclick = ""
+                    if train['number'] in opts['coupled_trains']:
+                        onclick = f' onclick="alert(\'{COUPLED_TRAIN_MESSAGE}\');"'
+                    cells[seat] = Template(AVAILABLE_CELL).substitute(query=query.replace('&', '&amp;'), onclick=onclick)
+                else:
+                    cells[seat] = SOLD_OUT_CELL
+            dep = datetime.strptime(train['dep_time'], "%H:%M")
+            arr = datetime.strptime(train['arr_time'], "%H:%M")
+            minutes = int((arr - dep).total_seconds() // 60) % (24 * 60)
+            rows.append(self.render(
+                'schedule_row',
+                train_type=train['type'],
+                number=train['number'],
+                departure=departure,
+                arrival=arrival,
+                dep_time=train['dep_time'],
+                arr_time=train['arr_time'],
+                special=cells['special'],
+                general=cells['general'],
+                duration=f"{minutes // 60}시간 {minutes % 60}분"
+            ))
+        return self.render('schedule_results', rows="".join(rows))
+
+    def date_options(self, selected):
+        options = []
+        today = date.today()
+        for i in range(31):
+            day = today + timedelta(days=i)
+            value = day.strftime("%Y%m%d")
+            label = f"{day.strftime('%Y/%m/%d')}({WEEKDAYS[day.weekday()]})"
+            mark = ' selected="selected"' if value == selected else ""
+            options.append(f'<option value="{value}"{mark}>{label}</option>')
+        return "".join(options)
+
+    def time_options(self, selected):
+        options = []
+        for hour in range(0, 24, 2):
+            value = f"{hour:02d}0000"
+            mark = ' selected="selected"' if value == selected else ""
+            options.append(f'<option value="{value}"{mark}>{hour:02d}</option>')
+        return "".join(options)
+
+    def request_reservation(self):
+        if not self.session():
+            self.redirect('/cmc/01/selectLoginForm.do?pageId=TK0701000000')
+            return
+        opts = self.mock.options
+        if opts['queue_delay']:
+            time.sleep(opts['queue_delay'])
+        params = self.query()
+        params['result'] = 'lost' if random.random() < opts['race_lost_rate'] else 'ok'
+        self.redirect('/hpg/hra/02/confirmReservationInfo.do?' + urlencode(params))
+
+    def confirm_page(self):
+        if not self.session():
+            self.redirect('/cmc/01/selectLoginForm.do?pageId=TK0701000000')
+            return
+        params = self.query()
+        train = self.mock.find_train(params.get('trnNo', '')) or default_trains()[0]
+        notice = ""
+        if params.get('result') == 'lost':
+            notice = '<p class="alert">잔여석 없음 - 다른 고객이 먼저 예약하였습니다.</p>'
+        else:
+            with self.mock.lock:
+                self.mock.reservations += 1
+        onload = ""
+        if train['number'] in self.mock.options['coupled_trains']:
+            onload = f' onload="alert(\'{COUPLED_TRAIN_MESSAGE}\');"'
+        self.send_html(self.render(
+            'confirm',
+            onload=onload,
+            notice=notice,
+            number=train['number'],
+            departure=params.get('dptRsStnCdNm', '수서'),
+            arrival=params.get('arvRsStnCdNm', '부산'),
+            dep_time=train['dep_time'],
+            arr_time=train['arr_time'],
+            seat_name=SEAT_NAMES.get(params.get('psrmClCd'), '일반실')
+        ))
+
+    def kakaopay_page(self):
+        self.send_html(self.render('kakaopay'))
+
+    def payment_complete(self):
+        now = datetime.now()
+        self.send_html(self.render(
+            'payment_complete',
+            approval_no=f"{random.randint(0, 99999999):08d}",
+            approved_at=now.strftime("%Y.%m.%d %H:%M:%S")
+        ))
+
+def main():
+    parser = argparse.ArgumentParser(description="SRT 사이트 로컬 목업 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--available", action="append", default=[],
+                        help="예약 가능 좌석 (예: 331:general, 반복 지정 가능)")
+    parser.add_argument("--available-after", type=int, default=0,
+                        help="n번째 조회부터 예약 가능")
+    parser.add_argument("--available-for", type=int, default=None,
+                        help="예약 가능 상태가 유지되는 조회 횟수")
+    parser.add_argument("--race-lost-rate", type=float, default=0.0,
+                        help="예약확인 페이지에서 잔여석 없음이 나올 확률 (0~1)")
+    parser.add_argument("--search-delay", type=float, default=0.0, help="조회 응답 지연 (초)")
+    parser.add_argument("--queue-delay", type=float, default=0.0, help="예약 대기열 지연 (초)")
+    parser.add_argument("--coupled", action="append", default=[],
+                        help="2개 편성 연결 알림창을 띄울 열차번호")
+    parser.add_argument("--password", default=None, help="로그인 비밀번호 (기본: 아무 값이나 허용)")
+    args = parser.parse_args()
+
+    server = MockSRTServer(
+        args.host, args.port,
+        available=args.available,
+        available_after=args.available_after,
+        available_for=args.available_for,
+        race_lost_rate=args.race_lost_rate,
+        search_delay=args.search_delay,
+        queue_delay=args.queue_delay,
+        coupled_trains=args.coupled,
+        password=args.password
+    )
+    print(f"SRT 목업 서버 실행 중: {server.base_url}")
+    print(f"연결 방법: SRT_HUNTER_BASE_URL={server.base_url} python main.py")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
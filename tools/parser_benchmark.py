@@ -0,0 +1,65 @@
+"""조회 결과 파서(schedule_parser) 처리량 벤치마크
+
+저장해 둔 조회 결과 HTML 파일들(없으면 목업 서버가 그린 결과 페이지)을 백엔드별로
+반복 파싱해서 초당 처리 페이지 수를 출력한다. 브라우저는 필요 없다.
+
+사용 예:
+    python -m tools.parser_benchmark
+    python -m tools.parser_benchmark captured/*.html -n 2000
+"""
+import argparse
+import http.cookiejar
+import time
+import urllib.parse
+import urllib.request
+
+import schedule_parser
+from schedule_parser import parse_schedule_html
+from tools.mock_server import MockSRTServer
+
+def mock_page():
+    """목업 서버에 로그인해서 전체 시간대 조회 결과 HTML 한 장을 받아옴"""
+    with MockSRTServer(available=["331:general", "305:special"]) as mock:
+        opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+        login = urllib.parse.urlencode({'srchDvNm01': "bench", 'hmpgPwdCphd01': "bench"}).encode()
+        opener.open(mock.base_url + "/cmc/01/selectLoginInfo.do", data=login)
+        search = urllib.parse.urlencode({'dptTm': "000000"}).encode()
+        with opener.open(mock.base_url + "/hpg/hra/01/selectScheduleList.do", data=search) as response:
+            return response.read().decode("utf-8")
+
+def available_backends():
+    return [name for name in schedule_parser.BACKENDS
+            if name != 'lxml' or schedule_parser.lxml_html is not None]
+
+def run(args):
+    pages = []
+    for path in args.files:
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append(f.read())
+    if not pages:
+        pages.append(mock_page())
+
+    backends = available_backends()
+    expected = [parse_schedule_html(page, backend='stdlib') for page in pages]
+    for backend in backends:
+        if [parse_schedule_html(page, backend=backend) for page in pages] != expected:
+            print(f"[경고] {backend} 결과가 stdlib 결과와 다릅니다")
+
+    print(f"페이지 {len(pages)}개, 행 {sum(len(rows) for rows in expected)}개, {args.iterations}회 반복")
+    for backend in backends:
+        started = time.perf_counter()
+        for _ in range(args.iterations):
+            for page in pages:
+                parse_schedule_html(page, backend=backend)
+        elapsed = time.perf_counter() - started
+        count = args.iterations * len(pages)
+        print(f"{backend:<8}{count / elapsed:>10.0f} pages/s{elapsed / count * 1000:>10.3f} ms/page")
+
+def main():
+    parser = argparse.ArgumentParser(description="SRT Hunter 조회 결과 파서 벤치마크")
+    parser.add_argument("files", nargs="*", help="저장해 둔 조회 결과 HTML 파일")
+    parser.add_argument("-n", "--iterations", type=int, default=500)
+    run(parser.parse_args())
+
+if __name__ == "__main__":
+    main()
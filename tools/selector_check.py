@@ -0,0 +1,157 @@
+"""선택자 점검 (저장해 둔 페이지로 locators.py의 선택자를 미리 확인)
+
+페이지 HTML(기본: tools/fixtures, 또는 실제 사이트에서 저장한 파일)을 브라우저에 올리고
+locators.py에 등록된 이름마다 다음을 확인한다.
+    - 등록 순서상 처음 맞는 선택자가 정확히 한 개의 요소를 찾는지
+    - 첫 번째(기본) 선택자가 아니라 대체 선택자로 찾았는지
+    - 선택자들을 동시에 기다려 찾는 데(resolve와 같은 방식) 걸린 시간
+파일 이름이 login / schedule / confirm / kakaopay 로 시작하면 해당 화면의 선택자를 검사한다.
+찾지 못했거나 여러 개가 맞으면 종료 코드 1을 돌려주므로 배포 전 점검에 쓸 수 있다.
+
+사용 예:
+    python -m tools.selector_check
+    python -m tools.selector_check captured/confirm_1020.html captured/kakaopay.html --slow 20
+"""
+import argparse
+import os
+import sys
+import time
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
+
+from locators import LOCATORS, LocatorRegistry
+from tools.stats import percentile
+from tools.mock_server import FIXTURE_DIR, load_fixture
+
+# 화면(파일 이름 앞부분) -> 그 화면에서 찾는 locator 이름
+PAGE_LOCATORS = {
+    'login': ('login_id', 'login_password', 'login_submit'),
+    'schedule': ('departure_input', 'arrival_input', 'date_select', 'time_select', 'search_button'),
+    'confirm': ('payment_button', 'easy_payment_tab', 'kakao_pay', 'smartphone_ticket', 'final_payment_button'),
+    'kakaopay': ('kakao_talk_tab', 'kakao_phone', 'kakao_birth', 'kakao_request')
+}
+
+# 목업용 템플릿(tools/fixtures)을 채울 값
+FIXTURE_VALUES = {
+    'message': "",
+    'departure': "수서",
+    'arrival': "부산",
+    'date_options': '<option value="20261020">2026/10/20(화)</option>',
+    'time_options': '<option value="140000">14</option>',
+    'results': "",
+    'onload': "",
+    'notice': "",
+    'number': "331",
+    'dep_time': "14:00",
+    'arr_time': "16:30",
+    'seat_name': "일반실"
+}
+
+# 선택자 하나를 기다리는 최대 시간 (ms)
+RESOLVE_TIMEOUT = 2000
+
+def page_kind(path):
+    stem = os.path.basename(path).lower()
+    for kind in PAGE_LOCATORS:
+        if stem.startswith(kind):
+            return kind
+    return None
+
+def load_pages(paths):
+    """(파일, 화면 종류, HTML) 목록 (tools/fixtures의 템플릿은 예시 값으로 채움)"""
+    pages = []
+    for path in paths:
+        kind = page_kind(path)
+        if kind is None:
+            print(f"건너뜀: {path} (화면 종류를 알 수 없는 파일 이름)")
+            continue
+        if os.path.dirname(os.path.abspath(path)) == FIXTURE_DIR:
+            html = load_fixture(os.path.basename(path)).safe_substitute(FIXTURE_VALUES)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                html = f.read()
+        pages.append((path, kind, html))
+    return pages
+
+def check_locator(page, registry, name, iterations):
+    """처음 맞는 선택자, 일치 개수, 동시 대기로 찾는 시간(초 목록)"""
+    winner = None
+    matches = 0
+    for selector in registry.locators[name]:
+        matches = page.locator(selector).count()
+        if matches:
+            winner = selector
+            break
+
+    timings = []
+    if winner is not None:
+        for _ in range(iterations):
+            registry.winners.pop(name, None)
+            started = time.perf_counter()
+            try:
+                registry.resolve(page, name, state="attached", timeout=RESOLVE_TIMEOUT)
+            except PlaywrightTimeoutError:
+                break
+            timings.append(time.perf_counter() - started)
+    return winner, matches, timings
+
+def status_of(registry, name, winner, matches, timings, slow_ms):
+    if winner is None:
+        return "MISSING"
+    if matches > 1:
+        return "AMBIGUOUS"
+    if not timings:
+        return "TIMEOUT"
+    if winner != registry.locators[name][0]:
+        return "FALLBACK"
+    if percentile(timings, 50) * 1000 > slow_ms:
+        return "SLOW"
+    return "OK"
+
+def run(args):
+    paths = args.pages or [os.path.join(FIXTURE_DIR, f"{kind}.html") for kind in PAGE_LOCATORS]
+    pages = load_pages(paths)
+    if not pages:
+        print("검사할 페이지가 없습니다.")
+        return 1
+
+    registry = LocatorRegistry()
+    checked = set()
+    failures = 0
+    header = f"{'page':<20}{'locator':<22}{'status':<11}{'count':>6}{'p50 ms':>9}{'max ms':>9}  selector"
+    print(header)
+    print("-" * len(header))
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        page = browser.new_page()
+        # 외부 리소스는 불러오지 않음 (선택자만 확인)
+        page.route("**/*", lambda route: route.abort())
+        for path, kind, html in pages:
+            page.set_content(html, wait_until="domcontentloaded")
+            for name in PAGE_LOCATORS[kind]:
+                checked.add(name)
+                winner, matches, timings = check_locator(page, registry, name, args.iterations)
+                status = status_of(registry, name, winner, matches, timings, args.slow)
+                if status in ("MISSING", "AMBIGUOUS", "TIMEOUT"):
+                    failures += 1
+                p50 = f"{percentile(timings, 50) * 1000:.1f}" if timings else "-"
+                worst = f"{max(timings) * 1000:.1f}" if timings else "-"
+                print(f"{os.path.basename(path):<20}{name:<22}{status:<11}{matches:>6}{p50:>9}{worst:>9}  {winner or '-'}")
+        browser.close()
+
+    unchecked = [name for name in LOCATORS if name not in checked]
+    if unchecked:
+        print(f"\n검사하지 않은 선택자: {', '.join(unchecked)}")
+    print(f"\n문제 {failures}건")
+    return 1 if failures else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="locators.py 선택자 점검 (저장된 페이지 사용)")
+    parser.add_argument("pages", nargs="*", help="페이지 HTML 파일 (기본: tools/fixtures의 화면별 페이지)")
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="선택자마다 찾기를 반복할 횟수")
+    parser.add_argument("--slow", type=float, default=50.0, help="이 시간(ms)을 넘으면 SLOW로 표시")
+    return run(parser.parse_args())
+
+if __name__ == "__main__":
+    sys.exit(main())
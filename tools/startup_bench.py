@@ -0,0 +1,164 @@
+"""GUI 시작 시간 벤치마크 (모듈 로딩 / 창 생성 / 첫 화면 그리기)
+
+매번 새 파이썬 프로세스를 띄워 다음 구간을 잰다.
+    import_qt    PyQt6.QtWidgets 로딩
+    import_app   gui_app 로딩 (gui_app이 불러오는 모듈 전체)
+    window       MainWindow() 생성 (스타일시트 적용, 위젯 구성)
+    first_paint  show()부터 창의 첫 Paint 이벤트까지
+    total        프로세스 시작부터 첫 Paint 이벤트까지 (인터프리터 시작 포함)
+버전별로 결과를 --json으로 남겨 두면 시작 시간이 늘었는지 비교할 수 있다.
+자식 프로세스는 빈 임시 폴더에서 실행해 config.json / login_info.txt 없이 기본 설정으로 창을 만들고,
+브라우저 미리 실행(BrowserPool)은 막아서 사용자 환경과 무관하게 같은 조건으로 잰다.
+
+사용 예:
+    python -m tools.startup_bench
+    python -m tools.startup_bench -n 20 --offscreen --json startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from tools.stats import PERCENTILES, percentile
+from version import VERSION
+
+PHASES = ('import_qt', 'import_app', 'window', 'first_paint', 'total')
+RESULT_PREFIX = "STARTUP_BENCH "
+LAUNCHED_ENV = "STARTUP_BENCH_LAUNCHED"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class IdleBrowserPool:
+    """브라우저를 띄우지 않는 BrowserPool 대역 (측정 구간에 Chromium 실행이 섞이지 않게 함)"""
+
+    def __init__(self, launch_mode='headed'):
+        self.launch_mode = launch_mode
+
+    def start(self, launch_mode=None):
+        pass
+
+    def shutdown(self, timeout=3):
+        pass
+
+def measure():
+    """자식 프로세스에서 실행: 구간별 초 단위 시간을 한 줄 JSON으로 출력"""
+    started = time.perf_counter()
+    modules = len(sys.modules)
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    imported_qt = time.perf_counter()
+
+    app = QApplication(sys.argv[:1])
+    import gui_app
+    imported_app = time.perf_counter()
+    gui_app.BrowserPool = IdleBrowserPool
+
+    window = gui_app.MainWindow()
+    created = time.perf_counter()
+    painted = {}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and 'at' not in painted:
+                painted['at'] = time.perf_counter()
+                painted['wall'] = time.time()
+                QTimer.singleShot(0, app.quit)
+            return False
+
+    watcher = PaintWatcher()
+    window.installEventFilter(watcher)
+    shown = time.perf_counter()
+    window.show()
+    # 그리기 이벤트가 오지 않는 환경이면 5초 뒤 포기
+    QTimer.singleShot(5000, app.quit)
+    app.exec()
+
+    if 'at' not in painted:
+        sys.exit(1)
+    result = {
+        'import_qt': imported_qt - started,
+        'import_app': imported_app - imported_qt,
+        'window': created - imported_app,
+        'first_paint': painted['at'] - shown,
+        'total': painted['wall'] - float(os.environ[LAUNCHED_ENV]),
+        'modules': len(sys.modules) - modules
+    }
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+    # 로그 스레드 등을 기다리지 않고 바로 종료
+    os._exit(0)
+
+def run_once(args):
+    env = dict(os.environ)
+    if args.offscreen:
+        env['QT_QPA_PLATFORM'] = "offscreen"
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOT, env.get('PYTHONPATH')]))
+    with tempfile.TemporaryDirectory() as workdir:
+        env[LAUNCHED_ENV] = repr(time.time())
+        completed = subprocess.run(
+            [sys.executable, "-m", "tools.startup_bench", "--child"],
+            cwd=workdir, env=env, capture_output=True, text=True, encoding="utf-8", timeout=60
+        )
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    return None
+
+def summarize(samples):
+    summary = {}
+    for name in PHASES:
+        values = [sample[name] for sample in samples]
+        summary[name] = {f"p{pct}": percentile(values, pct) * 1000 for pct in PERCENTILES}
+        summary[name]['max'] = max(values) * 1000
+    return summary
+
+def print_summary(summary, samples, failures):
+    print(f"\nv{VERSION} 시작 {len(samples)}회 (실패 {failures}회), "
+          f"gui_app까지 불러온 모듈 {samples[0]['modules']}개")
+    header = f"{'phase':<14}" + "".join(f"{f'p{pct}':>10}" for pct in PERCENTILES) + f"{'max':>10}"
+    print(header)
+    print("-" * len(header))
+    for name in PHASES:
+        row = summary[name]
+        print(f"{name:<14}" + "".join(f"{row[f'p{pct}']:>10.1f}" for pct in PERCENTILES) + f"{row['max']:>10.1f}")
+    print("(단위: ms)")
+
+def run(args):
+    samples = []
+    failures = 0
+    for i in range(args.iterations):
+        result = run_once(args)
+        if result is None:
+            failures += 1
+            print(f"[{i + 1}/{args.iterations}] 실패 (창이 그려지지 않음)")
+            continue
+        samples.append(result)
+        print(f"[{i + 1}/{args.iterations}] 첫 화면까지 {result['total'] * 1000:.1f}ms")
+
+    if not samples:
+        print("측정된 결과가 없습니다.")
+        return 1
+
+    summary = summarize(samples)
+    print_summary(summary, samples, failures)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'version': VERSION, 'iterations': args.iterations, 'failures': failures,
+                       'summary': summary, 'samples': samples}, f, ensure_ascii=False, indent=2)
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="SRT Hunter GUI 시작 시간 벤치마크")
+    parser.add_argument("-n", "--iterations", type=int, default=10)
+    parser.add_argument("--offscreen", action="store_true", help="화면 없이 측정 (QT_QPA_PLATFORM=offscreen)")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        measure()
+        return 1
+    return run(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""벤치마크/리포트 도구가 함께 쓰는 통계 함수 (표준 라이브러리만 사용)"""
+import math
+
+PERCENTILES = [50, 90, 99]
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
@@ -0,0 +1,74 @@
+"""구간 기록(traces.jsonl) 요약
+
+tracing.Tracer가 남긴 JSONL 파일(회전된 .1, .2 ... 포함 가능)을 읽어
+구간별 p50/p90/p99와 사이클 결과 분포를 버전별로 출력한다.
+여러 버전의 기록이 섞여 있으면 버전끼리 나란히 비교할 수 있다.
+
+사용 예:
+    python -m tools.trace_report traces.jsonl
+    python -m tools.trace_report traces.jsonl traces.jsonl.1 --version 2.1.0
+"""
+import argparse
+import json
+from collections import Counter, defaultdict
+
+from tools.stats import PERCENTILES, percentile
+
+def load_spans(paths):
+    spans = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    spans.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 회전 중 잘린 마지막 줄 등은 무시
+                    continue
+    return spans
+
+def summarize(spans):
+    """버전 -> 구간 -> ms 목록, 버전 -> 사이클 결과 개수"""
+    durations = defaultdict(lambda: defaultdict(list))
+    outcomes = defaultdict(Counter)
+    for span in spans:
+        version = span.get('version', '?')
+        durations[version][span['span']].append(span['ms'])
+        if span['span'] == 'cycle':
+            outcomes[version][span['outcome']] += 1
+    return durations, outcomes
+
+def print_report(durations, outcomes):
+    for version in sorted(durations):
+        runs = durations[version]
+        print(f"\n버전 {version}")
+        header = f"{'span':<18}{'count':>8}" + "".join(f"{f'p{pct}':>10}" for pct in PERCENTILES) + f"{'max':>10}"
+        print(header)
+        print("-" * len(header))
+        for name in sorted(runs, key=lambda name: -sum(runs[name])):
+            values = runs[name]
+            print(f"{name:<18}{len(values):>8}"
+                  + "".join(f"{percentile(values, pct):>10.1f}" for pct in PERCENTILES)
+                  + f"{max(values):>10.1f}")
+        if outcomes[version]:
+            print("사이클 결과: " + ", ".join(f"{k} {v}" for k, v in outcomes[version].most_common()))
+    print("(단위: ms)")
+
+def main():
+    parser = argparse.ArgumentParser(description="SRT Hunter 구간 기록 요약")
+    parser.add_argument("files", nargs="+", help="traces.jsonl 파일")
+    parser.add_argument("--version", help="이 버전의 기록만 요약")
+    args = parser.parse_args()
+
+    spans = load_spans(args.files)
+    if args.version:
+        spans = [span for span in spans if span.get('version') == args.version]
+    if not spans:
+        print("기록이 없습니다.")
+        return
+    print_report(*summarize(spans))
+
+if __name__ == "__main__":
+    main()
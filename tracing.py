@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from logger import get_logger
+from version import VERSION
+
+logger = get_logger("tracing")
+
+# 구간 기록 파일 (JSONL, 한 줄에 구간 하나)
+TRACE_FILE = "traces.jsonl"
+TRACE_MAX_BYTES = 5 * 1024 * 1024
+TRACE_BACKUPS = 3
+
+class Tracer:
+    """예매 흐름의 구간(span)별 시작/종료 시각과 결과를 JSONL로 기록
+
+    시각은 time.perf_counter() 값(단조 증가, 초)이고 같은 실행(run) 안에서만 비교할 수 있다.
+    조회 사이클마다 cycle 번호가 붙고, 사이클 자체도 'cycle' 구간으로 결과와 함께 남는다.
+    파일이 max_bytes를 넘으면 traces.jsonl.1, .2 ... 로 밀어낸다.
+    listeners에 등록한 함수는 구간이 끝날 때마다 기록(dict)을 받는다 (metrics.Metrics 등).
+    """
+
+    def __init__(self, path=TRACE_FILE, max_bytes=TRACE_MAX_BYTES, backups=TRACE_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.run_id = uuid.uuid4().hex[:12]
+        self.cycle = 0
+        self.listeners = []
+        self._open = {}
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings['trace_file']이 빈 문자열이면 기록하지 않음"""
+        path = settings.get('trace_file', TRACE_FILE)
+        return cls(path) if path else NullTracer()
+
+    def begin(self, name, **attrs):
+        self._open[name] = (time.perf_counter(), time.time(), attrs)
+
+    def end(self, name, outcome='ok', **attrs):
+        opened = self._open.pop(name, None)
+        if opened is None:
+            return
+        start, wall, begin_attrs = opened
+        end = time.perf_counter()
+        record = {
+            'run': self.run_id,
+            'version': VERSION,
+            'cycle': self.cycle,
+            'span': name,
+            'start': round(start, 6),
+            'end': round(end, 6),
+            'ms': round((end - start) * 1000, 3),
+            'wall': round(wall, 3),
+            'outcome': outcome
+        }
+        record.update(begin_attrs)
+        record.update(attrs)
+        for listener in self.listeners:
+            try:
+                listener(record)
+            except Exception as e:
+                logger.warning("구간 기록 처리 실패: %s", e)
+        self._write(record)
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """with 블록 하나를 구간으로 기록 (예외가 나면 outcome='error')"""
+        self.begin(name, **attrs)
+        try:
+            yield
+        except BaseException as e:
+            self.end(name, 'error', error=type(e).__name__)
+            raise
+        self.end(name)
+
+    def start_cycle(self):
+        self.cycle += 1
+        self.begin('cycle')
+
+    def end_cycle(self, outcome, error=None):
+        """사이클 종료, 닫히지 않은 구간은 같은 결과로 닫음"""
+        extra = {'error': type(error).__name__} if error is not None else {}
+        for name in [name for name in self._open if name != 'cycle']:
+            self.end(name, 'error' if error is not None else 'aborted', **extra)
+        self.end('cycle', outcome, **extra)
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._file:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            try:
+                if self._file is None:
+                    self._file = open(self.path, "a", encoding="utf-8")
+                if self.max_bytes and self._file.tell() + len(line.encode("utf-8")) > self.max_bytes:
+                    self._rotate()
+                self._file.write(line)
+            except OSError as e:
+                # 기록 실패로 예매 흐름을 멈추지 않음
+                logger.warning("구간 기록 실패: %s", e)
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+class NullTracer(Tracer):
+    """파일에 기록하지 않는 Tracer (trace_file이 비어 있을 때, listeners는 그대로 호출)"""
+
+    def __init__(self):
+        super().__init__(path=None)
+
+    def _write(self, record):
+        pass